@@ -1,23 +1,38 @@
-import re
 from typing import List, Dict, Union
 
-# Strong action verbs that recruiters like
-ACTION_VERBS = {
-    "built", "created", "designed", "developed", "engineered", "implemented",
-    "launched", "led", "migrated", "optimized", "reduced", "improved",
-    "automated", "architected", "delivered", "scaled", "streamlined",
-    "initiated", "enhanced"
-}
+from .heuristics import HEADINGS, scan
+from .heuristics import ACTION_VERBS  # noqa: F401 -- re-exported, it used to live here
 
-# Standard resume headings we expect
-HEADINGS = {
-    "summary", "experience", "work experience", "projects", "education",
-    "skills", "certifications"
-}
+
+def count_signals(resume_text) -> dict:
+    """
+    The counters the hints are based on (see heuristics.RULES). Counts of
+    separate pieces of a text can be combined with merge_signals().
+    A ParsedDocument returns the counters it already holds.
+    """
+    if not isinstance(resume_text, str):
+        return resume_text.signals
+    found = scan(resume_text)
+    return {k: found[k] for k in ("numbers", "verbs", "headings", "words")}
+
+
+def merge_signals(parts: List[dict]) -> dict:
+    """
+    Combine count_signals() of consecutive pieces of one text. Only exact
+    when no number, verb or word straddles a cut, and a heading can
+    ("work | experience"), so callers also check the text around each cut.
+    """
+    merged = {"numbers": 0, "verbs": set(), "headings": set(), "words": 0}
+    for p in parts:
+        merged["numbers"] += p["numbers"]
+        merged["verbs"] |= p["verbs"]
+        merged["headings"] |= p["headings"]
+        merged["words"] += p["words"]
+    return merged
 
 
 def quality_hints(
-    resume_text: str,
+    resume_text,
     sections: dict,
     missing_skills: Union[List[str], set]
 ) -> List[Dict[str, str]]:
@@ -25,30 +40,37 @@ def quality_hints(
     Generate heuristic suggestions for improving a resume.
     Returns categorized tips instead of plain strings.
     Categories: metrics, verbs, structure, length, skills, general
+    `resume_text` may be a string or a ParsedDocument.
     """
+    return hints_from_signals(count_signals(resume_text), missing_skills)
+
+
+def hints_from_signals(
+    signals: dict,
+    missing_skills: Union[List[str], set]
+) -> List[Dict[str, str]]:
+    """quality_hints() from precomputed count_signals()."""
     tips: List[Dict[str, str]] = []
 
     # ✅ Normalize missing_skills to list
     missing_skills = list(missing_skills) if missing_skills else []
 
     # --- Quantifiable metrics
-    numbers = re.findall(r"\b\d+(\.\d+)?%?\b", resume_text)
-    if len(numbers) < 3:
+    if signals["numbers"] < 3:
         tips.append({
             "category": "metrics",
             "message": "Add quantifiable metrics (e.g., 'reduced load time by 35%', 'handled 1M+ requests/day')."
         })
 
     # --- Action verbs
-    verbs_found = sum(1 for v in ACTION_VERBS if re.search(rf"\b{v}\b", resume_text))
-    if verbs_found < 5:
+    if len(signals["verbs"]) < 5:
         tips.append({
             "category": "verbs",
             "message": "Use more strong action verbs at the start of bullets (built, optimized, delivered, automated, scaled)."
         })
 
     # --- Section structure
-    missing_heads = [h for h in HEADINGS if h not in resume_text]
+    missing_heads = [h for h in HEADINGS if h not in signals["headings"]]
     if missing_heads:
         tips.append({
             "category": "structure",
@@ -56,7 +78,7 @@ def quality_hints(
         })
 
     # --- Length check (rough estimate)
-    words = len(resume_text.split())
+    words = signals["words"]
     if words < 250:
         tips.append({
             "category": "length",
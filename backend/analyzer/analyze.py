@@ -1,38 +1,38 @@
-from typing import List, Dict, Set
+from typing import Iterable, List, Dict, Set
+import logging
+import os
 import re
+import numpy as np
 from rapidfuzz import process, fuzz
-from sentence_transformers import SentenceTransformer, util
-import spacy
+from sentence_transformers import util
+
+from . import models
+from .heuristics import scan
+
+log = logging.getLogger(__name__)
+
+# extract_skill_candidates_batch(): spaCy worker processes and docs per
+# nlp.pipe batch, and threads for the rapidfuzz score matrix
+SKILL_NLP_PROCESSES = int(os.environ.get("SKILL_NLP_PROCESSES", "1"))
+SKILL_NLP_BATCH = int(os.environ.get("SKILL_NLP_BATCH", "32"))
+SKILL_MATCH_WORKERS = int(os.environ.get("SKILL_MATCH_WORKERS", "1"))
 
 # -------------------------------------------------------------------
-# Lazy-loading for heavy models (to prevent crashes at startup)
+# Heavy models come from the shared registry (one copy per process)
 # -------------------------------------------------------------------
-_nlp = None
-_embedder = None
-
 def get_nlp():
-    global _nlp
-    if _nlp is None:
-        print("[DEBUG] Loading spaCy model...")
-        try:
-            _nlp = spacy.load("en_core_web_sm")
-            print("[DEBUG] spaCy model loaded successfully")
-        except OSError:
-            print("[ERROR] spaCy model not found. Run: python -m spacy download en_core_web_sm")
-            raise
-    return _nlp
+    try:
+        return models.get_spacy()
+    except OSError:
+        log.error("spaCy model not found. Run: python -m spacy download en_core_web_sm")
+        raise
 
 def get_embedder():
-    global _embedder
-    if _embedder is None:
-        print("[DEBUG] Loading SentenceTransformer model...")
-        try:
-            _embedder = SentenceTransformer("all-MiniLM-L6-v2")
-            print("[DEBUG] SentenceTransformer model loaded successfully")
-        except Exception as e:
-            print(f"[ERROR] Failed to load SentenceTransformer: {e}")
-            raise
-    return _embedder
+    try:
+        return models.get_embedder()
+    except Exception as e:
+        log.error("Failed to load SentenceTransformer: %s", e)
+        raise
 
 # -------------------------------------------------------------------
 # Skills dictionary + aliases
@@ -94,77 +94,89 @@ def normalize_text(s: str) -> str:
     s = re.sub(r"\s+", " ", s).strip()
     return s
 
-def extract_skill_candidates(text: str, threshold: int = 92) -> Set[str]:
-    print("[DEBUG] extract_skill_candidates called")
-    text_norm = normalize_text(text)
-    print(f"[DEBUG] Normalized text length = {len(text_norm)}")
-
-    doc = get_nlp()(text_norm)
-    print("[DEBUG] spaCy doc processed")
-
+def doc_grams(doc) -> Set[str]:
+    """Unigrams and bigrams of the non-stop tokens, plus noun chunks."""
     grams = set()
     toks = [t.text for t in doc if not t.is_stop]
     grams.update(toks)
     grams.update([" ".join(toks[i:i + 2]) for i in range(len(toks) - 1)])
     grams.update([chunk.text for chunk in doc.noun_chunks])
+    grams.discard("")
+    return grams
+
+def match_grams(grams: Iterable[str], threshold: int = 92) -> Dict[str, str]:
+    """
+    Canonical skill for every gram whose best VOCAB match (first one on
+    ties, like process.extractOne) scores at least `threshold`. All grams
+    are scored in one process.cdist call.
+    """
+    grams = [g for g in grams if g]
+    if not grams:
+        return {}
+    scores = process.cdist(
+        grams, VOCAB, scorer=fuzz.token_set_ratio, score_cutoff=threshold,
+        dtype=np.float64, workers=SKILL_MATCH_WORKERS,
+    )
+    best = scores.argmax(axis=1)
+    top = scores[np.arange(len(grams)), best]
+    return {g: ALIAS_TO_CANON[VOCAB[j]] for g, j, s in zip(grams, best, top) if s >= threshold}
 
-    print(f"[DEBUG] Candidate grams generated = {len(grams)}")
-
-    found: Set[str] = set()
-    for g in grams:
-        if not g:
-            continue
-        match, score, _ = process.extractOne(g, VOCAB, scorer=fuzz.token_set_ratio)
-        if match and score >= threshold:
-            found.add(ALIAS_TO_CANON[match])
-
-    print(f"[DEBUG] Skills matched = {found}")
-    return found
+def extract_skill_candidates(text: str, threshold: int = 92) -> Set[str]:
+    log.debug("extract_skill_candidates called")
+    return extract_skill_candidates_batch([text], threshold, n_process=1)[0]
+
+def extract_skill_candidates_batch(
+    texts: Iterable[str],
+    threshold: int = 92,
+    n_process: int = None,
+    batch_size: int = None,
+) -> List[Set[str]]:
+    """
+    extract_skill_candidates() for many documents: one nlp.pipe over all
+    of them (across `n_process` worker processes) and one score matrix
+    for the distinct grams of the whole batch.
+    """
+    norms = [normalize_text(t) for t in texts]
+    log.debug("extract_skill_candidates_batch: %d documents", len(norms))
+
+    docs = get_nlp().pipe(
+        norms,
+        n_process=n_process or SKILL_NLP_PROCESSES,
+        batch_size=batch_size or SKILL_NLP_BATCH,
+    )
+    per_doc = [doc_grams(doc) for doc in docs]
+    distinct = set().union(*per_doc)
+    canon = match_grams(distinct, threshold)
+    log.debug("Grams = %d (%d distinct), matched = %d", sum(map(len, per_doc)), len(distinct), len(canon))
+    return [{canon[g] for g in grams if g in canon} for grams in per_doc]
 
 def semantic_similarity(a: str, b: str) -> float:
-    print("[DEBUG] semantic_similarity called")
+    log.debug("semantic_similarity called")
     if not a.strip() or not b.strip():
-        print("[DEBUG] One of the inputs is empty")
+        log.debug("One of the inputs is empty")
         return 0.0
     emb = get_embedder().encode([a, b], convert_to_tensor=True)
     sim = util.cos_sim(emb[0], emb[1]).item()
-    print(f"[DEBUG] Cosine similarity = {sim}")
+    log.debug("Cosine similarity = %s", sim)
     return max(0.0, min(1.0, sim)) * 100
 
 def quantify_issues(resume_text: str) -> Dict[str, int]:
-    print("[DEBUG] quantify_issues called")
-    txt = normalize_text(resume_text)
-
-    bullets = [b for b in re.split(r"\n[-•*]\s*", resume_text) if b.strip()]
-    with_numbers = sum(bool(re.search(r"\b\d+(\.\d+)?%?\b", b)) for b in bullets)
-
-    action_verbs = [
-        "built", "delivered", "optimized", "designed", "implemented", "led",
-        "launched", "reduced", "increased", "improved", "automated", "migrated",
-        "developed", "refactored", "deployed"
-    ]
-    verbs_found = sum(1 for v in action_verbs if re.search(rf"\b{re.escape(v)}\b", txt))
-    passive_hits = len(re.findall(r"\b(was|were|been|being|is|are|be)\s+\w+ed\b", txt))
-
-    sections_present = []
-    for sec in ["summary", "experience", "work experience", "projects", "education", "skills", "certifications"]:
-        if re.search(rf"\b{sec}\b", txt):
-            sections_present.append(sec)
-
+    log.debug("quantify_issues called")
+    found = scan(resume_text)
     result = {
-        "bullets_total": len(bullets),
-        "bullets_with_numbers": with_numbers,
-        "action_verb_hits": verbs_found,
-        "passive_hits": passive_hits,
-        "sections_ok": len(sections_present),
+        "bullets_total": found["bullets"],
+        "bullets_with_numbers": found["bullets_with_numbers"],
+        "action_verb_hits": len(found["bullet_verbs"]),
+        "passive_hits": found["passive"],
+        "sections_ok": len(found["headings"]),
     }
-    print(f"[DEBUG] quantify_issues result = {result}")
+    log.debug("quantify_issues result = %s", result)
     return result
 
 def build_suggestions(resume_text: str, jd_text: str,
                       missing: List[str], semantic: float, overlap: float,
                       issues: Dict[str, int]) -> List[str]:
-    print("[DEBUG] build_suggestions called")
+    log.debug("build_suggestions called")
     sug = []
     if missing:
         sug.append(f"Mirror the JD by adding these missing skills (where relevant): {', '.join(missing[:10])}.")
@@ -192,5 +204,5 @@ def build_suggestions(resume_text: str, jd_text: str,
     if not sug:
         sug.append("Looks solid! Consider a final proofread and tailor the top bullets for the JD.")
 
-    print(f"[DEBUG] build_suggestions result = {sug}")
+    log.debug("build_suggestions result = %s", sug)
     return sug
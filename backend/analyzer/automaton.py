@@ -0,0 +1,78 @@
+from array import array
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+
+class AhoCorasick:
+    """
+    Multi-pattern matcher: finds every occurrence of every pattern in one
+    linear pass over the text, independent of how many patterns there are.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        own: List[List[int]] = [[]]
+
+        for pattern in patterns:
+            if not pattern:
+                continue
+            state = 0
+            for ch in pattern:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    own.append([])
+                state = nxt
+            own[state].append(len(self.patterns))
+            self.patterns.append(pattern)
+
+        self._lengths = array("l", (len(p) for p in self.patterns))
+        self._build_links(own)
+
+    def _build_links(self, own: List[List[int]]) -> None:
+        # breadth-first so every fail target is finished before it is used.
+        # fail is a flat array and out only holds states that end a pattern,
+        # which keeps the compiled taxonomy artifact small and quick to load.
+        goto = self._goto
+        fail = array("l", bytes(len(goto) * array("l").itemsize))
+        out: Dict[int, Tuple[int, ...]] = {}
+        queue = deque()
+        for child in goto[0].values():
+            if own[child]:
+                out[child] = tuple(own[child])
+            queue.append(child)
+
+        while queue:
+            state = queue.popleft()
+            for ch, child in goto[state].items():
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[child] = goto[f].get(ch, 0)
+                matched = tuple(own[child]) + out.get(fail[child], ())
+                if matched:
+                    out[child] = matched
+                queue.append(child)
+        self._fail, self._out = fail, out
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """
+        Yield (start, end, pattern_index) for every occurrence, overlapping
+        ones included, in order of their end offset.
+        """
+        goto, fail, out, lengths = self._goto, self._fail, self._out, self._lengths
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if state in out:
+                end = i + 1
+                for idx in out[state]:
+                    yield end - lengths[idx], end, idx
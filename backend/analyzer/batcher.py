@@ -0,0 +1,136 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Callable, List
+
+import numpy as np
+
+from .metrics import Histogram, register
+
+FILL_BUCKETS = (0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 1.0)
+
+BATCH_FILL = Histogram(
+    "analyzer_embed_batch_fill_ratio",
+    "Texts per coalesced encode batch, as a fraction of the maximum batch size.",
+    "batcher",
+    buckets=FILL_BUCKETS,
+)
+QUEUE_SECONDS = Histogram(
+    "analyzer_embed_queue_seconds",
+    "Time an encode request waited before its batch started.",
+    "batcher",
+)
+register(BATCH_FILL)
+register(QUEUE_SECONDS)
+
+
+class EmbeddingBatcher:
+    """
+    Coalesces concurrent encode calls into shared batches.
+
+    Callers block in encode() while one background thread collects every
+    request that arrives within `window_ms` of the first one (or until
+    `max_batch` texts are waiting), encodes the distinct texts in one call
+    to encode_fn and hands each caller its own rows through a future.
+    A request larger than `max_batch` runs as a batch of its own.
+    """
+
+    def __init__(
+        self,
+        encode_fn: Callable[[List[str]], np.ndarray],
+        window_ms: float = 5.0,
+        max_batch: int = 64,
+        name: str = "default",
+    ):
+        self.encode_fn = encode_fn
+        self.window = max(0.0, window_ms) / 1000.0
+        self.max_batch = max(1, int(max_batch))
+        self.name = name
+        self._pending: "deque[tuple]" = deque()  # (texts, future, enqueued at)
+        self._cond = threading.Condition()
+        self._thread = None
+        self.batches = 0
+        self.requests = 0
+        self.texts = 0
+
+    def _start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=f"embed-batcher-{self.name}", daemon=True)
+            self._thread.start()
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        texts = list(texts)
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        fut: Future = Future()
+        with self._cond:
+            self._start()
+            self._pending.append((texts, fut, time.perf_counter()))
+            self._cond.notify()
+        return fut.result()
+
+    def _take_batch(self) -> list:
+        """Block until a batch is ready; returns its requests."""
+        with self._cond:
+            while not self._pending:
+                self._cond.wait()
+            deadline = self._pending[0][2] + self.window
+            while self._size() < self.max_batch:
+                left = deadline - time.perf_counter()
+                if left <= 0:
+                    break
+                self._cond.wait(left)
+
+            batch, size = [], 0
+            while self._pending:
+                n = len(self._pending[0][0])
+                if batch and size + n > self.max_batch:
+                    break
+                batch.append(self._pending.popleft())
+                size += n
+            return batch
+
+    def _size(self) -> int:
+        return sum(len(texts) for texts, _, _ in self._pending)
+
+    def _run(self) -> None:
+        while True:
+            batch = self._take_batch()
+            try:
+                self._serve(batch)
+            except Exception as e:
+                # fail this batch only; the thread goes on with the next one
+                for _, fut, _ in batch:
+                    if not fut.done():
+                        fut.set_exception(e)
+
+    def _serve(self, batch: list) -> None:
+        started = time.perf_counter()
+        for _, _, enqueued in batch:
+            QUEUE_SECONDS.observe(self.name, started - enqueued)
+
+        # concurrent cache misses often ask for the same text
+        unique = list(dict.fromkeys(t for texts, _, _ in batch for t in texts))
+        BATCH_FILL.observe(self.name, min(1.0, len(unique) / self.max_batch))
+        self.batches += 1
+        self.requests += len(batch)
+        self.texts += len(unique)
+        vecs = np.asarray(self.encode_fn(unique), dtype=np.float32)
+        if len(vecs) != len(unique):
+            raise ValueError(f"encode_fn returned {len(vecs)} rows for {len(unique)} texts")
+        row = {t: i for i, t in enumerate(unique)}
+        for texts, fut, _ in batch:
+            fut.set_result(vecs[[row[t] for t in texts]])
+
+    def stats(self) -> dict:
+        with self._cond:
+            queued = len(self._pending)
+        return {
+            "window_ms": self.window * 1000.0,
+            "max_batch": self.max_batch,
+            "batches": self.batches,
+            "requests": self.requests,
+            "texts": self.texts,
+            "queued": queued,
+        }
@@ -0,0 +1,263 @@
+"""
+Offline bulk analysis: score a directory (or manifest) of resumes against
+one or more job descriptions without going through the HTTP API.
+
+    cd backend && python -m analyzer.bulk --dir resumes/ --all-jobs --out scores.jsonl
+    python -m analyzer.bulk --manifest paths.txt --jd posting.txt --workers 8 --out scores.jsonl
+
+Each output line is an /analyze result plus "path" and "job" (the job id,
+the --jd file name, or null), or {"path", "error"} for a file that could
+not be read or whose worker process died on it. Files go to a process pool whose workers load the models
+and JD profiles once. Every finished file is recorded in a checkpoint
+(--checkpoint, default <out>.ckpt) after its lines are written, so
+rerunning the same command after an interruption skips finished files
+and drops any partial output. --fresh starts over.
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterator, List, Optional, Set, Tuple
+
+from . import extractor, models
+from .jobs import JobStore, build_profile
+from .pipeline import prepare_jd, prepare_resume, score_resume
+from .skills import get_taxonomy
+
+log = logging.getLogger(__name__)
+
+EXTENSIONS = (".pdf", ".docx", ".doc")
+MAX_FILE_BYTES = 8 * 1024 * 1024  # same limit as /analyze
+WORKER_DIED = "Worker process died while analyzing this file"
+
+_jobs: List[Tuple[Optional[str], dict]] = []  # per worker: (label, JD profile)
+
+
+def iter_dir(root: str) -> Iterator[str]:
+    """Resume files under root, in a stable order."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if name.lower().endswith(EXTENSIONS):
+                yield os.path.join(dirpath, name)
+
+
+def iter_manifest(path: str) -> Iterator[str]:
+    """One path per line ("-" reads stdin); blank lines and # comments are skipped."""
+    f = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                yield line
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def _init_worker(jobs: list, threads: int) -> None:
+    """Load models and finish the JD profiles once per worker process."""
+    global _jobs
+    # the pool already runs one file per CPU: each worker's PDFs use a single
+    # page worker (for the time budget), not PDF_WORKERS of them
+    extractor.PDF_PARALLEL_MIN_PAGES = 0
+    if threads:
+        import torch
+        torch.set_num_threads(threads)
+    get_taxonomy()
+    # stored jobs come with their embedding; --jd files are embedded here
+    _jobs = [
+        (label, profile if "embedding" in profile else build_profile(profile["raw"]))
+        for label, profile in jobs
+    ]
+    if any(profile["norm"] for _, profile in _jobs):
+        models.warm_up()
+
+
+def analyze_path(path: str) -> List[dict]:
+    """Output lines for one file: one result per JD, or a single error."""
+    try:
+        size = os.path.getsize(path)
+        if size == 0:
+            raise ValueError("Empty file")
+        if size > MAX_FILE_BYTES:
+            raise ValueError(f"File too large (> {MAX_FILE_BYTES // (1024 * 1024)} MB)")
+        with open(path, "rb") as f:
+            resume = prepare_resume(os.path.basename(path), f)
+        return [{"path": path, "job": label, **score_resume(resume, jd)} for label, jd in _jobs]
+    except Exception as e:
+        return [{"path": path, "error": str(e) or type(e).__name__}]
+
+
+def load_checkpoint(out_path: str, ckpt_path: str) -> Set[str]:
+    """
+    Paths finished by an earlier run. The output is cut back to the end of
+    the last checkpointed file, dropping lines of a file that was being
+    written when the run stopped, and a torn checkpoint line is removed.
+    """
+    done, offset = set(), 0
+    if os.path.exists(ckpt_path):
+        valid = 0  # bytes of whole, parseable checkpoint lines
+        with open(ckpt_path, "r+b") as f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError
+                    entry = json.loads(line)
+                except ValueError:
+                    break  # torn last line
+                done.add(entry["path"])
+                offset = entry["offset"]
+                valid += len(line)
+            # drop the torn line so this run's entries start on a line of their own
+            f.truncate(valid)
+    size = os.path.getsize(out_path) if os.path.exists(out_path) else 0
+    if size < offset:
+        raise SystemExit(f"{out_path} is shorter than {ckpt_path} records; use --fresh to start over")
+    if size > offset:
+        with open(out_path, "r+b") as f:
+            f.truncate(offset)
+    return done
+
+
+def _jobs_from_args(args) -> list:
+    jobs = []
+    if args.job_id or args.all_jobs:
+        store = JobStore.from_env()
+        for job_id in (store.ids() if args.all_jobs else args.job_id):
+            profile = store.get(job_id)
+            if profile is None:
+                raise SystemExit(f"Unknown job id: {job_id}")
+            jobs.append((job_id, profile))
+    for path in args.jd or ():
+        with open(path, encoding="utf-8") as f:
+            jobs.append((os.path.basename(path), prepare_jd(f.read())))
+    return jobs or [(None, prepare_jd(""))]
+
+
+def run(args) -> dict:
+    ckpt_path = args.checkpoint or args.out + ".ckpt"
+    if args.fresh:
+        for p in (args.out, ckpt_path):
+            if os.path.exists(p):
+                os.remove(p)
+    done = load_checkpoint(args.out, ckpt_path)
+    jobs = _jobs_from_args(args)
+    paths = iter_dir(args.dir) if args.dir else iter_manifest(args.manifest)
+    workers = args.workers or os.cpu_count() or 1
+
+    stats = {"files": 0, "errors": 0, "skipped": 0}
+    started = last_report = time.perf_counter()
+
+    def report(final: bool = False) -> None:
+        elapsed = time.perf_counter() - started
+        rate = stats["files"] / elapsed if elapsed > 0 else 0.0
+        print(
+            f"{'done' if final else 'progress'}: {stats['files']} files ({stats['errors']} errors, "
+            f"{stats['skipped']} already done) in {elapsed:.0f}s, {rate:.1f} files/s",
+            file=sys.stderr, flush=True,
+        )
+
+    # spawn: workers start clean rather than inheriting the parent's torch threads
+    ctx = multiprocessing.get_context("spawn")
+
+    def new_pool() -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(workers, mp_context=ctx, initializer=_init_worker,
+                                   initargs=(jobs, args.threads))
+
+    pool = new_pool()
+    pending = {}  # future -> path
+    with open(args.out, "ab") as out, open(ckpt_path, "a", encoding="utf-8") as ckpt:
+
+        def write(rows: List[dict]) -> None:
+            nonlocal last_report
+            out.write("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in rows).encode("utf-8"))
+            out.flush()
+            ckpt.write(json.dumps({"path": rows[0]["path"], "offset": out.tell()}) + "\n")
+            ckpt.flush()
+            stats["files"] += 1
+            stats["errors"] += "error" in rows[0]
+            if time.perf_counter() - last_report >= args.progress:
+                last_report = time.perf_counter()
+                report()
+
+        def collect(finished) -> None:
+            """
+            Write finished files. A worker that dies (segfault, OOM) breaks
+            the pool and fails every file in flight; those are rerun one at
+            a time in a new pool, and a file that kills its worker again is
+            recorded as an error instead of stopping the run.
+            """
+            nonlocal pool
+            broken = []
+            for future in finished:
+                path = pending.pop(future)
+                try:
+                    write(future.result())
+                except BrokenProcessPool:
+                    broken.append(path)
+            if not broken:
+                return
+            rest = list(pending)  # already failed, or about to
+            wait(rest)
+            for future in rest:
+                path = pending.pop(future)
+                try:
+                    write(future.result())
+                except BrokenProcessPool:
+                    broken.append(path)
+            pool.shutdown(wait=False, cancel_futures=True)
+            pool = new_pool()
+            for path in broken:
+                try:
+                    write(pool.submit(analyze_path, path).result())
+                except BrokenProcessPool:
+                    log.error("Worker died on %s", path)
+                    write([{"path": path, "error": WORKER_DIED}])
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    pool = new_pool()
+
+        try:
+            for path in paths:
+                if path in done:
+                    stats["skipped"] += 1
+                    continue
+                pending[pool.submit(analyze_path, path)] = path
+                if len(pending) >= workers * 4:  # bounded, so huge manifests stream
+                    collect(wait(pending, return_when=FIRST_COMPLETED).done)
+            while pending:
+                collect(wait(pending, return_when=FIRST_COMPLETED).done)
+        finally:
+            pool.shutdown()
+
+    report(final=True)
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--dir", help="analyze every .pdf/.docx/.doc under this directory")
+    source.add_argument("--manifest", help="file with one resume path per line, or - for stdin")
+    parser.add_argument("--jd", action="append", help="job description text file (repeatable)")
+    parser.add_argument("--job-id", action="append", help="stored job id from the job registry (repeatable)")
+    parser.add_argument("--all-jobs", action="store_true", help="score against every stored job")
+    parser.add_argument("--out", required=True, help="JSONL output file (appended to)")
+    parser.add_argument("--checkpoint", help="checkpoint file (default: <out>.ckpt)")
+    parser.add_argument("--fresh", action="store_true", help="discard earlier output and checkpoint")
+    parser.add_argument("--workers", type=int, default=0, help="worker processes (default: CPU count)")
+    parser.add_argument("--threads", type=int, default=1, help="torch threads per worker (0 = torch default)")
+    parser.add_argument("--progress", type=float, default=10.0, help="seconds between progress lines")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=os.environ.get("LOG_LEVEL", "WARNING"))
+    run(args)
+
+
+if __name__ == "__main__":
+    main()
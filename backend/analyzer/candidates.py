@@ -0,0 +1,297 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .matcher import MODEL_ID, _cosine, _to_score, blended_score, embed
+from .extractor import Source
+from .jobs import STORE_DIR
+from .pipeline import pct, prepare_resume
+from .skills import get_taxonomy
+from .skillset import SkillVocab
+
+DEFAULT_DIR = os.path.join(STORE_DIR, "candidates")
+
+
+def profile_resume(filename: str, data: Source) -> dict:
+    """What the store keeps for one resume: skills plus a full-text embedding."""
+    resume = prepare_resume(filename, data)
+    return {
+        "filename": filename,
+        "skills": sorted(resume["skills"]),
+        "embedding": embed([resume["norm"]])[0] if resume["norm"].strip() else None,
+    }
+
+
+class StoreMismatch(ValueError):
+    """The store was built with another embedding model or skill taxonomy."""
+
+
+class CandidateStore:
+    """
+    Stored resumes for reverse search (which candidates fit this JD?).
+
+    Embeddings are appended to one float32 matrix file that is read through
+    a memory map, so 200k x 384 vectors cost page cache rather than heap.
+    Metadata and row numbers live in SQLite; canonical skills are kept in
+    memory as one packed bitset per row, rebuilt from it. Several
+    worker processes can share one directory: each search first picks up
+    rows that other workers appended.
+
+    The store records the embedding model and taxonomy its rows were
+    built with. It keeps no resume text to rebuild them from, so a
+    process running another model or taxonomy gets StoreMismatch rather
+    than mixing incompatible vectors or stale skills. Nothing is created
+    or read until the store is first used.
+    """
+
+    def __init__(self, root: str = DEFAULT_DIR):
+        self.root = root
+        self.matrix_path = os.path.join(root, "embeddings.f32")
+        self.db_path = os.path.join(root, "candidates.sqlite3")
+        self._local = threading.local()
+        os.register_at_fork(after_in_child=self._drop_connections)
+        self._lock = threading.Lock()
+        self.dim = 0
+        self._n = 0  # rows loaded into the index
+        self._vocab = SkillVocab()  # process-local ids; SQLite keeps names
+        self._bits = np.zeros((0, 0), dtype=np.uint8)  # (rows, vocab bytes)
+        self._active = np.zeros(0, dtype=bool)
+        self._ids: List[str] = []
+        self._filenames: List[str] = []
+        self._norms = np.zeros(0, dtype=np.float32)
+        self._mm = None
+        self._version = None  # meta 'version' seen by the last refresh
+        self._mismatch = None  # StoreMismatch message, if any
+        self._ready = False  # directory and tables created
+
+    @classmethod
+    def from_env(cls) -> "CandidateStore":
+        return cls(os.environ.get("CANDIDATE_STORE_DIR") or DEFAULT_DIR)
+
+    def _drop_connections(self) -> None:
+        """In a forked child: open new connections rather than share the parent's."""
+        self._local = threading.local()
+
+    def _conn(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            if not self._ready:
+                os.makedirs(self.root, exist_ok=True)
+            db = sqlite3.connect(self.db_path, timeout=30)
+            db.execute("PRAGMA journal_mode=WAL")
+            if not self._ready:
+                with db:
+                    db.execute(
+                        "CREATE TABLE IF NOT EXISTS candidates ("
+                        " row INTEGER PRIMARY KEY, id TEXT NOT NULL, filename TEXT,"
+                        " skills TEXT NOT NULL, active INTEGER NOT NULL DEFAULT 1, added REAL NOT NULL)"
+                    )
+                    db.execute("CREATE INDEX IF NOT EXISTS candidates_id ON candidates(id)")
+                    db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+                self._ready = True
+            self._local.db = db
+        return db
+
+    # ------------------------------------------------------------------ write
+    def add_many(self, records: Iterable[dict]) -> List[str]:
+        """
+        Append candidates: dicts with id, filename, skills and embedding.
+        Re-adding an id replaces the earlier entry.
+        """
+        records = [r for r in records if r.get("embedding") is not None]
+        if not records:
+            return []
+        vecs = np.vstack([np.asarray(r["embedding"], dtype=np.float32) for r in records])
+
+        db = self._conn()
+        with db:
+            db.execute("BEGIN IMMEDIATE")  # serializes writers across processes
+            start = db.execute("SELECT COALESCE(MAX(row) + 1, 0) FROM candidates").fetchone()[0]
+            if start:
+                self._check(db)
+            else:  # an empty store takes this process's model and taxonomy
+                model, taxonomy = self._versions()
+                db.executemany(
+                    "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                    [("dim", str(vecs.shape[1])), ("model", model), ("taxonomy", taxonomy)],
+                )
+            dim = int(db.execute("SELECT value FROM meta WHERE key = 'dim'").fetchone()[0])
+            if vecs.shape[1] != dim:
+                raise ValueError(f"Embedding size {vecs.shape[1]} does not match store ({dim}).")
+
+            with open(self.matrix_path, "ab") as f:
+                f.truncate(start * dim * 4)  # drop any half-written tail
+                f.write(vecs.tobytes())
+
+            now = time.time()
+            ids = [r["id"] for r in records]
+            db.executemany(
+                "UPDATE candidates SET active = 0 WHERE id = ?", [(i,) for i in ids]
+            )
+            db.executemany(
+                "INSERT INTO candidates (row, id, filename, skills, active, added) VALUES (?, ?, ?, ?, 1, ?)",
+                [
+                    (start + i, r["id"], r.get("filename"), json.dumps(sorted(r["skills"])), now)
+                    for i, r in enumerate(records)
+                ],
+            )
+            self._bump(db)
+        self.refresh()
+        return ids
+
+    def add(self, candidate_id: str, profile: dict) -> Optional[str]:
+        ids = self.add_many([dict(profile, id=candidate_id)])
+        return ids[0] if ids else None
+
+    def delete(self, candidate_id: str) -> bool:
+        with self._conn() as db:
+            cur = db.execute(
+                "UPDATE candidates SET active = 0 WHERE id = ? AND active = 1", (candidate_id,)
+            )
+            self._bump(db)
+        self.refresh()
+        return cur.rowcount > 0
+
+    @staticmethod
+    def _bump(db: sqlite3.Connection) -> None:
+        # every write bumps this, so readers can skip refreshes cheaply
+        db.execute(
+            "INSERT INTO meta VALUES ('version', '1')"
+            " ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1"
+        )
+
+    @staticmethod
+    def _versions() -> Tuple[str, str]:
+        return MODEL_ID, get_taxonomy().version
+
+    def _check(self, db: sqlite3.Connection) -> None:
+        """Raise StoreMismatch unless the stored rows match this process."""
+        meta = dict(db.execute("SELECT key, value FROM meta WHERE key IN ('model', 'taxonomy')"))
+        for key, current in zip(("model", "taxonomy"), self._versions()):
+            if meta.get(key) != current:
+                raise StoreMismatch(
+                    f"Candidate store {self.root} was built with {key} {meta.get(key)!r}, not {current!r}; "
+                    "add the candidates again into an empty CANDIDATE_STORE_DIR."
+                )
+
+    # ------------------------------------------------------------------- read
+    def refresh(self) -> None:
+        """Load rows appended (by any process) since the last refresh."""
+        db = self._conn()
+        row = db.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        version = row[0] if row else None
+        if version == self._version and self._version is not None:
+            return
+        with self._lock:
+            self._mismatch = None
+            if db.execute("SELECT 1 FROM candidates LIMIT 1").fetchone():
+                try:
+                    self._check(db)
+                except StoreMismatch as e:
+                    self._mismatch = str(e)
+            if not self.dim:
+                row = db.execute("SELECT value FROM meta WHERE key = 'dim'").fetchone()
+                self.dim = int(row[0]) if row else 0
+            new = db.execute(
+                "SELECT row, id, filename, skills FROM candidates WHERE row >= ? ORDER BY row",
+                (self._n,),
+            ).fetchall()
+            if new:
+                n = new[-1][0] + 1
+                for _, cid, filename, _ in new:
+                    self._ids.append(cid)
+                    self._filenames.append(filename)
+                bits = self._vocab.encode_many(
+                    [json.loads(skills) for *_, skills in new], width=self._bits.shape[1]
+                )
+                old = self._bits
+                if bits.shape[1] > old.shape[1]:  # the vocabulary grew
+                    old = np.pad(old, ((0, 0), (0, bits.shape[1] - old.shape[1])))
+                self._bits = np.concatenate([old, bits])
+                self._n = n
+                self._mm = None
+                matrix = self._matrix()
+                self._norms = np.concatenate(
+                    [self._norms, np.linalg.norm(matrix[len(self._norms):], axis=1)]
+                )
+            # activity can change for old rows too (replacements, deletes)
+            active = np.zeros(self._n, dtype=bool)
+            rows = [r[0] for r in db.execute("SELECT row FROM candidates WHERE active = 1")]
+            active[rows] = True
+            self._active = active
+            self._version = version
+
+    def _matrix(self) -> np.ndarray:
+        if self._mm is None:
+            if not self._n:
+                return np.zeros((0, self.dim or 1), dtype=np.float32)
+            self._mm = np.memmap(self.matrix_path, dtype=np.float32, mode="r", shape=(self._n, self.dim))
+        return self._mm
+
+    def __len__(self) -> int:
+        """Active candidates as of the last refresh (0 before first use)."""
+        return int(self._active.sum())
+
+    def search(self, jd: dict, top_k: int = 10, min_overlap: int = 1) -> List[dict]:
+        """
+        Rank stored candidates against a JD profile (see jobs.build_profile).
+        Candidates sharing fewer than `min_overlap` skills with the JD are
+        skipped (no filter when the JD has no skills). Scores use the same
+        formulas as /analyze in full-text semantic mode.
+        """
+        self.refresh()
+        if self._mismatch:
+            raise StoreMismatch(self._mismatch)
+        with self._lock:
+            n, active, bits = self._n, self._active, self._bits
+            matrix, norms = self._matrix(), self._norms
+        jd_vec = jd.get("embedding")
+        if not n or jd_vec is None:
+            return []
+        jd_vec = np.asarray(jd_vec, dtype=np.float32)
+        # ---- Pre-filter by skill overlap (bitset columns of the JD's skills)
+        jd_skills, hits = self._vocab.columns(bits, jd["skills"])
+        counts = hits.sum(axis=1)
+        mask = active & (counts >= max(0, min_overlap)) if jd_skills else active.copy()
+        rows = np.flatnonzero(mask)
+        if not len(rows):
+            return []
+
+        # ---- Vectorized cosine over the (memory-mapped) matrix
+        # gathering rows copies them; past a few percent a full scan is cheaper
+        if len(rows) > n // 16:
+            dots = (matrix @ jd_vec)[rows]
+        else:
+            dots = matrix[rows] @ jd_vec
+        denom = norms[rows] * np.linalg.norm(jd_vec)
+        sims = np.divide(dots, denom, out=np.zeros_like(dots), where=denom > 0)
+        sem = np.round(np.clip(sims, 0.0, 1.0) * 100.0, 1)
+        overlap = counts[rows] / len(jd_skills) * 100.0 if jd_skills else np.zeros(len(rows))
+        approx = sem * 0.55 + overlap * 0.45
+
+        # ---- Exact scores for a small shortlist, then final order
+        short = min(len(rows), max(top_k * 4, top_k + 16))
+        pick = np.argpartition(-approx, short - 1)[:short] if short < len(rows) else np.arange(len(rows))
+        names = np.array(jd_skills, dtype=object)
+        out = []
+        for i in pick:
+            row = int(rows[i])
+            sem_exact = _to_score(_cosine(np.asarray(matrix[row:row + 1]), jd_vec)[0])
+            matched, missing = names[hits[row]].tolist(), names[~hits[row]].tolist()
+            overlap_exact = (len(matched) / len(jd_skills)) * 100 if jd_skills else 0.0
+            out.append({
+                "id": self._ids[row],
+                "filename": self._filenames[row],
+                "ats_score": pct(blended_score(sem_exact, overlap_exact, w_sem=0.55)),
+                "semantic_score": pct(sem_exact),
+                "skill_overlap": pct(overlap_exact),
+                "matched_skills": matched,
+                "missing_skills": missing,
+            })
+        out.sort(key=lambda r: (-r["ats_score"], r["id"]))
+        return out[:top_k]
@@ -0,0 +1,89 @@
+import re
+from dataclasses import dataclass
+from functools import cached_property
+from typing import List, Tuple
+
+import numpy as np
+
+from .advisor import count_signals
+from .extractor import find_section_headers, normalize, sections_from_headers
+from .skills import normalize_text
+
+_WORD = re.compile(r"\S+")
+
+
+@dataclass(frozen=True)
+class ParsedDocument:
+    """
+    One resume or JD text, parsed once and handed to every analyzer stage.
+
+    `norm` is extractor.normalize(raw). Everything else is derived from it
+    on first use and kept, so later stages find it ready: the skill
+    matchers' text and tokens, word offsets, section headers and the
+    advisor counters. The stages still accept plain strings as well.
+    """
+
+    raw: str
+    norm: str
+
+    @classmethod
+    def parse(cls, raw: str) -> "ParsedDocument":
+        raw = raw or ""
+        return cls(raw, normalize(raw))
+
+    @cached_property
+    def skill_text(self) -> str:
+        """skills.normalize_text(norm), which the skill matchers scan."""
+        return normalize_text(self.norm)
+
+    @cached_property
+    def skill_tokens(self) -> frozenset:
+        """Distinct skill_text tokens of 3+ characters (fuzzy_fill's candidates)."""
+        return frozenset(t for t in self.skill_text.split(" ") if len(t) >= 3)
+
+    @cached_property
+    def _tokenized(self) -> Tuple[Tuple[str, ...], np.ndarray]:
+        words, offsets = [], []
+        for m in _WORD.finditer(self.norm):
+            words.append(m.group())
+            offsets.append(m.span())
+        return tuple(words), np.array(offsets, dtype=np.int64).reshape(-1, 2)
+
+    @property
+    def words(self) -> Tuple[str, ...]:
+        """norm.split()."""
+        return self._tokenized[0]
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """(n, 2) start/end of each word in norm."""
+        return self._tokenized[1]
+
+    def words_between(self, start: int, end: int) -> List[str]:
+        """norm[start:end].split(), from the word offsets."""
+        words, offsets = self._tokenized
+        lo = int(np.searchsorted(offsets[:, 1], start, side="right"))
+        hi = int(np.searchsorted(offsets[:, 0], end, side="left"))
+        out = list(words[lo:hi])
+        if out:
+            # a cut may fall inside a word ("x-experience"); keep its piece
+            for i in {0, len(out) - 1}:
+                s, e = offsets[lo + i]
+                if s < start or e > end:
+                    out[i] = self.norm[max(s, start):min(e, end)]
+        return out
+
+    @cached_property
+    def headers(self) -> Tuple[Tuple[int, str], ...]:
+        """find_section_headers(norm)."""
+        return tuple(find_section_headers(self.norm))
+
+    @cached_property
+    def sections(self) -> dict:
+        """guess_sections(norm)."""
+        return sections_from_headers(self.norm, self.headers)
+
+    @cached_property
+    def signals(self) -> dict:
+        """advisor.count_signals(norm)."""
+        return count_signals(self.norm)
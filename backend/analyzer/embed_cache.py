@@ -0,0 +1,185 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Optional
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """
+    LRU cache in front of a sentence encoder, keyed by (model, text) hash.
+
+    Vectors live in memory up to `max_items`. With `disk_dir` set, every
+    vector is also written there as a float32 .npy file and read back
+    memory-mapped, so the cache survives restarts and is shared by workers
+    on the same host. The directory holds at most about `disk_max_items`
+    files (0 = no limit): every tenth of that many writes, the least
+    recently used files are deleted until it is back under 90%.
+    """
+
+    def __init__(
+        self,
+        encode_fn: Callable[[List[str]], np.ndarray],
+        model_name: str,
+        max_items: int = 2048,
+        disk_dir: Optional[str] = None,
+        disk_max_items: int = 100_000,
+    ):
+        self.encode_fn = encode_fn
+        self.model_name = model_name
+        self.max_items = max(0, int(max_items))
+        self.disk_dir = disk_dir
+        self.disk_max_items = max(0, int(disk_max_items))
+        self._items: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._prune_lock = threading.Lock()
+        self._writes = self._prune_every()  # prune once on the first write
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def key(self, text: str) -> str:
+        h = hashlib.sha256()
+        h.update(self.model_name.encode("utf-8"))
+        h.update(b"\0")
+        h.update(text.encode("utf-8"))
+        return h.hexdigest()
+
+    # -- memory tier
+    def _get(self, key: str) -> Optional[np.ndarray]:
+        with self._lock:
+            vec = self._items.get(key)
+            if vec is not None:
+                self._items.move_to_end(key)
+            return vec
+
+    def _put(self, key: str, vec: np.ndarray) -> None:
+        if not self.max_items:
+            return
+        with self._lock:
+            self._items[key] = vec
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    # -- disk tier
+    def _path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, key[:2], key + ".npy")
+
+    def _load(self, key: str) -> Optional[np.ndarray]:
+        if not self.disk_dir:
+            return None
+        path = self._path(key)
+        try:
+            vec = np.load(path, mmap_mode="r")
+            if self.disk_max_items:
+                os.utime(path)  # the mtime is what pruning goes by
+            return vec
+        except (OSError, ValueError):
+            return None
+
+    def _store(self, key: str, vec: np.ndarray) -> None:
+        if not self.disk_dir:
+            return
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                np.save(f, vec)
+            os.replace(tmp, path)  # atomic, so readers never see half a file
+        except OSError:
+            return
+        if self.disk_max_items:
+            with self._prune_lock:
+                self._writes += 1
+                due = self._writes >= self._prune_every()
+                if due:
+                    self._writes = 0
+            if due:
+                self._prune_disk()
+
+    def _prune_every(self) -> int:
+        return max(1, self.disk_max_items // 10)
+
+    def _prune_disk(self) -> None:
+        """Delete the least recently used files past 90% of disk_max_items."""
+        files = []
+        for sub in os.scandir(self.disk_dir):
+            if not sub.is_dir():
+                continue
+            for entry in os.scandir(sub.path):
+                if entry.name.endswith(".npy"):
+                    try:
+                        files.append((entry.stat().st_mtime, entry.path))
+                    except OSError:
+                        pass  # deleted by another worker meanwhile
+        if len(files) <= self.disk_max_items:
+            return
+        files.sort()
+        for _, path in files[:len(files) - self.disk_max_items * 9 // 10]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """
+        Return a (len(texts), dim) float32 array. Texts not in the cache
+        are encoded together in one call to encode_fn.
+        """
+        keys = [self.key(t) for t in texts]
+        vecs: List[Optional[np.ndarray]] = [None] * len(texts)
+        todo = {}  # key -> positions, so duplicates are encoded once
+        hits = disk_hits = 0
+
+        for i, k in enumerate(keys):
+            vec = self._get(k)
+            if vec is None:
+                vec = self._load(k)
+                if vec is not None:
+                    disk_hits += 1
+                    self._put(k, vec)
+            if vec is not None:
+                hits += 1
+                vecs[i] = vec
+            else:
+                todo.setdefault(k, []).append(i)
+
+        with self._lock:
+            self.hits += hits
+            self.disk_hits += disk_hits
+            self.misses += len(todo)
+
+        if todo:
+            order = list(todo)
+            fresh = np.asarray(
+                self.encode_fn([texts[todo[k][0]] for k in order]), dtype=np.float32
+            )
+            for k, vec in zip(order, fresh):
+                self._put(k, vec)
+                self._store(k, vec)
+                for i in todo[k]:
+                    vecs[i] = vec
+
+        return np.vstack(vecs) if vecs else np.zeros((0, 0), dtype=np.float32)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "size": len(self._items),
+                "max_items": self.max_items,
+                "disk_dir": self.disk_dir,
+                "disk_max_items": self.disk_max_items,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
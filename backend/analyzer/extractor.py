@@ -1,24 +1,334 @@
 import io
+import os
 import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from multiprocessing.connection import Connection
+from typing import BinaryIO, Iterator, List, Optional, Union
 import pdfplumber
 import docx
 
 SUPPORT = (".pdf", ".docx", ".doc")
 
-def extract_text_bytes(filename: str, data: bytes) -> str:
+# Limits so one bad upload can't tie up a worker
+MAX_PDF_PAGES = int(os.environ.get("MAX_PDF_PAGES", "50"))
+EXTRACT_TIME_BUDGET = float(os.environ.get("EXTRACT_TIME_BUDGET", "20"))  # seconds per document
+# PDFs with at least this many pages are spread over several page workers (0 = never)
+PDF_PARALLEL_MIN_PAGES = int(os.environ.get("PDF_PARALLEL_MIN_PAGES", "12"))
+PDF_WORKERS = int(os.environ.get("PDF_WORKERS", "0")) or min(4, os.cpu_count() or 1)  # per process
+PDF_PAGES_PER_TASK = 2
+# Smaller PDFs are extracted in-process (budget checked between pages);
+# 0 sends every PDF to the killable page workers
+PDF_WORKER_MIN_BYTES = int(os.environ.get("PDF_WORKER_MIN_BYTES", str(1024 * 1024)))
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # for `-m analyzer.extractor`
+
+
+# Uploaded document: bytes, or a seekable binary file (e.g. the upload's
+# spooled temp file), which the extractors read in place without a copy.
+Source = Union[bytes, BinaryIO]
+
+
+class ExtractionTimeout(ValueError):
+    """The document did not finish extracting within its time budget."""
+
+
+def _as_file(data: Source) -> BinaryIO:
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return io.BytesIO(data)
+    data.seek(0)
+    return data
+
+
+def source_size(data: Source) -> int:
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return len(data)
+    return data.seek(0, os.SEEK_END)
+
+
+def _page_text(page) -> str:
+    text = page.extract_text() or ""
+    page.close()  # drop the page's parsed objects right away
+    return text
+
+
+def _page_worker(tasks, out) -> None:
+    """
+    Page worker loop. ("open", path, max_pages) is answered with the page
+    count, ("pages", start, stop) with the text of each page in turn, and
+    ("close",) with nothing. Errors are answered with (False, message).
+    """
+    pdf = None
+    while True:
+        try:
+            msg = tasks.recv()
+        except EOFError:
+            return
+        try:
+            if msg[0] == "open":
+                _, path, max_pages = msg
+                pdf = pdfplumber.open(path)
+                count = len(pdf.pages)
+                out.send((True, min(count, max_pages) if max_pages > 0 else count))
+            elif msg[0] == "pages":
+                for i in range(msg[1], msg[2]):
+                    out.send((True, _page_text(pdf.pages[i])))
+            elif pdf is not None:
+                pdf.close()
+                pdf = None
+        except Exception as e:
+            out.send((False, f"Could not read PDF: {e}"))
+
+
+def _timeout(deadline: Optional[float]) -> Optional[float]:
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+class _PageWorker:
+    """
+    A page worker process running _page_worker; kill() stops it mid-page.
+
+    It is a fresh `python -m analyzer.extractor` talking over two pipes,
+    so it imports this module only. (multiprocessing's spawn would also
+    re-run the server's __main__, i.e. the whole app, in every worker.)
+    """
+
+    def __init__(self):
+        path = os.pathsep.join(filter(None, [_ROOT, os.environ.get("PYTHONPATH")]))
+        task_r, task_w = os.pipe()
+        page_r, page_w = os.pipe()
+        try:
+            self.process = subprocess.Popen(
+                [sys.executable, "-m", __name__, str(task_r), str(page_w)],
+                pass_fds=(task_r, page_w),
+                stdin=subprocess.DEVNULL,
+                env=dict(os.environ, PYTHONPATH=path),
+            )
+        except BaseException:
+            os.close(task_w)
+            os.close(page_r)
+            raise
+        finally:
+            os.close(task_r)
+            os.close(page_w)
+        self.tasks = Connection(task_w, readable=False)
+        self.pages = Connection(page_r, writable=False)
+
+    def is_alive(self) -> bool:
+        return self.process.poll() is None
+
+    def send(self, *msg) -> None:
+        try:
+            self.tasks.send(msg)
+        except OSError:
+            raise ValueError("PDF extraction worker died.")
+
+    def recv(self, deadline: Optional[float]):
+        """The worker's next answer, within the deadline."""
+        if not self.pages.poll(_timeout(deadline)):
+            raise ExtractionTimeout("Document took too long to extract.")
+        try:
+            ok, value = self.pages.recv()
+        except (EOFError, OSError):
+            raise ValueError("PDF extraction worker died.")
+        if not ok:
+            raise ValueError(value)
+        return value
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.wait()
+        self.tasks.close()
+        self.pages.close()
+
+
+class _PagePool:
+    """
+    Up to `size` page workers, reused between documents. A worker that
+    did not finish its pages (timeout, error, abandoned stream) is
+    killed rather than reused, so nothing keeps running after it.
+    """
+
+    def __init__(self, size: int):
+        self._slots = threading.BoundedSemaphore(size)
+        self._idle: List[_PageWorker] = []
+        self._lock = threading.Lock()
+
+    def acquire(self, deadline: Optional[float], block: bool = True) -> Optional[_PageWorker]:
+        if not block:
+            if not self._slots.acquire(blocking=False):
+                return None
+        elif not self._slots.acquire(timeout=_timeout(deadline)):
+            raise ExtractionTimeout("Document took too long to extract.")
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.is_alive():
+                    return worker
+                worker.kill()
+        try:
+            return _PageWorker()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, worker: _PageWorker, reuse: bool) -> None:
+        if reuse:
+            with self._lock:
+                self._idle.append(worker)
+        else:
+            worker.kill()
+        self._slots.release()
+
+
+_page_pool = None
+_page_pool_lock = threading.Lock()
+
+def _get_page_pool() -> _PagePool:
+    global _page_pool
+    if _page_pool is None:
+        with _page_pool_lock:
+            if _page_pool is None:
+                _page_pool = _PagePool(PDF_WORKERS)
+    return _page_pool
+
+
+def _forget_page_pool() -> None:
+    """In a forked child: start new page workers rather than share the parent's."""
+    global _page_pool
+    _page_pool = None
+
+
+os.register_at_fork(after_in_child=_forget_page_pool)
+
+
+@contextmanager
+def _shared_path(data: Source) -> Iterator[str]:
+    """A file path the page workers can open: the source's own, or a temp copy."""
+    name = getattr(data, "name", None)
+    if isinstance(name, str) and os.path.isfile(name):
+        yield name
+        return
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+        shutil.copyfileobj(_as_file(data), tmp)
+    try:
+        yield tmp.name
+    finally:
+        os.unlink(tmp.name)
+
+
+def _check_deadline(deadline: Optional[float]) -> None:
+    if deadline is not None and time.monotonic() > deadline:
+        raise ExtractionTimeout("Document took too long to extract.")
+
+
+def iter_pdf_pages(
+    data: Source,
+    max_pages: Optional[int] = None,
+    time_budget: Optional[float] = None,
+) -> Iterator[str]:
+    """
+    Yield the text of each PDF page in order, as soon as it is ready.
+    Pages past `max_pages` are ignored, and the document must finish
+    within `time_budget` seconds or ExtractionTimeout is raised.
+
+    PDFs of PDF_WORKER_MIN_BYTES or more are opened, counted and
+    extracted in page worker processes that read the file from disk;
+    when the budget runs out (even in the middle of a page) they are
+    killed. Large documents are spread over several workers, a few pages
+    per task. Smaller PDFs are read in this process, with the budget
+    checked between pages.
+    """
+    max_pages = MAX_PDF_PAGES if max_pages is None else max_pages
+    time_budget = EXTRACT_TIME_BUDGET if time_budget is None else time_budget
+    deadline = time.monotonic() + time_budget if time_budget > 0 else None
+
+    if os.name != "posix" or source_size(data) < PDF_WORKER_MIN_BYTES:
+        yield from _iter_pages_here(data, max_pages, deadline)
+    else:
+        yield from _iter_pages_in_workers(data, max_pages, deadline)
+
+
+def _iter_pages_here(data: Source, max_pages: int, deadline: Optional[float]) -> Iterator[str]:
+    with pdfplumber.open(_as_file(data)) as pdf:
+        count = len(pdf.pages)
+        if max_pages > 0:
+            count = min(count, max_pages)
+        for i in range(count):
+            _check_deadline(deadline)
+            yield _page_text(pdf.pages[i])
+
+
+def _iter_pages_in_workers(data: Source, max_pages: int, deadline: Optional[float]) -> Iterator[str]:
+    pool = _get_page_pool()
+    with _shared_path(data) as path:
+        workers = [pool.acquire(deadline)]
+        finished = False
+        try:
+            # even parsing the page tree runs in a worker, under the budget
+            workers[0].send("open", path, max_pages)
+            count = workers[0].recv(deadline)
+            if PDF_PARALLEL_MIN_PAGES and count >= PDF_PARALLEL_MIN_PAGES:
+                tasks = [(start, min(start + PDF_PAGES_PER_TASK, count)) for start in range(0, count, PDF_PAGES_PER_TASK)]
+                # more workers only if they are free now, so documents never wait on each other's
+                while len(workers) < len(tasks):
+                    worker = pool.acquire(deadline, block=False)
+                    if worker is None:
+                        break
+                    workers.append(worker)
+                    worker.send("open", path, max_pages)
+            else:
+                tasks = [(0, count)] if count else []
+            # round robin; each worker sends its pages back in task order
+            for t, (start, stop) in enumerate(tasks):
+                workers[t % len(workers)].send("pages", start, stop)
+            for worker in workers[1:]:
+                worker.recv(deadline)  # its page count, already known
+            for t, (start, stop) in enumerate(tasks):
+                worker = workers[t % len(workers)]
+                for _ in range(start, stop):
+                    yield worker.recv(deadline)
+            for worker in workers:
+                worker.send("close")
+            finished = True
+        finally:
+            for worker in workers:
+                pool.release(worker, reuse=finished)
+
+
+def iter_text_bytes(filename: str, data: Source) -> Iterator[str]:
+    """
+    Stream a document's text: one item per PDF page or DOCX paragraph.
+    "\n".join() of the items equals extract_text_bytes().
+    """
     name = filename.lower()
 
     if name.endswith(".pdf"):
-        with pdfplumber.open(io.BytesIO(data)) as pdf:
-            pages = [(p.extract_text() or "") for p in pdf.pages]
-            return "\n".join(pages)
+        yield from iter_pdf_pages(data)
+        return
 
     if name.endswith((".docx", ".doc")):
-        doc = docx.Document(io.BytesIO(data))
-        return "\n".join(p.text for p in doc.paragraphs)
+        doc = docx.Document(_as_file(data))
+        for p in doc.paragraphs:
+            yield p.text
+        return
 
     raise ValueError("Unsupported file type")
 
+
+def extract_text_bytes(filename: str, data: Source) -> str:
+    """
+    The whole document's text. The analysis reads it all at once
+    (normalization, sections, skills), so this is what the pipeline
+    uses; the page stream bounds memory and time, not latency.
+    """
+    return "\n".join(iter_text_bytes(filename, data))
+
 def normalize(text: str) -> str:
     text = text.lower()
     # compact whitespace
@@ -30,17 +340,41 @@ SECTION_HEADERS = [
     "projects","education","skills","certifications","awards"
 ]
 
-def guess_sections(text: str) -> dict:
-    """Very simple section splitter to power heuristics."""
-    sections = {}
-    lower = text.lower()
+# Every header in one regex. The lookahead is zero-width, so a header
+# inside a longer one ("experience" in "work experience") is still found
+# at its own offset; headers that are a whole-word prefix of the longer
+# match at the same offset come from _HEADER_PREFIXES.
+_HEADER_RE = re.compile(
+    r"\b(?=(" + "|".join(re.escape(h) for h in sorted(SECTION_HEADERS, key=len, reverse=True)) + r")\b)"
+)
+_HEADER_PREFIXES = {
+    h: [p for p in SECTION_HEADERS if p != h and re.match(rf"{re.escape(p)}\b", h)]
+    for h in SECTION_HEADERS
+}
 
-    # find indices of headers
+def find_section_headers(text) -> list:
+    """Sorted (offset, header) for every header occurrence in text."""
+    if not isinstance(text, str):
+        return list(text.headers)
     indices = []
-    for h in SECTION_HEADERS:
-        for m in re.finditer(rf"\b{re.escape(h)}\b", lower):
-            indices.append((m.start(), h))
+    for m in _HEADER_RE.finditer(text.lower()):
+        header = m.group(1)
+        indices.append((m.start(), header))
+        indices.extend((m.start(), p) for p in _HEADER_PREFIXES[header])
     indices.sort()
+    return indices
+
+def guess_sections(text) -> dict:
+    """Very simple section splitter to power heuristics."""
+    if not isinstance(text, str):
+        return text.sections
+    # find indices of headers
+    return sections_from_headers(text, find_section_headers(text))
+
+
+def sections_from_headers(text: str, indices: list) -> dict:
+    """guess_sections() for headers already found by find_section_headers()."""
+    sections = {}
 
     # slice sections
     for i, (start, header) in enumerate(indices):
@@ -48,3 +382,8 @@ def guess_sections(text: str) -> dict:
         sections[header] = text[start:end].strip()
 
     return sections
+
+
+if __name__ == "__main__":
+    # a page worker started by _PageWorker: task and page pipe descriptors
+    _page_worker(Connection(int(sys.argv[1]), writable=False), Connection(int(sys.argv[2]), readable=False))
@@ -0,0 +1,147 @@
+import re
+from typing import Dict, Iterable, List
+
+# Strong action verbs that recruiters like
+ACTION_VERBS = {
+    "built", "created", "designed", "developed", "engineered", "implemented",
+    "launched", "led", "migrated", "optimized", "reduced", "improved",
+    "automated", "architected", "delivered", "scaled", "streamlined",
+    "initiated", "enhanced"
+}
+
+# Verbs quantify_issues() expects at the start of bullets
+BULLET_VERBS = {
+    "built", "delivered", "optimized", "designed", "implemented", "led",
+    "launched", "reduced", "increased", "improved", "automated", "migrated",
+    "developed", "refactored", "deployed"
+}
+
+# Standard resume headings we expect
+HEADINGS = {
+    "summary", "experience", "work experience", "projects", "education",
+    "skills", "certifications"
+}
+
+AUXILIARIES = {"was", "were", "been", "being", "is", "are", "be"}
+
+BULLET = r"\n[-•*]\s*"
+NUMBER = r"\b\d+(?:\.\d+)?%?\b"
+
+
+class Terms:
+    """Which of `terms` (words or space-separated phrases) occur as whole words."""
+
+    def __init__(self, name: str, terms: Iterable[str]):
+        self.name = name
+        self.terms = sorted(terms)
+
+
+class FollowedBy:
+    """How many words from `words` are followed, after whitespace, by a word matching `pattern`."""
+
+    def __init__(self, name: str, words: Iterable[str], pattern: str):
+        self.name = name
+        self.words = sorted(words)
+        self.pattern = pattern
+
+
+class RuleSet:
+    """
+    Resume counters computed in one scan of the text.
+
+    Every word a rule can react to goes into one compiled alternation next
+    to the bullet and number patterns, so the regex engine skips all other
+    text and Python only runs for the hits. Adding a rule adds words to
+    that alternation, not another pass. scan() returns:
+
+        words, numbers          whitespace-separated words, numeric tokens
+        bullets                 non-blank pieces between "\\n- " style markers
+        bullets_with_numbers    ... of which contain a number
+        <Terms.name>            set of the terms found
+        <FollowedBy.name>       count of matches
+    """
+
+    def __init__(self, rules: List[object]):
+        self.rules = list(rules)
+        self._terms: Dict[tuple, List[str]] = {}  # phrase words -> Terms rule names
+        self._follow: Dict[str, list] = {}  # word -> [(FollowedBy name, compiled follower)]
+        keys = set()
+        for rule in self.rules:
+            if isinstance(rule, Terms):
+                for term in rule.terms:
+                    words = tuple(term.lower().split())
+                    if not all(re.fullmatch(r"\w+", w) for w in words):
+                        raise ValueError(f"{rule.name}: {term!r} is not a run of words")
+                    self._terms.setdefault(words, []).append(rule.name)
+                    keys.update(words)
+            elif isinstance(rule, FollowedBy):
+                follower = re.compile(rf"\s+(?:{rule.pattern})\b")
+                for word in rule.words:
+                    self._follow.setdefault(word.lower(), []).append((rule.name, follower))
+                    keys.add(word.lower())
+            else:
+                raise TypeError(f"unknown rule {rule!r}")
+
+        self.max_words = max((len(words) for words in self._terms), default=1)
+        alternation = "|".join(re.escape(k) for k in sorted(keys, key=lambda k: (-len(k), k)))
+        self._token = re.compile(
+            rf"(?P<bullet>{BULLET})|(?P<num>{NUMBER})"
+            + (rf"|(?P<key>\b(?:{alternation})\b)" if keys else "")
+        )
+
+    def scan(self, text: str) -> dict:
+        text = text.lower()
+        out = {"words": len(text.split()), "numbers": 0, "bullets": 0, "bullets_with_numbers": 0}
+        for rule in self.rules:
+            out[rule.name] = set() if isinstance(rule, Terms) else 0
+
+        terms, follow, max_words = self._terms, self._follow, self.max_words
+        numbers = bullets = with_numbers = 0
+        piece_start, piece_number = 0, False
+        run: List[str] = []  # key words so far separated only by whitespace
+        run_end = 0
+        for m in self._token.finditer(text):
+            kind = m.lastgroup
+            if kind == "key":
+                word, start = m.group(), m.start()
+                if run and (max_words == 1 or not text[run_end:start].isspace()):
+                    run = []
+                run.append(word)
+                run_end = m.end()
+                if len(run) > max_words:
+                    del run[0]
+                for n in range(1, len(run) + 1):
+                    for name in terms.get(tuple(run[-n:]), ()):
+                        out[name].add(" ".join(run[-n:]))
+                for name, follower in follow.get(word, ()):
+                    if follower.match(text, run_end):
+                        out[name] += 1
+            elif kind == "num":
+                numbers += 1
+                piece_number = True
+            else:
+                piece = text[piece_start:m.start()]
+                if piece and not piece.isspace():
+                    bullets += 1
+                    with_numbers += piece_number
+                piece_start, piece_number = m.end(), False
+
+        piece = text[piece_start:]
+        if piece and not piece.isspace():
+            bullets += 1
+            with_numbers += piece_number
+        out.update(numbers=numbers, bullets=bullets, bullets_with_numbers=with_numbers)
+        return out
+
+
+RULES = RuleSet([
+    Terms("verbs", ACTION_VERBS),
+    Terms("bullet_verbs", BULLET_VERBS),
+    Terms("headings", HEADINGS),
+    FollowedBy("passive", AUXILIARIES, r"\w+ed"),
+])
+
+
+def scan(text: str) -> dict:
+    """RULES.scan(text)."""
+    return RULES.scan(text)
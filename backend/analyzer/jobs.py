@@ -0,0 +1,162 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import List, Optional
+
+import numpy as np
+
+from .matcher import MODEL_VERSION, embed
+from .pipeline import prepare_jd
+from .skills import get_taxonomy
+
+# Writable directory for the stores, unless JOB_STORE_PATH or
+# CANDIDATE_STORE_DIR name their own
+STORE_DIR = os.environ.get("STORE_DIR") or os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "data"
+)
+DEFAULT_PATH = os.path.join(STORE_DIR, "jobs.sqlite3")
+
+
+def build_profile(job_description: str) -> dict:
+    """prepare_jd() plus the JD embedding, i.e. everything scoring needs."""
+    jd = prepare_jd(job_description)
+    jd["embedding"] = embed([jd["norm"]])[0] if jd["norm"].strip() else None
+    return jd
+
+
+class JobStore:
+    """
+    Registry of job postings with their precomputed profiles (normalized
+    text, canonical skills, embedding), persisted in a local SQLite file.
+
+    Profiles built under an older taxonomy or model are rebuilt from the
+    stored text the first time they are read. The file is created on
+    first use, not when the store is constructed.
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        self.path = path
+        self._local = threading.local()
+        os.register_at_fork(after_in_child=self._drop_connections)
+        self._profiles = {}  # id -> profile, read-through
+        self._lock = threading.Lock()
+        self._ready = False  # table created
+
+    @classmethod
+    def from_env(cls) -> "JobStore":
+        return cls(os.environ.get("JOB_STORE_PATH") or DEFAULT_PATH)
+
+    def _drop_connections(self) -> None:
+        """In a forked child: open new connections rather than share the parent's."""
+        self._local = threading.local()
+
+    def _conn(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            if not self._ready:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            db = sqlite3.connect(self.path, timeout=5)
+            db.execute("PRAGMA journal_mode=WAL")
+            if not self._ready:
+                with db:
+                    db.execute(
+                        "CREATE TABLE IF NOT EXISTS jobs ("
+                        " id TEXT PRIMARY KEY, raw TEXT NOT NULL, norm TEXT NOT NULL,"
+                        " skills TEXT NOT NULL, embedding BLOB,"
+                        " taxonomy_version TEXT NOT NULL, model_version TEXT NOT NULL,"
+                        " created REAL NOT NULL, updated REAL NOT NULL)"
+                    )
+                self._ready = True
+            self._local.db = db
+        return db
+
+    @staticmethod
+    def _versions():
+        return get_taxonomy().version, MODEL_VERSION
+
+    def _write(self, job_id: str, profile: dict, created: float) -> dict:
+        now = time.time()
+        taxonomy_version, model_version = self._versions()
+        vec = profile.get("embedding")
+        with self._conn() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job_id, profile["raw"], profile["norm"],
+                    json.dumps(sorted(profile["skills"])),
+                    None if vec is None else np.asarray(vec, dtype=np.float32).tobytes(),
+                    taxonomy_version, model_version, created, now,
+                ),
+            )
+        profile = dict(profile, id=job_id, created=created, updated=now)
+        with self._lock:
+            self._profiles[job_id] = profile
+        return profile
+
+    def put(self, job_description: str, job_id: Optional[str] = None) -> dict:
+        """Create or replace a posting; returns its profile."""
+        job_id = job_id or uuid.uuid4().hex
+        row = self._conn().execute("SELECT created FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        created = row[0] if row else time.time()
+        return self._write(job_id, build_profile(job_description), created)
+
+    def get(self, job_id: str) -> Optional[dict]:
+        # other workers may have updated the row; the timestamp tells us
+        stamp = self._conn().execute("SELECT updated FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if stamp is None:
+            with self._lock:
+                self._profiles.pop(job_id, None)
+            return None
+        with self._lock:
+            profile = self._profiles.get(job_id)
+        if profile is not None and profile["updated"] == stamp[0]:
+            return profile
+
+        row = self._conn().execute(
+            "SELECT raw, norm, skills, embedding, taxonomy_version, model_version, created, updated"
+            " FROM jobs WHERE id = ?",
+            (job_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        raw, norm, skills, blob, taxonomy_version, model_version, created, updated = row
+
+        if (taxonomy_version, model_version) != self._versions():
+            return self._write(job_id, build_profile(raw), created)
+
+        profile = {
+            "id": job_id,
+            "raw": raw,
+            "norm": norm,
+            "skills": set(json.loads(skills)),
+            "embedding": None if blob is None else np.frombuffer(blob, dtype=np.float32),
+            "created": created,
+            "updated": updated,
+        }
+        with self._lock:
+            self._profiles[job_id] = profile
+        return profile
+
+    def delete(self, job_id: str) -> bool:
+        with self._conn() as db:
+            cur = db.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+        with self._lock:
+            self._profiles.pop(job_id, None)
+        return cur.rowcount > 0
+
+    def ids(self) -> List[str]:
+        return [r[0] for r in self._conn().execute("SELECT id FROM jobs ORDER BY created")]
+
+
+def describe(profile: dict) -> dict:
+    """Public (JSON) view of a stored posting."""
+    return {
+        "id": profile["id"],
+        "job_description": profile["raw"],
+        "skills": sorted(profile["skills"]),
+        "created": profile["created"],
+        "updated": profile["updated"],
+    }
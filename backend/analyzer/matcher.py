@@ -1,26 +1,202 @@
-from sentence_transformers import SentenceTransformer, util
+import logging
+import os
+
+import numpy as np
+
+from . import models
+from .batcher import EmbeddingBatcher
+from .embed_cache import EmbeddingCache
+from .extractor import find_section_headers
+from .skillset import get_vocab
+
+log = logging.getLogger(__name__)
+
+MODEL_NAME = models.EMBEDDER_NAME
+MODEL_ID = models.embedder_id(MODEL_NAME)  # name + EMBED_BACKEND; keys cached vectors
+
+# all-MiniLM-L6-v2 truncates at 256 tokens, so a whole resume encoded as
+# one string is mostly ignored. "sections"/"windows" score chunks instead.
+SEMANTIC_MODE = os.environ.get("SEMANTIC_MODE", "full")  # full | sections | windows
+SEMANTIC_AGG = os.environ.get("SEMANTIC_AGG", "max")  # max | mean | topk
+SEMANTIC_TOP_K = int(os.environ.get("SEMANTIC_TOP_K", "3"))
+WINDOW_WORDS = int(os.environ.get("SEMANTIC_WINDOW_WORDS", "160"))  # ~220 tokens
+
+# Anything that changes semantic scores; part of every result cache key
+MODEL_VERSION = f"{MODEL_ID}:{SEMANTIC_MODE}:{SEMANTIC_AGG}:{SEMANTIC_TOP_K}:{WINDOW_WORDS}"
+
 
-# Load once (cached)
-_model = None
 def get_model():
-    global _model
-    if _model is None:
-        _model = SentenceTransformer("all-MiniLM-L6-v2")
-    return _model
+    """Shared embedder from the model registry."""
+    return models.get_embedder(MODEL_NAME)
 
 
-def semantic_score(resume_text: str, jd_text: str) -> float:
+def _encode(texts):
+    return get_model().encode(texts, convert_to_numpy=True)
+
+
+# Opt-in micro-batching of concurrent encode calls (thread pool workers)
+EMBED_BATCH_WINDOW_MS = float(os.environ.get("EMBED_BATCH_WINDOW_MS", "0"))
+EMBED_BATCH_MAX = int(os.environ.get("EMBED_BATCH_MAX", "64"))
+
+_batcher = None
+def get_batcher():
+    """Shared EmbeddingBatcher, or None unless EMBED_BATCH_WINDOW_MS > 0."""
+    global _batcher
+    if _batcher is None and EMBED_BATCH_WINDOW_MS > 0:
+        _batcher = EmbeddingBatcher(_encode, EMBED_BATCH_WINDOW_MS, EMBED_BATCH_MAX, name=MODEL_ID)
+    return _batcher
+
+
+_cache = None
+def get_cache() -> EmbeddingCache:
     """
-    Compute semantic similarity between resume and JD (0..100).
+    Embedding cache around get_model().encode.
+    EMBED_CACHE_SIZE bounds the in-memory LRU (0 disables it);
+    EMBED_CACHE_DIR, if set, persists vectors across restarts, up to
+    about EMBED_CACHE_DISK_MAX files (0 = no limit).
+    Misses go through the batcher when one is configured.
+    """
+    global _cache
+    if _cache is None:
+        batcher = get_batcher()
+        _cache = EmbeddingCache(
+            batcher.encode if batcher is not None else _encode,
+            MODEL_ID,
+            max_items=int(os.environ.get("EMBED_CACHE_SIZE", "2048")),
+            disk_dir=os.environ.get("EMBED_CACHE_DIR") or None,
+            disk_max_items=int(os.environ.get("EMBED_CACHE_DISK_MAX", "100000")),
+        )
+    return _cache
+
+
+def embed(texts) -> np.ndarray:
+    """Encode texts through the cache; returns a (n, dim) float32 array."""
+    return get_cache().encode(list(texts))
+
+
+def _cosine(matrix: np.ndarray, vec: np.ndarray) -> np.ndarray:
+    denom = np.linalg.norm(matrix, axis=1) * np.linalg.norm(vec)
+    dots = matrix @ vec
+    return np.divide(dots, denom, out=np.zeros_like(dots), where=denom > 0)
+
+
+def _to_score(sim: float) -> float:
+    return round(max(0.0, min(1.0, float(sim))) * 100.0, 1)
+
+
+def _windows(text: str, size: int) -> list:
+    return _join_windows(text.split(), size)
+
+
+def _join_windows(words: list, size: int) -> list:
+    return [" ".join(words[i:i + size]) for i in range(0, len(words), size)]
+
+
+def chunk_text(text, mode: str = "sections", window_words: int = WINDOW_WORDS, headers: list = None) -> list:
+    """
+    Split a resume into chunks that fit the encoder.
+    "sections" cuts at section headers (text before the first header is
+    its own chunk) and windows any section that is still too long;
+    "windows" uses fixed-size word windows only. `headers` may pass in
+    find_section_headers(text) if the caller already has it. A
+    ParsedDocument brings its headers and word offsets along.
+    """
+    doc = None if isinstance(text, str) else text
+    if doc is not None:
+        text = doc.norm
+        if headers is None:
+            headers = doc.headers
+    if mode == "windows":
+        return _join_windows(list(doc.words), window_words) if doc else _windows(text, window_words)
+
+    if headers is None:
+        headers = find_section_headers(text)
+    cuts = [start for start, _ in headers]
+    bounds = [0] + cuts + [len(text)]
+    chunks = []
+    for start, end in zip(bounds, bounds[1:]):
+        if doc is not None:
+            chunks.extend(_join_windows(doc.words_between(start, end), window_words))
+        else:
+            chunks.extend(_windows(text[start:end], window_words))
+    return chunks
+
+
+def aggregate(sims: np.ndarray, agg: str = "max", k: int = SEMANTIC_TOP_K) -> float:
+    """Combine chunk-vs-JD similarities into one value."""
+    if not len(sims):
+        return 0.0
+    if agg == "mean":
+        return float(np.mean(sims))
+    if agg == "topk":
+        return float(np.mean(np.sort(sims)[-k:]))
+    return float(np.max(sims))
+
+
+def _text(text) -> str:
+    return text if isinstance(text, str) else text.norm
+
+
+def resume_chunks(text, mode: str = None, headers: list = None) -> list:
+    """
+    What semantic_scores() embeds for one resume (a string or a
+    ParsedDocument) in the given mode.
     """
-    if not resume_text.strip() or not jd_text.strip():
+    mode = mode or SEMANTIC_MODE
+    if not _text(text).strip():
+        return []
+    if mode == "full":
+        return [_text(text)]
+    return chunk_text(text, mode, headers=headers)
+
+
+def score_chunks(vectors: np.ndarray, jd_vec, agg: str = None) -> float:
+    """Score one resume (0..100) from its chunk embeddings."""
+    if not len(vectors):
         return 0.0
+    sims = _cosine(vectors, np.asarray(jd_vec, dtype=np.float32))
+    return _to_score(aggregate(sims, agg or SEMANTIC_AGG))
+
+
+def semantic_score(resume_text: str, jd_text: str, mode: str = None, agg: str = None) -> float:
+    """
+    Compute semantic similarity between resume and JD (0..100).
+    mode/agg default to SEMANTIC_MODE/SEMANTIC_AGG.
+    """
+    return semantic_scores([resume_text], jd_text, mode=mode, agg=agg)[0]
+
+
+def semantic_scores(resume_texts, jd_text: str, mode: str = None, agg: str = None, jd_vec=None) -> list:
+    """
+    Score many resumes (strings or ParsedDocuments) against one JD
+    (0..100 each). The JD and every uncached resume (or resume chunk) are
+    encoded in a single batch. Pass jd_vec to reuse a precomputed JD
+    embedding.
+    """
+    mode = mode or SEMANTIC_MODE
+    agg = agg or SEMANTIC_AGG
+    scores = [0.0] * len(resume_texts)
+    if not jd_text.strip():
+        return scores
+
+    todo = [i for i, t in enumerate(resume_texts) if _text(t).strip()]
+    if not todo:
+        return scores
 
-    m = get_model()
-    e1 = m.encode(resume_text, convert_to_tensor=True)
-    e2 = m.encode(jd_text, convert_to_tensor=True)
-    sim = float(util.cos_sim(e1, e2).item())
-    return round(max(0.0, min(1.0, sim)) * 100.0, 1)
+    chunks = [resume_chunks(resume_texts[i], mode) for i in todo]
+
+    texts = [c for cs in chunks for c in cs]
+    if jd_vec is None:
+        e = embed([jd_text] + texts)
+        jd_vec, e = e[0], e[1:]
+    else:
+        e = embed(texts)
+    sims = _cosine(e, np.asarray(jd_vec, dtype=np.float32))
+    offset = 0
+    for i, cs in zip(todo, chunks):
+        scores[i] = _to_score(aggregate(sims[offset:offset + len(cs)], agg))
+        offset += len(cs)
+    return scores
 
 
 def skill_scores(jd_skills, res_skills):
@@ -39,13 +215,33 @@ def skill_scores(jd_skills, res_skills):
 
     overlap = (len(matched) / len(jd_skills)) * 100 if jd_skills else 0.0
 
-    # Debug logging (optional)
-    print(f"[DEBUG matcher] JD skills={len(jd_skills)}, Resume skills={len(res_skills)}")
-    print(f"[DEBUG matcher] Matched={matched}, Missing={missing}, Overlap={overlap:.1f}%")
+    log.debug(
+        "jd_skills=%d resume_skills=%d matched=%s missing=%s overlap=%.1f%%",
+        len(jd_skills), len(res_skills), matched, missing, overlap,
+    )
 
     return overlap, matched, missing
 
 
+def skill_scores_batch(jd_skills, resume_skill_sets):
+    """
+    skill_scores() for one JD against many resumes, computed on packed
+    skill bitsets. Returns one (overlap %, matched, missing) per resume,
+    identical to calling skill_scores() pair by pair.
+    """
+    if not jd_skills:
+        return [(0.0, [], []) for _ in resume_skill_sets]
+
+    vocab = get_vocab()
+    names, hits = vocab.columns(vocab.encode_many(resume_skill_sets), jd_skills)
+    names = np.array(names, dtype=object)
+    overlaps = (hits.sum(axis=1) / len(names) * 100).tolist()
+    return [
+        (overlap, names[row].tolist(), names[~row].tolist())
+        for overlap, row in zip(overlaps, hits)
+    ]
+
+
 def blended_score(sem: float, skill_overlap: float, w_sem: float = 0.55) -> float:
     """
     Blend semantic + skill overlap for a realistic ATS-like score.
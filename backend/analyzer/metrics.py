@@ -0,0 +1,106 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List
+
+# Latency buckets in seconds (Prometheus convention)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Cumulative-bucket histogram with one label dimension."""
+
+    def __init__(self, name: str, help: str, label: str, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.label = label
+        self.buckets = tuple(buckets)
+        self._series: Dict[str, list] = {}  # label value -> [bucket counts..., sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, label_value: str, value: float) -> None:
+        with self._lock:
+            series = self._series.get(label_value)
+            if series is None:
+                series = self._series[label_value] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def snapshot(self) -> Dict[str, dict]:
+        with self._lock:
+            return {
+                k: {"buckets": list(v[:-2]), "sum": v[-2], "count": v[-1]}
+                for k, v in self._series.items()
+            }
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for value, s in sorted(self.snapshot().items()):
+            lbl = f'{self.label}="{value}"'
+            for bound, n in zip(self.buckets, s["buckets"]):
+                lines.append(f'{self.name}_bucket{{{lbl},le="{bound}"}} {n}')
+            lines.append(f'{self.name}_bucket{{{lbl},le="+Inf"}} {s["count"]}')
+            lines.append(f"{self.name}_sum{{{lbl}}} {s['sum']:.6f}")
+            lines.append(f"{self.name}_count{{{lbl}}} {s['count']}")
+        return lines
+
+
+class CallbackMetric:
+    """Gauge or counter whose value is read from a callback at scrape time."""
+
+    def __init__(self, name: str, help: str, kind: str, fn: Callable[[], float]):
+        self.name = name
+        self.help = help
+        self.kind = kind
+        self.fn = fn
+
+    def render(self) -> List[str]:
+        try:
+            value = float(self.fn())
+        except Exception:
+            return []
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}", f"{self.name} {value}"]
+
+
+STAGE_SECONDS = Histogram(
+    "analyzer_stage_seconds", "Time spent in each analysis stage.", "stage"
+)
+
+_registry: List = [STAGE_SECONDS]
+_registry_lock = threading.Lock()
+
+
+def register(metric) -> None:
+    with _registry_lock:
+        _registry[:] = [m for m in _registry if m.name != metric.name] + [metric]
+
+
+def gauge(name: str, help: str, fn: Callable[[], float]) -> None:
+    register(CallbackMetric(name, help, "gauge", fn))
+
+
+def counter(name: str, help: str, fn: Callable[[], float]) -> None:
+    register(CallbackMetric(name, help, "counter", fn))
+
+
+@contextmanager
+def timed(stage: str):
+    """Record the duration of the block under STAGE_SECONDS{stage=...}."""
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_SECONDS.observe(stage, time.perf_counter() - t0)
+
+
+def render() -> str:
+    """All registered metrics in the Prometheus text exposition format."""
+    with _registry_lock:
+        metrics: List = list(_registry)
+    lines: List[str] = []
+    for m in metrics:
+        lines.extend(m.render())
+    return "\n".join(lines) + "\n"
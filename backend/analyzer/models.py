@@ -0,0 +1,99 @@
+# Process-wide registry for heavy models. Every analyzer module gets its
+# models from here, so a process holds at most one copy of each.
+import os
+import threading
+
+EMBEDDER_NAME = os.environ.get("EMBEDDER_MODEL", "all-MiniLM-L6-v2")  # hub name or local path
+SPACY_NAME = "en_core_web_sm"
+# Components the skill extractor never reads. noun_chunks needs the tagger,
+# attribute_ruler and parser; stop words are a lexical attribute.
+SPACY_EXCLUDE = ("ner", "lemmatizer")
+
+# How the embedder runs on CPU:
+#   torch      full-precision PyTorch (default)
+#   int8       PyTorch with dynamically quantized int8 Linear layers
+#   onnx       ONNX Runtime export (pip install -r requirements-onnx.txt)
+#   onnx-int8  ONNX Runtime, int8-quantized export from the model repo
+EMBED_BACKENDS = ("torch", "int8", "onnx", "onnx-int8")
+EMBED_BACKEND = os.environ.get("EMBED_BACKEND", "torch")
+EMBED_ONNX_INT8_FILE = os.environ.get("EMBED_ONNX_INT8_FILE", "onnx/model_quint8_avx2.onnx")
+
+_models = {}
+_lock = threading.Lock()
+_ready = threading.Event()
+
+
+def _get(key, loader):
+    model = _models.get(key)
+    if model is None:
+        with _lock:
+            model = _models.get(key)
+            if model is None:
+                model = loader()
+                _models[key] = model
+    return model
+
+
+def embedder_id(name: str = EMBEDDER_NAME, backend: str = None) -> str:
+    """Model name plus backend; vectors differ slightly between backends."""
+    backend = backend or EMBED_BACKEND
+    return name if backend == "torch" else f"{name}+{backend}"
+
+
+def _load_embedder(name: str, backend: str):
+    from sentence_transformers import SentenceTransformer
+
+    if backend == "torch":
+        return SentenceTransformer(name)
+    if backend == "int8":
+        import torch
+        model = SentenceTransformer(name, device="cpu")
+        # int8 weights for every Linear layer; activations are quantized per batch
+        return torch.ao.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+        )
+    if backend == "onnx":
+        return SentenceTransformer(name, backend="onnx")
+    return SentenceTransformer(name, backend="onnx", model_kwargs={"file_name": EMBED_ONNX_INT8_FILE})
+
+
+def get_embedder(name: str = EMBEDDER_NAME, backend: str = None):
+    """Shared SentenceTransformer instance for the given (or configured) backend."""
+    backend = backend or EMBED_BACKEND
+    if backend not in EMBED_BACKENDS:
+        raise ValueError(f"Unknown EMBED_BACKEND: {backend} (expected one of {', '.join(EMBED_BACKENDS)})")
+    kind = "sentence-transformer" if backend == "torch" else f"sentence-transformer/{backend}"
+    return _get((kind, name), lambda: _load_embedder(name, backend))
+
+
+def get_spacy(name: str = SPACY_NAME, exclude: tuple = SPACY_EXCLUDE):
+    """Shared spaCy pipeline, loaded without the `exclude` components."""
+    def load():
+        import spacy
+        return spacy.load(name, exclude=list(exclude))
+    kind = f"spacy[-{','.join(exclude)}]" if exclude else "spacy"
+    return _get((kind, name), load)
+
+
+def loaded() -> list:
+    return sorted(f"{kind}:{name}" for kind, name in _models)
+
+
+def warm_up(spacy_model: bool = False) -> None:
+    """
+    Load the models and run one dummy inference so the first real
+    request doesn't pay for weight loading or lazy kernel setup.
+    """
+    get_embedder().encode(["warm-up: python developer with react experience"])
+    if spacy_model:
+        get_spacy()("warm-up: python developer with react experience")
+    _ready.set()
+
+
+def mark_ready() -> None:
+    """Report ready without loading anything (models load on first use)."""
+    _ready.set()
+
+
+def is_ready() -> bool:
+    return _ready.is_set()
@@ -0,0 +1,198 @@
+import hashlib
+import logging
+from typing import Dict, List, Tuple
+
+from .document import ParsedDocument
+from .extractor import Source, extract_text_bytes, normalize, guess_sections, source_size
+from .skills import find_skills, fuzzy_fill, get_taxonomy
+from .matcher import semantic_scores, skill_scores, skill_scores_batch, blended_score, MODEL_VERSION
+from .advisor import hints_from_signals, quality_hints
+from .result_cache import make_key
+from .metrics import timed
+
+log = logging.getLogger(__name__)
+
+# Bump when scoring/suggestion logic changes so cached results go stale
+PIPELINE_VERSION = "2"
+
+
+def pct(n: float) -> float:
+    """Clamp to [0, 100] and round to 1 decimal."""
+    try:
+        return round(max(0.0, min(100.0, float(n))), 1)
+    except Exception:
+        return 0.0
+
+
+def prepare_jd(job_description: str) -> dict:
+    """
+    Everything the JD side needs, computed once per job description.
+    """
+    with timed("normalize"):
+        doc = ParsedDocument.parse(job_description)
+    with timed("skills_exact"):
+        skills = set(find_skills(doc) or [])
+    return {
+        "raw": doc.raw,
+        "norm": doc.norm,
+        "skills": skills,
+    }
+
+
+def prepare_resume(filename: str, data: Source) -> dict:
+    """
+    Extract, normalize and skill-tag one uploaded resume. "doc" is the
+    ParsedDocument the later stages read from.
+    """
+    with timed("extract"):
+        raw = extract_text_bytes(filename, data)
+    with timed("normalize"):
+        doc = ParsedDocument.parse(raw)
+    with timed("sections"):
+        sections = guess_sections(doc) or {}
+
+    return {
+        "filename": filename,
+        "raw": raw,
+        "norm": doc.norm,
+        "doc": doc,
+        "sections": sections,
+        "skills": resume_skills(doc),
+    }
+
+
+def resume_skills(norm) -> set:
+    """
+    Skills (exact + fuzzy only on resume side) of normalized resume text
+    or a ParsedDocument.
+    """
+    with timed("skills_exact"):
+        exact = set(find_skills(norm) or [])
+    with timed("skills_fuzzy"):
+        fuzzy = set(fuzzy_fill(norm, threshold=95) or [])
+    return exact.union(fuzzy)
+
+
+def build_result(resume: dict, jd: dict, sem: float, skills: tuple = None) -> dict:
+    """
+    Turn prepared resume/JD profiles plus a semantic score into the
+    /analyze response schema. `skills` is a precomputed skill_scores()
+    tuple (see analyze_batch); resume["signals"], if present, holds the
+    advisor counters (see analyzer.sessions).
+    """
+    jd_skills = jd["skills"]
+    res_skills = resume["skills"]
+    sections = resume["sections"]
+
+    if skills is None:
+        skills = skill_scores(jd_skills, res_skills) if jd["norm"] else (0.0, [], list(jd_skills))
+    overlap, matched, missing = skills
+    ats = blended_score(sem, overlap, w_sem=0.55)
+
+    with timed("advice"):
+        if resume.get("signals") is not None:
+            suggestions = hints_from_signals(resume["signals"], list(missing))
+        else:
+            suggestions = quality_hints(resume.get("doc") or resume["norm"], sections, list(missing))
+
+    return {
+        "filename": resume["filename"],
+        "ats_score": pct(ats),
+        "semantic_score": pct(sem),
+        "skill_overlap": pct(overlap),
+        "matched_skills": sorted(list(set(matched))),
+        "missing_skills": sorted(list(set(missing))),
+        "sections_present": sorted(list(sections.keys())),
+        "suggestions": suggestions,
+        "has_job_description": bool(jd["raw"].strip()),
+        "debug": {
+            "jd_skills": list(jd_skills),
+            "resume_skills": list(res_skills),
+        },
+    }
+
+
+def _sha256(data: Source) -> str:
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(data).hexdigest()
+    h = hashlib.sha256()
+    data.seek(0)
+    for chunk in iter(lambda: data.read(1 << 16), b""):
+        h.update(chunk)
+    return h.hexdigest()
+
+
+def result_key(data: Source, job_description: str) -> str:
+    """
+    Cache key for one /analyze call: file bytes, normalized JD, and the
+    taxonomy/model/pipeline versions, so stale entries simply miss.
+    """
+    return make_key(
+        _sha256(data),
+        hashlib.sha256(normalize(job_description or "").encode("utf-8")).hexdigest(),
+        get_taxonomy().version,
+        MODEL_VERSION,
+        PIPELINE_VERSION,
+    )
+
+
+def analyze_document(filename: str, data: Source, job_description: str = "", jd: dict = None) -> dict:
+    """
+    Full pipeline for one resume against one JD. Pass a stored JD profile
+    as `jd` (see analyzer.jobs) to skip all JD-side work.
+    """
+    if jd is None:
+        jd = prepare_jd(job_description)
+    resume = prepare_resume(filename, data)
+
+    log.debug(
+        "file=%s size=%d resume_chars=%d jd_chars=%d jd_skills=%s resume_skills=%s",
+        filename, source_size(data), len(resume["raw"]), len(jd["raw"]), jd["skills"], resume["skills"],
+    )
+
+    return score_resume(resume, jd)
+
+
+def score_resume(resume: dict, jd: dict) -> dict:
+    """/analyze result for a prepare_resume() output against one JD profile."""
+    with timed("embedding"):
+        sem = (
+            semantic_scores([resume["doc"]], jd["norm"], jd_vec=jd.get("embedding"))[0]
+            if jd["norm"] else 0.0
+        )
+    return build_result(resume, jd, sem)
+
+
+def analyze_batch(
+    files: List[Tuple[str, Source]],
+    job_description: str = "",
+    jd: dict = None,
+) -> Tuple[List[dict], List[Dict[str, str]]]:
+    """
+    Many resumes against one JD. The JD is prepared once (or taken from a
+    stored profile) and every resume is embedded in a single batch.
+    Returns (results ranked by ATS score, per-file errors).
+    """
+    if jd is None:
+        jd = prepare_jd(job_description)
+
+    resumes, errors = [], []
+    for filename, data in files:
+        try:
+            resumes.append(prepare_resume(filename, data))
+        except Exception as e:
+            errors.append({"filename": filename, "error": str(e)})
+
+    with timed("embedding"):
+        sems = (
+            semantic_scores([r["doc"] for r in resumes], jd["norm"], jd_vec=jd.get("embedding"))
+            if jd["norm"] else [0.0] * len(resumes)
+        )
+    with timed("skill_overlap"):
+        skills = (
+            skill_scores_batch(jd["skills"], [r["skills"] for r in resumes])
+            if jd["norm"] else [(0.0, [], list(jd["skills"]))] * len(resumes)
+        )
+    results = [build_result(r, jd, s, k) for r, s, k in zip(resumes, sems, skills)]
+    results.sort(key=lambda r: (-r["ats_score"], r["filename"] or ""))
+    return results, errors
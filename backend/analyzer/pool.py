@@ -0,0 +1,136 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Optional
+
+
+class PoolFull(Exception):
+    """Raised when every worker is busy and the wait queue is full."""
+
+
+class BoundedPool:
+    """
+    Executor for CPU-bound analysis with a bounded queue.
+
+    At most `workers` jobs run at once and at most `queue_size` more may
+    wait; anything beyond that is rejected straight away with PoolFull so
+    the caller can shed load instead of piling up requests.
+    """
+
+    def __init__(
+        self,
+        kind: str = "thread",
+        workers: Optional[int] = None,
+        queue_size: int = 16,
+        initializer: Optional[Callable] = None,
+    ):
+        if kind not in {"thread", "process"}:
+            raise ValueError(f"Unknown pool kind: {kind}")
+        self.kind = kind
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.queue_size = max(0, queue_size)
+        self.initializer = initializer
+        self._slots = threading.BoundedSemaphore(self.workers + self.queue_size)
+        self._lock = threading.Lock()
+        self._executor = None
+        self._local_executor = None
+        self.in_flight = 0
+        self.rejected = 0
+
+    @classmethod
+    def from_env(cls, initializer: Optional[Callable] = None) -> "BoundedPool":
+        """ANALYZER_POOL (thread|process), ANALYZER_WORKERS, ANALYZER_QUEUE."""
+        return cls(
+            kind=os.environ.get("ANALYZER_POOL", "thread"),
+            workers=int(os.environ.get("ANALYZER_WORKERS", "0")) or None,
+            queue_size=int(os.environ.get("ANALYZER_QUEUE", "16")),
+            initializer=initializer,
+        )
+
+    def _get_executor(self):
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    if self.kind == "process":
+                        self._executor = ProcessPoolExecutor(
+                            max_workers=self.workers, initializer=self.initializer
+                        )
+                    else:
+                        self._executor = ThreadPoolExecutor(
+                            max_workers=self.workers,
+                            thread_name_prefix="analyzer",
+                            initializer=self.initializer,
+                        )
+        return self._executor
+
+    def _get_local_executor(self):
+        if self.kind == "thread":
+            return self._get_executor()
+        if self._local_executor is None:
+            with self._lock:
+                if self._local_executor is None:
+                    self._local_executor = ThreadPoolExecutor(
+                        max_workers=self.workers, thread_name_prefix="analyzer-local"
+                    )
+        return self._local_executor
+
+    def _release(self, _future=None) -> None:
+        with self._lock:
+            self.in_flight -= 1
+        self._slots.release()
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        return self._submit(self._get_executor, fn, args, kwargs)
+
+    def submit_local(self, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Like submit(), but always on a thread of this process, for work on
+        in-process state (editing sessions, the stores) that cannot be
+        sent to a worker process. It shares the same slots, so it is
+        rejected with PoolFull in the same way.
+        """
+        return self._submit(self._get_local_executor, fn, args, kwargs)
+
+    def _submit(self, get_executor: Callable, fn: Callable, args: tuple, kwargs: dict) -> Future:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise PoolFull("Analyzer is at capacity, try again shortly.")
+        with self._lock:
+            self.in_flight += 1
+        try:
+            future = get_executor().submit(fn, *args, **kwargs)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+        return future
+
+    async def run(self, fn: Callable, *args, **kwargs):
+        """Await fn(*args, **kwargs) on the pool without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    async def run_local(self, fn: Callable, *args, **kwargs):
+        """Await fn(*args, **kwargs) via submit_local()."""
+        return await asyncio.wrap_future(self.submit_local(fn, *args, **kwargs))
+
+    def stats(self) -> dict:
+        with self._lock:
+            in_flight = self.in_flight
+            rejected = self.rejected
+        return {
+            "kind": self.kind,
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "running": min(in_flight, self.workers),
+            "queued": max(0, in_flight - self.workers),
+            "rejected": rejected,
+        }
+
+    def shutdown(self) -> None:
+        for name in ("_executor", "_local_executor"):
+            executor = getattr(self, name)
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+                setattr(self, name, None)
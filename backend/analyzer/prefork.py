@@ -0,0 +1,104 @@
+import gc
+import logging
+import os
+import signal
+import time
+from typing import Callable, Dict, Optional
+
+log = logging.getLogger(__name__)
+
+RESPAWN_DELAY = 1.0  # seconds before a worker that died is replaced
+
+
+def _set_torch_threads(n: int) -> None:
+    try:
+        import torch
+    except ImportError:
+        return
+    torch.set_num_threads(max(1, n))
+
+
+def serve(
+    app,
+    host: str = "0.0.0.0",
+    port: int = 8000,
+    workers: int = 1,
+    preload: Optional[Callable[[], None]] = None,
+    threads: int = 0,
+    **uvicorn_options,
+) -> None:
+    """
+    Run `app` in `workers` forked uvicorn processes that share what
+    `preload` loaded in the parent (models, taxonomy).
+
+    The parent loads everything, binds the listening socket and then
+    forks, so model weights are copy-on-write pages that every worker
+    reads but none copies. gc.freeze() keeps the collector from writing
+    to the preloaded objects' headers, which would un-share their pages.
+    The parent runs its warm-up on one torch thread so no OpenMP team
+    exists at fork time; each worker then uses `threads` torch threads
+    (default: CPUs / workers). The parent supervises: a worker that dies
+    is replaced, SIGINT/SIGTERM stop them all.
+    """
+    import uvicorn
+
+    # HF tokenizers' thread pool does not survive fork
+    os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+    threads = threads or max(1, (os.cpu_count() or 1) // max(1, workers))
+    if preload is not None:
+        _set_torch_threads(1)
+        preload()
+
+    config = uvicorn.Config(app, host=host, port=port, **uvicorn_options)
+    sock = config.bind_socket()
+    gc.collect()
+    gc.freeze()
+
+    children: Dict[int, int] = {}  # pid -> worker number
+    stopping = False
+
+    def spawn(number: int) -> None:
+        pid = os.fork()
+        if pid:
+            children[pid] = number
+            return
+        code = 1
+        try:
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            _set_torch_threads(threads)
+            uvicorn.Server(config).run(sockets=[sock])
+            code = 0
+        except BaseException:
+            log.exception("Worker %d crashed", number)
+        finally:
+            os._exit(code)
+
+    def stop(signum, frame) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+    for number in range(workers):
+        spawn(number)
+    log.info("Serving on %s:%d with %d preforked workers (pid %d)", host, port, workers, os.getpid())
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        number = children.pop(pid, None)
+        if number is None or stopping:
+            continue
+        log.warning("Worker %d (pid %d) exited with %s; restarting", number, pid, os.waitstatus_to_exitcode(status))
+        time.sleep(RESPAWN_DELAY)
+        if not stopping:
+            spawn(number)
+    sock.close()
@@ -0,0 +1,162 @@
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+
+def make_key(*parts: str) -> str:
+    h = hashlib.sha256()
+    for p in parts:
+        h.update(p.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class MemoryBackend:
+    """In-process LRU with a TTL; entries are stored as JSON strings."""
+
+    def __init__(self, max_items: int = 1024, ttl: float = 86400):
+        self.max_items = max_items
+        self.ttl = ttl
+        self._items: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires < time.time():
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: str) -> None:
+        with self._lock:
+            self._items[key] = (time.time() + self.ttl, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class SQLiteBackend:
+    """
+    Local SQLite file, so every worker process on the host shares entries.
+    Expired rows are dropped on write; past max_items the least recently
+    used rows go first.
+    """
+
+    def __init__(self, path: str, max_items: int = 10000, ttl: float = 86400):
+        self.path = path
+        self.max_items = max_items
+        self.ttl = ttl
+        self._local = threading.local()
+        os.register_at_fork(after_in_child=self._drop_connections)
+        with self._conn() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+                " created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results(accessed)")
+
+    def _drop_connections(self) -> None:
+        """In a forked child: open new connections rather than share the parent's."""
+        self._local = threading.local()
+
+    def _conn(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=5)
+            db.execute("PRAGMA journal_mode=WAL")
+            self._local.db = db
+        return db
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        db = self._conn()
+        row = db.execute(
+            "SELECT value FROM results WHERE key = ? AND created > ?",
+            (key, now - self.ttl),
+        ).fetchone()
+        if row is None:
+            return None
+        with db:
+            db.execute("UPDATE results SET accessed = ? WHERE key = ?", (now, key))
+        return row[0]
+
+    def put(self, key: str, value: str) -> None:
+        now = time.time()
+        with self._conn() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO results (key, value, created, accessed) VALUES (?, ?, ?, ?)",
+                (key, value, now, now),
+            )
+            db.execute("DELETE FROM results WHERE created <= ?", (now - self.ttl,))
+            db.execute(
+                "DELETE FROM results WHERE key IN ("
+                " SELECT key FROM results ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.max_items,),
+            )
+
+    def __len__(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+
+class ResultCache:
+    """Whole-response cache with hit/miss counters."""
+
+    def __init__(self, backend=None):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> "ResultCache":
+        """
+        RESULT_CACHE: memory (default) | sqlite | off
+        RESULT_CACHE_PATH, RESULT_CACHE_TTL (seconds), RESULT_CACHE_MAX (entries)
+        """
+        kind = os.environ.get("RESULT_CACHE", "memory")
+        ttl = float(os.environ.get("RESULT_CACHE_TTL", "86400"))
+        max_items = int(os.environ.get("RESULT_CACHE_MAX", "1024"))
+        if kind == "sqlite":
+            path = os.environ.get("RESULT_CACHE_PATH") or os.path.join(
+                tempfile.gettempdir(), "talentalign-results.sqlite3"
+            )
+            return cls(SQLiteBackend(path, max_items=max_items, ttl=ttl))
+        if kind == "memory":
+            return cls(MemoryBackend(max_items=max_items, ttl=ttl))
+        return cls(None)
+
+    def get(self, key: str) -> Optional[dict]:
+        if self.backend is None:
+            return None
+        value = self.backend.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(value)
+
+    def put(self, key: str, result: dict) -> None:
+        if self.backend is not None:
+            self.backend.put(key, json.dumps(result))
+
+    def stats(self) -> dict:
+        return {
+            "backend": type(self.backend).__name__ if self.backend else None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self.backend) if self.backend is not None else 0,
+        }
@@ -0,0 +1,179 @@
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .advisor import count_signals, merge_signals
+from .document import ParsedDocument
+from .heuristics import RULES
+from .matcher import embed, get_model, resume_chunks, score_chunks
+from .metrics import timed
+from .pipeline import build_result, resume_skills
+
+
+def split_segments(norm: str, headers: list) -> list:
+    """
+    Cut normalized text at section headers that follow a space, so no
+    word, skill token or number straddles a cut. "".join() of the
+    segments is the text again.
+    """
+    cuts = sorted({start for start, _ in headers if start > 0 and norm[start - 1] == " "})
+    bounds = [0] + cuts + [len(norm)]
+    return [norm[a:b] for a, b in zip(bounds, bounds[1:])]
+
+
+def seam(norm: str, cut: int, words: int) -> str:
+    """The `words` words on either side of a split_segments() cut."""
+    start, end = cut - 1, cut
+    for _ in range(words):
+        start = norm.rfind(" ", 0, start) if start > 0 else -1
+        nxt = norm.find(" ", end + 1)
+        end = len(norm) if nxt < 0 else nxt
+    return norm[start + 1:end]
+
+
+def chunk_keys(chunks: list) -> list:
+    """
+    Keys for the session's vector memo. The encoder only reads the first
+    max_seq_length tokens of a chunk, so chunks whose token ids agree up
+    to there get the same vector and an edit past that point (common in
+    "full" mode) needs no encoding at all.
+    """
+    model = get_model()
+    tokenizer = getattr(model, "tokenizer", None)
+    limit = getattr(model, "max_seq_length", None)
+    if tokenizer is None or not limit or not chunks:
+        return list(chunks)
+    ids = tokenizer([c.strip() for c in chunks], truncation=True, max_length=limit)["input_ids"]
+    return [tuple(i) for i in ids]
+
+
+class Session:
+    """
+    One resume being edited against one JD profile (see jobs.build_profile).
+
+    Keeps what the last analysis computed per segment (skills, advisor
+    counters) and per embedded chunk, so an update only redoes the parts
+    whose text changed. Results equal a fresh analysis of the same text.
+    """
+
+    def __init__(self, jd: dict, filename: Optional[str] = None):
+        self.jd = jd
+        self.filename = filename
+        self.segments = {}  # segment text -> {"skills": set, "signals": dict}
+        self.vectors = {}  # chunk_keys() key -> embedding
+        self.lock = threading.Lock()
+
+    def update(self, raw: str) -> dict:
+        with self.lock:
+            return self._update(raw)
+
+    def _update(self, raw: str) -> dict:
+        with timed("normalize"):
+            doc = ParsedDocument.parse(raw)
+            norm = doc.norm
+        with timed("sections"):
+            headers = doc.headers
+            sections = doc.sections
+
+        # one entry per segment position; a block the resume repeats counts
+        # twice, the dict only saves recomputing it
+        memo, entries, redone = {}, [], 0
+        pieces = split_segments(norm, headers)
+        for seg in pieces:
+            entry = memo.get(seg) or self.segments.get(seg)
+            if entry is None:
+                entry = {"skills": resume_skills(seg), "signals": count_signals(seg)}
+                redone += 1
+            memo[seg] = entry
+            entries.append(entry)
+        self.segments = memo
+
+        signals = merge_signals([e["signals"] for e in entries])
+        # a phrase heading may span a cut
+        cut = 0
+        for seg in pieces[:-1]:
+            cut += len(seg)
+            signals["headings"] |= count_signals(seam(norm, cut, RULES.max_words - 1))["headings"]
+        skills = set().union(*(e["skills"] for e in entries))
+
+        jd, sem, embedded = self.jd, 0.0, 0
+        if jd["norm"]:
+            chunks = resume_chunks(doc)
+            with timed("embedding"):
+                keys = chunk_keys(chunks)
+                new = {k: c for k, c in zip(keys, chunks) if k not in self.vectors}
+                if new:
+                    self.vectors.update(zip(new, embed(list(new.values()))))
+                    embedded = len(new)
+                self.vectors = {k: self.vectors[k] for k in keys}
+                vecs = np.stack([self.vectors[k] for k in keys]) if keys else np.zeros((0, 1))
+                sem = score_chunks(vecs, jd["embedding"]) if jd.get("embedding") is not None else 0.0
+
+        resume = {
+            "filename": self.filename,
+            "raw": raw,
+            "norm": norm,
+            "doc": doc,
+            "sections": sections,
+            "skills": skills,
+            "signals": signals,
+        }
+        result = build_result(resume, jd, sem)
+        result["session"] = {
+            "segments": len(entries),
+            "segments_recomputed": redone,
+            "chunks_embedded": embedded,
+        }
+        return result
+
+
+class SessionStore:
+    """In-process LRU of editing sessions with an idle timeout."""
+
+    def __init__(self, max_items: int = 1000, ttl: float = 1800):
+        self.max_items = max_items
+        self.ttl = ttl
+        self._items: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "SessionStore":
+        """SESSION_MAX sessions kept; SESSION_TTL seconds idle before expiry."""
+        return cls(
+            max_items=int(os.environ.get("SESSION_MAX", "1000")),
+            ttl=float(os.environ.get("SESSION_TTL", "1800")),
+        )
+
+    def create(self, jd: dict, filename: Optional[str] = None) -> Tuple[str, Session]:
+        session_id = uuid.uuid4().hex
+        session = Session(jd, filename)
+        with self._lock:
+            self._items[session_id] = (time.time() + self.ttl, session)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+        return session_id, session
+
+    def get(self, session_id: str) -> Optional[Session]:
+        with self._lock:
+            item = self._items.get(session_id)
+            if item is None:
+                return None
+            expires, session = item
+            if expires < time.time():
+                del self._items[session_id]
+                return None
+            self._items[session_id] = (time.time() + self.ttl, session)
+            self._items.move_to_end(session_id)
+            return session
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            return self._items.pop(session_id, None) is not None
+
+    def __len__(self) -> int:
+        return len(self._items)
@@ -1,60 +1,49 @@
-import json, re, os
-from rapidfuzz import fuzz
+import re, threading
+from rapidfuzz import fuzz, process
+
+from . import taxonomy as _taxonomy
+from .taxonomy import generate_variants  # noqa: F401 -- re-exported, it used to live here
+
+DATA_PATH = _taxonomy.JSON_PATH
+
+# The compiled taxonomy (aliases, automaton, fuzzy index) loads on first
+# use from a prebuilt artifact; see analyzer/taxonomy.py.
+_compiled = None
+_compiled_lock = threading.Lock()
+
+def get_taxonomy() -> _taxonomy.CompiledTaxonomy:
+    global _compiled
+    if _compiled is None:
+        with _compiled_lock:
+            if _compiled is None:
+                _compiled = _taxonomy.load(DATA_PATH)
+    return _compiled
+
+
+# Old module-level names, resolved lazily so importing stays cheap
+_LAZY = {
+    "TAXONOMY": "taxonomy",
+    "TAXONOMY_VERSION": "version",
+    "ALIASES": "aliases",
+    "MATCHER": "matcher",
+    "FUZZY_INDEX": "fuzzy_index",
+}
 
-DATA_PATH = os.path.join(
-    os.path.dirname(os.path.dirname(__file__)),
-    "data",
-    "skills_taxonomy.json"
-)
+def __getattr__(name):
+    if name in _LAZY:
+        return getattr(get_taxonomy(), _LAZY[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-with open(DATA_PATH, "r", encoding="utf-8") as f:
-    TAXONOMY = json.load(f)
+_WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
 
-def generate_variants(alias: str) -> set[str]:
-    """
-    Generate common textual variants for a given alias:
-    - dot/space/dash interchanges
-    - remove dots (e.g., node.js → nodejs)
-    - add space before suffixes like 'js'
-    """
-    alias = alias.lower()
-    variants = {alias}
-
-    # normalize separators
-    base = alias.replace(".", " ").replace("-", " ").strip()
-    variants.add(base)
-
-    # compress spaces
-    variants.add(base.replace(" ", ""))  # node js → nodejs
-    variants.add(base.replace(" ", "."))  # node js → node.js
-    variants.add(base.replace(" ", "-"))  # node js → node-js
-
-    # special: js suffix
-    if base.endswith("js") and not base.endswith(".js"):
-        variants.add(base.replace("js", ".js"))
-        variants.add(base.replace("js", " js"))
-
-    return {v for v in variants if v}
-
-
-# --- Build ALIASES dynamically ---
-ALIASES = {}
-for canon, aliases in TAXONOMY.items():
-    canon_lc = canon.lower()
-    for variant in generate_variants(canon_lc):
-        ALIASES[variant] = canon
-    for a in aliases:
-        for variant in generate_variants(a):
-            ALIASES[variant] = canon
-
-# Regex patterns
-PATTERNS = {
-    alias: re.compile(
-        rf"(?<![a-z0-9]){re.escape(alias)}(?![a-z0-9])",
-        re.IGNORECASE,
-    )
-    for alias in ALIASES.keys()
-}
+
+def _is_whole_word(text: str, start: int, end: int) -> bool:
+    """Same boundary rule as (?<![a-z0-9])alias(?![a-z0-9])."""
+    if start > 0 and text[start - 1] in _WORD_CHARS:
+        return False
+    if end < len(text) and text[end] in _WORD_CHARS:
+        return False
+    return True
 
 def normalize_text(text: str) -> str:
     text = text.lower()
@@ -64,34 +53,85 @@ def normalize_text(text: str) -> str:
     return text
 
 
-def find_skills(text: str) -> set[str]:
+def _skill_text(text) -> str:
+    """normalize_text(text), or the copy a ParsedDocument already holds."""
+    return normalize_text(text) if isinstance(text, str) else text.skill_text
+
+
+def find_skill_spans(text) -> dict[str, list[tuple[int, int]]]:
+    """
+    Exact skill matching with offsets.
+    Returns {canonical: [(start, end), ...]}; offsets index into
+    normalize_text(text), which is what the matcher scans. `text` may be
+    a string or a ParsedDocument.
+    """
+    text = _skill_text(text)
+    tax = get_taxonomy()
+    aliases, matcher = tax.aliases, tax.matcher
+    spans: dict[str, list[tuple[int, int]]] = {}
+    patterns = matcher.patterns
+    for start, end, idx in matcher.iter_matches(text):
+        if _is_whole_word(text, start, end):
+            canon = aliases[patterns[idx]]
+            spans.setdefault(canon, []).append((start, end))
+    return spans
+
+
+def find_skills(text) -> set[str]:
     """
-    Exact/regex-based skill matching.
+    Exact skill matching (single pass over the text).
     """
-    text = normalize_text(text)
+    return set(find_skill_spans(text))
+
+
+def _lengths_can_match(a: int, b: int, threshold: float) -> bool:
+    # fuzz.ratio = 100 * (1 - indel / (a + b)) and indel >= |a - b|,
+    # so the best possible ratio for these lengths is 200 * min / (a + b)
+    return 200.0 * min(a, b) / (a + b) >= threshold - 1e-9
+
+
+def _fuzzy_match(tokens: set[str], index: dict, threshold: int) -> set[str]:
+    if not tokens:
+        return set()
+
+    by_len: dict[int, list[str]] = {}
+    for w in tokens:
+        by_len.setdefault(len(w), []).append(w)
+
     found = set()
-    for alias, pat in PATTERNS.items():
-        if pat.search(text):
-            found.add(ALIASES[alias])  # map to canonical
+    for t_len, words in by_len.items():
+        names, canons = [], []
+        for a_len, (bucket_names, bucket_canons) in index.items():
+            if not _lengths_can_match(a_len, t_len, threshold):
+                continue
+            for alias, canon in zip(bucket_names, bucket_canons):
+                if canon not in found:
+                    names.append(alias)
+                    canons.append(canon)
+        if not names:
+            continue
+
+        if threshold <= 0:
+            found.update(canons)
+            continue
+
+        # one C-level batch per token length; pairs under the cutoff score 0
+        scores = process.cdist(names, words, scorer=fuzz.ratio, score_cutoff=threshold)
+        for i in scores.any(axis=1).nonzero()[0]:
+            found.add(canons[i])
     return found
 
 
-def fuzzy_fill(text: str, threshold: int = 92, max_hits: int = 3) -> set[str]:
+def fuzzy_fill(text, threshold: int = 92, max_hits: int = 3) -> set[str]:
     """
     Conservative fuzzy fallback for skills missed by regex.
+    Only alias/token pairs whose lengths can reach `threshold` are scored.
+    `max_hits` is kept for compatibility; a canonical skill is reported on
+    its first hit, so it never changes the result. `text` may be a string
+    or a ParsedDocument.
     """
-    text = normalize_text(text)
-    tokens = set(re.findall(r"[a-z0-9\.\+#\-]{3,}", text))
-    found = set()
-
-    for alias, canon in ALIASES.items():
-        if len(alias) < 4:  # skip too-short aliases like "js"
-            continue
-        matches = 0
-        for w in tokens:
-            if fuzz.ratio(alias, w) >= threshold:
-                found.add(canon)
-                matches += 1
-                if matches >= max_hits:
-                    break
-    return found
+    if isinstance(text, str):
+        tokens = set(re.findall(r"[a-z0-9\.\+#\-]{3,}", normalize_text(text)))
+    else:
+        tokens = set(text.skill_tokens)
+    return _fuzzy_match(tokens, get_taxonomy().fuzzy_index, threshold)
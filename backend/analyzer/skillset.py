@@ -0,0 +1,92 @@
+import threading
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .skills import get_taxonomy
+
+
+class SkillVocab:
+    """
+    Canonical skill <-> integer id, with skill sets stored as packed
+    bitsets (one bit per skill, little-endian within each byte).
+
+    Ids start out as the taxonomy's canonical names in sorted order. Names
+    outside it (e.g. skills stored under an older taxonomy) get new ids on
+    first sight, so ids are stable for the life of the process but are not
+    meant to be persisted.
+    """
+
+    def __init__(self, names: Iterable[str] = ()):
+        self.names: List[str] = sorted(set(names))
+        self.ids = {n: i for i, n in enumerate(self.names)}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def width(self) -> int:
+        """Bytes per packed row."""
+        return (len(self.names) + 7) // 8
+
+    def id(self, name: str) -> int:
+        i = self.ids.get(name)
+        if i is None:
+            with self._lock:
+                i = self.ids.get(name)
+                if i is None:
+                    i = len(self.names)
+                    self.names.append(name)
+                    self.ids[name] = i
+        return i
+
+    def encode_many(self, skill_sets: Sequence[Iterable[str]], width: Optional[int] = None) -> np.ndarray:
+        """(n, width) uint8 matrix, one packed bitset per skill set."""
+        rows, cols = [], []
+        for r, skills in enumerate(skill_sets):
+            for s in skills:
+                rows.append(r)
+                cols.append(self.id(s))
+        bits = np.zeros((len(skill_sets), max(width or 0, self.width) * 8), dtype=bool)
+        bits[rows, cols] = True
+        return np.packbits(bits, axis=1, bitorder="little")
+
+    def encode(self, skills: Iterable[str]) -> np.ndarray:
+        return self.encode_many([skills])[0]
+
+    def decode(self, row: np.ndarray) -> List[str]:
+        bits = np.unpackbits(row, bitorder="little")
+        return sorted(self.names[i] for i in np.flatnonzero(bits) if i < len(self.names))
+
+    def columns(self, packed: np.ndarray, skills: Iterable[str]) -> Tuple[List[str], np.ndarray]:
+        """
+        Membership of `skills` in every packed row.
+        Returns (skills sorted by name, (n, len(skills)) bool matrix).
+        """
+        names = sorted(set(skills))
+        ids = np.fromiter((self.id(s) for s in names), dtype=np.int64, count=len(names))
+        byte, bit = ids >> 3, (ids & 7).astype(np.uint8)
+        # rows packed before the vocabulary grew are simply narrower
+        inside = byte < packed.shape[1]
+        hits = np.zeros((packed.shape[0], len(names)), dtype=bool)
+        if inside.any():
+            hits[:, inside] = (packed[:, byte[inside]] >> bit[inside]) & 1
+        return names, hits
+
+
+_vocab = None
+_vocab_version = None
+_vocab_lock = threading.Lock()
+
+
+def get_vocab() -> SkillVocab:
+    """Vocabulary over the current taxonomy's canonical skills."""
+    global _vocab, _vocab_version
+    compiled = get_taxonomy()
+    if _vocab_version != compiled.version:
+        with _vocab_lock:
+            if _vocab_version != compiled.version:
+                _vocab = SkillVocab(compiled.taxonomy)
+                _vocab_version = compiled.version
+    return _vocab
@@ -0,0 +1,182 @@
+"""
+Compiled skills taxonomy.
+
+Parsing skills_taxonomy.json, expanding every alias into its variants and
+building the matchers is slow for a large taxonomy, so the result is
+pickled next to the JSON as a versioned artifact. load() uses the artifact
+when it matches the JSON and rebuilds it when the JSON has changed.
+
+    cd backend && python -m analyzer.taxonomy      # (re)build the artifact
+"""
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import time
+
+from .automaton import AhoCorasick
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
+JSON_PATH = os.path.join(DATA_DIR, "skills_taxonomy.json")
+ARTIFACT_PATH = os.environ.get(
+    "TAXONOMY_ARTIFACT", os.path.join(DATA_DIR, "skills_taxonomy.compiled.pkl")
+)
+
+# Bump whenever CompiledTaxonomy or the structures inside it change
+ARTIFACT_FORMAT = 1
+
+FUZZY_MIN_ALIAS_LEN = 4  # skip too-short aliases like "js"
+
+
+def generate_variants(alias: str) -> set[str]:
+    """
+    Generate common textual variants for a given alias:
+    - dot/space/dash interchanges
+    - remove dots (e.g., node.js → nodejs)
+    - add space before suffixes like 'js'
+    """
+    alias = alias.lower()
+    variants = {alias}
+
+    # normalize separators
+    base = alias.replace(".", " ").replace("-", " ").strip()
+    variants.add(base)
+
+    # compress spaces
+    variants.add(base.replace(" ", ""))  # node js → nodejs
+    variants.add(base.replace(" ", "."))  # node js → node.js
+    variants.add(base.replace(" ", "-"))  # node js → node-js
+
+    # special: js suffix
+    if base.endswith("js") and not base.endswith(".js"):
+        variants.add(base.replace("js", ".js"))
+        variants.add(base.replace("js", " js"))
+
+    return {v for v in variants if v}
+
+
+def build_aliases(taxonomy: dict) -> dict[str, str]:
+    """{variant: canonical} for every canonical name and alias."""
+    aliases = {}
+    for canon, names in taxonomy.items():
+        for variant in generate_variants(canon.lower()):
+            aliases[variant] = canon
+        for a in names:
+            for variant in generate_variants(a):
+                aliases[variant] = canon
+    return aliases
+
+
+def build_fuzzy_index(aliases: dict[str, str]) -> dict[int, tuple[list[str], list[str]]]:
+    """
+    Bucket aliases by length: {len: ([alias, ...], [canonical, ...])}.
+    """
+    index: dict[int, tuple[list[str], list[str]]] = {}
+    for alias, canon in aliases.items():
+        if len(alias) < FUZZY_MIN_ALIAS_LEN:
+            continue
+        names, canons = index.setdefault(len(alias), ([], []))
+        names.append(alias)
+        canons.append(canon)
+    return index
+
+
+class CompiledTaxonomy:
+    """Taxonomy plus every structure the skill matchers need."""
+
+    def __init__(self, taxonomy: dict, version: str):
+        self.taxonomy = taxonomy
+        self.version = version
+        self.aliases = build_aliases(taxonomy)
+        # One automaton over every alias variant (replaces one regex per alias)
+        self.matcher = AhoCorasick(self.aliases.keys())
+        self.fuzzy_index = build_fuzzy_index(self.aliases)
+
+
+def _source_version(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()[:16]
+
+
+def compile_taxonomy(json_path: str = JSON_PATH) -> CompiledTaxonomy:
+    with open(json_path, "rb") as f:
+        raw = f.read()
+    return CompiledTaxonomy(json.loads(raw.decode("utf-8")), _source_version(raw))
+
+
+def _stamp(json_path: str) -> tuple:
+    st = os.stat(json_path)
+    return st.st_size, st.st_mtime_ns
+
+
+def build(json_path: str = JSON_PATH, artifact_path: str = ARTIFACT_PATH) -> CompiledTaxonomy:
+    """Compile the JSON and write the artifact (atomically)."""
+    stamp = _stamp(json_path)
+    compiled = compile_taxonomy(json_path)
+    payload = {
+        "format": ARTIFACT_FORMAT,
+        "source": os.path.abspath(json_path),
+        "stamp": stamp,
+        "version": compiled.version,
+        "compiled": compiled,
+    }
+    tmp = f"{artifact_path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, artifact_path)
+    return compiled
+
+
+def _read_artifact(json_path: str, artifact_path: str):
+    try:
+        with open(artifact_path, "rb") as f:
+            payload = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+    if payload.get("format") != ARTIFACT_FORMAT:
+        return None
+    if payload.get("source") != os.path.abspath(json_path):
+        return None
+    if payload.get("stamp") == _stamp(json_path):
+        return payload["compiled"]
+    # touched but maybe not edited: compare content before recompiling
+    with open(json_path, "rb") as f:
+        if _source_version(f.read()) == payload.get("version"):
+            return payload["compiled"]
+    return None
+
+
+def load(json_path: str = JSON_PATH, artifact_path: str = ARTIFACT_PATH) -> CompiledTaxonomy:
+    """
+    Compiled taxonomy for json_path, from the artifact when it is current;
+    otherwise compile and (best effort) rewrite the artifact.
+    """
+    compiled = _read_artifact(json_path, artifact_path)
+    if compiled is not None:
+        return compiled
+    try:
+        return build(json_path, artifact_path)
+    except OSError:
+        # read-only deploys still work, they just compile in memory
+        return compile_taxonomy(json_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile the skills taxonomy artifact.")
+    parser.add_argument("--json", default=JSON_PATH, help="taxonomy JSON (default: %(default)s)")
+    parser.add_argument("--out", default=ARTIFACT_PATH, help="artifact path (default: %(default)s)")
+    args = parser.parse_args()
+
+    # pickle by the importable module name, not __main__
+    from analyzer.taxonomy import build as build_artifact
+
+    t0 = time.perf_counter()
+    compiled = build_artifact(args.json, args.out)
+    print(
+        f"compiled {len(compiled.taxonomy)} skills / {len(compiled.aliases)} variants "
+        f"(version {compiled.version}) -> {args.out} in {time.perf_counter() - t0:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
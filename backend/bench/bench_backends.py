@@ -0,0 +1,125 @@
+"""
+Embedding backends (EMBED_BACKEND): accuracy, latency and memory on CPU.
+
+    cd backend && python -m bench.bench_backends [--backends torch,int8,onnx,onnx-int8]
+
+Each backend runs in its own process. Accuracy is measured against the
+torch backend: semantic_score on a corpus of resume/JD pairs (score
+deltas and rank agreement) and cosine between the raw embeddings. RSS is
+the worker's resident memory after loading the model and scoring the
+corpus, i.e. roughly what one extra worker costs.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+PAIRS = 40
+PAGES = (1, 2, 3)
+BATCH = 32
+
+
+def _rss_mb() -> float:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_backend(backend: str, model: str) -> dict:
+    os.environ["EMBED_BACKEND"] = backend
+    os.environ["EMBED_CACHE_SIZE"] = "0"  # measure encoding, not the cache
+    from analyzer import matcher, models
+
+    from .corpus import make_jd, make_resume
+
+    t0 = time.perf_counter()
+    encoder = models.get_embedder(model)
+    load_s = time.perf_counter() - t0
+    matcher.get_model = lambda: encoder  # score with the model under test
+
+    pairs = [
+        (" ".join(make_resume(PAGES[i % len(PAGES)], seed=i)).lower(), make_jd(seed=1000 + i).lower())
+        for i in range(PAIRS)
+    ]
+    texts = [r for r, _ in pairs[:BATCH]]
+    encoder.encode(texts[:2])  # warm-up
+
+    single = []
+    for text in texts[:10]:
+        t0 = time.perf_counter()
+        encoder.encode([text])
+        single.append((time.perf_counter() - t0) * 1000)
+    t0 = time.perf_counter()
+    vectors = encoder.encode(texts)
+    batch_ms = (time.perf_counter() - t0) * 1000
+
+    scores = [matcher.semantic_score(r, jd) for r, jd in pairs]
+    return {
+        "backend": backend,
+        "load_s": round(load_s, 2),
+        "single_ms": round(statistics.median(single), 2),
+        "batch_ms": round(batch_ms, 1),
+        "rss_mb": round(_rss_mb(), 1),
+        "scores": scores,
+        "vectors": np.asarray(vectors, dtype=np.float32).tolist(),
+    }
+
+
+def _ranks(x) -> np.ndarray:
+    return np.argsort(np.argsort(x)).astype(float)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", default="torch,int8,onnx,onnx-int8")
+    parser.add_argument("--model", default="all-MiniLM-L6-v2", help="model name or local path")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_backend(args.worker, args.model)))
+        return
+
+    backends = args.backends.split(",")
+    if "torch" not in backends:
+        backends.insert(0, "torch")  # the accuracy baseline
+
+    results = {}
+    for backend in backends:
+        proc = subprocess.run(
+            [sys.executable, "-m", "bench.bench_backends", "--worker", backend, "--model", args.model],
+            capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            err = (proc.stderr.strip().splitlines() or ["failed"])[-1]
+            print(f"{backend:<10} skipped: {err}", file=sys.stderr)
+            continue
+        results[backend] = json.loads(proc.stdout.strip().splitlines()[-1])
+
+    base = results.get("torch")
+    print(f"{'backend':<10} {'load s':>7} {'1 chunk ms':>11} {f'{BATCH} chunks ms':>13} {'RSS MB':>8} "
+          f"{'max |Δscore|':>13} {'mean |Δscore|':>14} {'rank corr':>10} {'min cos':>8}")
+    for backend, r in results.items():
+        row = f"{backend:<10} {r['load_s']:>7} {r['single_ms']:>11} {r['batch_ms']:>13} {r['rss_mb']:>8}"
+        if base is not None:
+            delta = np.abs(np.subtract(r["scores"], base["scores"]))
+            rank = np.corrcoef(_ranks(r["scores"]), _ranks(base["scores"]))[0, 1]
+            a, b = np.asarray(r["vectors"]), np.asarray(base["vectors"])
+            cos = (a * b).sum(axis=1) / (np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1))
+            row += f" {delta.max():>13.2f} {delta.mean():>14.3f} {rank:>10.4f} {cos.min():>8.4f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
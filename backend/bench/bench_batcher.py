@@ -0,0 +1,75 @@
+"""
+Micro-batching: many threads encoding one or two strings each, with and
+without the EmbeddingBatcher in between.
+
+    cd backend && python -m bench.bench_batcher [--threads 16] [--window-ms 5]
+
+Mirrors the /analyze miss path under load (one full-text or JD chunk per
+call) and reports throughput, latency and the batches actually formed.
+"""
+import argparse
+import statistics
+import threading
+import time
+
+from analyzer import models
+from analyzer.batcher import EmbeddingBatcher
+
+from .corpus import make_jd, make_resume
+
+
+def run(encode, texts, threads: int, calls: int) -> dict:
+    latencies, lock = [], threading.Lock()
+
+    def worker(t: int):
+        for i in range(calls):
+            text = texts[(t * calls + i) % len(texts)]
+            t0 = time.perf_counter()
+            encode([text, f"{text} {t}"] if i % 2 else [text])
+            with lock:
+                latencies.append((time.perf_counter() - t0) * 1000)
+
+    pool = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+    t0 = time.perf_counter()
+    for th in pool:
+        th.start()
+    for th in pool:
+        th.join()
+    wall = time.perf_counter() - t0
+    latencies.sort()
+    return {
+        "calls_per_s": threads * calls / wall,
+        "median_ms": statistics.median(latencies),
+        "p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--calls", type=int, default=20, help="encode calls per thread")
+    parser.add_argument("--window-ms", type=float, default=5.0)
+    parser.add_argument("--max-batch", type=int, default=64)
+    parser.add_argument("--model", default=models.EMBEDDER_NAME, help="model name or local path")
+    args = parser.parse_args()
+
+    model = models.get_embedder(args.model)
+    encode = lambda texts: model.encode(texts, convert_to_numpy=True)
+    texts = [" ".join(make_resume(1, seed=i)).lower()[:1500] for i in range(8)]
+    texts += [make_jd(seed=i).lower() for i in range(8)]
+    encode(texts[:2])  # warm-up
+
+    direct = run(encode, texts, args.threads, args.calls)
+    batcher = EmbeddingBatcher(encode, args.window_ms, args.max_batch, name="bench")
+    batched = run(batcher.encode, texts, args.threads, args.calls)
+    stats = batcher.stats()
+
+    print(f"threads={args.threads} calls/thread={args.calls} window={args.window_ms}ms max_batch={args.max_batch}")
+    for name, r in (("direct", direct), ("batched", batched)):
+        print(f"{name:<8} {r['calls_per_s']:8.1f} calls/s   median {r['median_ms']:7.1f} ms   p95 {r['p95_ms']:7.1f} ms")
+    print(f"batches={stats['batches']} avg requests/batch={stats['requests'] / max(1, stats['batches']):.1f} "
+          f"avg texts/batch={stats['texts'] / max(1, stats['batches']):.1f}")
+
+
+if __name__ == "__main__":
+    main()
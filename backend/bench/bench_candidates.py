@@ -0,0 +1,82 @@
+"""
+Reverse search at scale: one JD against 200k stored candidates.
+
+    cd backend && python -m bench.bench_candidates [--candidates 200000]
+
+Embeddings are random unit vectors and skills are drawn from the real
+taxonomy, so this measures the store (pre-filter, matrix scan, rescoring)
+rather than the model. The store is built in a temporary directory.
+"""
+import argparse
+import statistics
+import tempfile
+import time
+
+import numpy as np
+
+from analyzer.candidates import CandidateStore
+from analyzer.skills import get_taxonomy
+
+DIM = 384
+CHUNK = 20_000
+
+
+def fake_profiles(n: int, canon: list, rng: np.random.Generator, start: int = 0):
+    vecs = rng.standard_normal((n, DIM), dtype=np.float32)
+    vecs /= np.linalg.norm(vecs, axis=1, keepdims=True)
+    # popular skills show up far more often than rare ones
+    weights = 1.0 / np.arange(1, len(canon) + 1)
+    weights /= weights.sum()
+    for i in range(n):
+        picks = rng.choice(len(canon), size=rng.integers(5, 25), replace=False, p=weights)
+        yield {
+            "id": f"cand-{start + i}",
+            "filename": f"cand-{start + i}.pdf",
+            "skills": [canon[j] for j in picks],
+            "embedding": vecs[i],
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--candidates", type=int, default=200_000)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--min-overlap", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(5)
+    canon = sorted(get_taxonomy().taxonomy)
+
+    with tempfile.TemporaryDirectory() as root:
+        store = CandidateStore(root)
+        t0 = time.perf_counter()
+        for start in range(0, args.candidates, CHUNK):
+            n = min(CHUNK, args.candidates - start)
+            store.add_many(list(fake_profiles(n, canon, rng, start)))
+        ingest = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        CandidateStore(root).refresh()  # what another worker pays to open the store
+        reopen = time.perf_counter() - t0
+
+        samples = []
+        for q in range(args.queries):
+            jd_vec = rng.standard_normal(DIM, dtype=np.float32)
+            skills = set(rng.choice(canon[:200], size=8, replace=False))
+            jd = {"skills": skills, "embedding": jd_vec}
+            t0 = time.perf_counter()
+            hits = store.search(jd, top_k=args.top_k, min_overlap=args.min_overlap)
+            samples.append((time.perf_counter() - t0) * 1000)
+        samples.sort()
+
+    print(f"candidates={args.candidates} dim={DIM} top_k={args.top_k} min_overlap={args.min_overlap}")
+    print(f"ingest          : {ingest:8.2f}s ({args.candidates / ingest:,.0f}/s)")
+    print(f"open (cold)     : {reopen:8.2f}s")
+    print(f"search median   : {statistics.median(samples):8.1f} ms")
+    print(f"search p95      : {samples[min(len(samples) - 1, int(len(samples) * 0.95))]:8.1f} ms")
+    print(f"last query hits : {len(hits)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Memory per worker: `python main.py --preload` (models loaded once, then
+forked) against plain uvicorn workers that each load their own copy.
+
+    cd backend && python -m bench.bench_prefork [--workers 1,4,8] [--requests 4]
+
+Each configuration runs as a real server with WARMUP_MODELS=1, is sent
+--requests /analyze calls per worker, and is then measured from
+/proc/<pid>/smaps_rollup (Linux only):
+
+    USS   Private_Clean + Private_Dirty, what the worker alone costs
+    PSS   shared pages split between the processes sharing them
+    RSS   everything mapped in, shared or not
+"""
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+
+from .corpus import make_docx, make_jd, make_resume
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def smaps(pid: int) -> dict:
+    """smaps_rollup fields of one process, in MB."""
+    out = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                out[parts[0].rstrip(":")] = int(parts[1]) / 1024
+    out["USS"] = out.get("Private_Clean", 0.0) + out.get("Private_Dirty", 0.0)
+    return out
+
+
+def workers_of(pid: int) -> list:
+    """Child processes of pid, minus multiprocessing's resource tracker."""
+    kids = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+            with open(f"/proc/{entry}/cmdline", "rb") as f:
+                cmdline = f.read()
+        except OSError:
+            continue
+        if ppid == pid and b"resource_tracker" not in cmdline:
+            kids.append(int(entry))
+    return kids
+
+
+async def _load(url: str, n: int) -> int:
+    payload = make_docx(make_resume(2))
+    jd = make_jd()
+    async with httpx.AsyncClient(base_url=url, timeout=300) as client:
+        async def one():
+            r = await client.post("/analyze", files={"file": ("r.docx", payload)}, data={"job_description": jd})
+            return r.status_code == 200
+
+        return sum(await asyncio.gather(*(one() for _ in range(n))))
+
+
+def measure(workers: int, preload: bool, requests: int) -> dict:
+    port = _free_port()
+    cmd = [sys.executable, "main.py", "--port", str(port), "--workers", str(workers)]
+    if preload:
+        cmd.append("--preload")
+    env = dict(os.environ, WARMUP_MODELS="1", RESULT_CACHE="off", LOG_LEVEL="WARNING")
+    server = subprocess.Popen(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    url = f"http://127.0.0.1:{port}"
+    try:
+        ready, deadline = 0, time.time() + 600
+        while ready < 3 * workers and time.time() < deadline:  # several workers answered ready
+            try:
+                ready = ready + 1 if httpx.get(url + "/health", timeout=5).status_code == 200 else 0
+            except httpx.TransportError:
+                ready = 0
+            time.sleep(0.2)
+        ok = asyncio.run(_load(url, requests * workers))
+        time.sleep(1)
+        kids = workers_of(server.pid)
+        parent = smaps(server.pid)
+        per = [smaps(pid) for pid in kids]
+        if not per:  # uvicorn with one worker serves from the main process
+            per, parent = [parent], {"USS": 0.0, "Pss": 0.0}
+    finally:
+        server.terminate()
+        server.wait()
+
+    mean = lambda key: sum(p[key] for p in per) / max(1, len(per))
+    return {
+        "mode": "preload" if preload else "uvicorn",
+        "workers": len(per),
+        "ok": ok,
+        "uss": mean("USS"),
+        "rss": mean("Rss"),
+        "parent_uss": parent["USS"],
+        "total_pss": parent["Pss"] + sum(p["Pss"] for p in per),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", default="1,4,8")
+    parser.add_argument("--requests", type=int, default=4, help="/analyze calls per worker before measuring")
+    parser.add_argument("--modes", default="uvicorn,preload")
+    args = parser.parse_args()
+
+    print(f"{'mode':<8} {'workers':>7} {'USS/worker':>11} {'RSS/worker':>11} {'parent USS':>11} {'total PSS':>10}   MB")
+    for n in (int(w) for w in args.workers.split(",")):
+        for mode in args.modes.split(","):
+            r = measure(n, mode == "preload", args.requests)
+            print(f"{r['mode']:<8} {r['workers']:>7} {r['uss']:>11.1f} {r['rss']:>11.1f} "
+                  f"{r['parent_uss']:>11.1f} {r['total_pss']:>10.1f}   ({r['ok']} requests ok)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Latency and memory of semantic scoring for 1-10 page resumes, per mode.
+
+    cd backend && python -m bench.bench_semantic
+
+Each mode runs in its own process (pages in ascending order), so the
+reported peak RSS is that mode's own high-water mark.
+"""
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+
+PAGES = (1, 2, 5, 10)
+WORDS_PER_PAGE = 500
+REPEAT = 3
+MODES = (("full", "max"), ("sections", "max"), ("sections", "topk"), ("windows", "max"))
+
+HEADERS = ["summary", "experience", "projects", "skills", "education", "certifications"]
+VOCAB = (
+    "built designed python react docker kubernetes api service pipeline data team "
+    "reduced latency improved customers platform migrated aws cloud tests "
+    "delivered product features led engineers analytics dashboards sql"
+).split()
+JD = (
+    "we are hiring a backend engineer with python, docker and kubernetes experience "
+    "who has built apis and data pipelines on aws and led small teams"
+)
+
+
+def make_resume(pages: int, rng: random.Random) -> str:
+    words, total = [], pages * WORDS_PER_PAGE
+    while len(words) < total:
+        words.append(rng.choice(HEADERS))
+        words.extend(rng.choices(VOCAB, k=rng.randint(60, 140)))
+    return " ".join(words[:total])
+
+
+def run_mode(mode: str, agg: str) -> list:
+    os.environ["EMBED_CACHE_SIZE"] = "0"  # measure encoding, not the cache
+    from analyzer import matcher
+
+    matcher.get_model().encode(["warm-up"])
+    rng = random.Random(5)
+    rows = []
+    for pages in PAGES:
+        resume = make_resume(pages, rng)
+        t0 = time.perf_counter()
+        for _ in range(REPEAT):
+            score = matcher.semantic_score(resume, JD, mode=mode, agg=agg)
+        ms = (time.perf_counter() - t0) / REPEAT * 1000
+        rows.append({
+            "mode": mode,
+            "agg": agg,
+            "pages": pages,
+            "chunks": 1 if mode == "full" else len(matcher.chunk_text(resume, mode)),
+            "ms": round(ms, 1),
+            "score": score,
+            "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        })
+    return rows
+
+
+def main():
+    if len(sys.argv) == 3:
+        print(json.dumps(run_mode(sys.argv[1], sys.argv[2])))
+        return
+
+    print(f"{'mode':>8} {'agg':>5} {'pages':>5} {'chunks':>6} {'ms':>8} {'score':>6} {'peak MB':>8}")
+    for mode, agg in MODES:
+        out = subprocess.run(
+            [sys.executable, "-m", "bench.bench_semantic", mode, agg],
+            capture_output=True, text=True, check=True,
+        ).stdout
+        for r in json.loads(out.strip().splitlines()[-1]):
+            print(
+                f"{r['mode']:>8} {r['agg']:>5} {r['pages']:>5} {r['chunks']:>6} "
+                f"{r['ms']:>8} {r['score']:>6} {r['peak_rss_mb']:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Editing sessions: re-analysis after a one-line edit vs. a full /analyze.
+
+    cd backend && python -m bench.bench_sessions [--repeat 10]
+
+Both paths start from text (no file extraction) and use the real
+embedder, with the embedding cache off so the full path pays for every
+chunk it encodes.
+"""
+import argparse
+import os
+import random
+import statistics
+import time
+
+os.environ.setdefault("EMBED_CACHE_SIZE", "0")
+
+from analyzer.extractor import guess_sections, normalize
+from analyzer.jobs import build_profile
+from analyzer.matcher import SEMANTIC_MODE, semantic_scores
+from analyzer.pipeline import build_result, resume_skills
+from analyzer.sessions import Session
+
+from .corpus import build_corpus, make_jd
+
+EDITS = [" reduced p95 latency by 35%", " using kubernetes", " led a team of 4 engineers"]
+
+
+def full_analysis(text: str, jd: dict) -> dict:
+    norm = normalize(text)
+    resume = {"filename": None, "raw": text, "norm": norm,
+              "sections": guess_sections(norm), "skills": resume_skills(norm)}
+    sem = semantic_scores([norm], jd["norm"], jd_vec=jd["embedding"])[0]
+    return build_result(resume, jd, sem)
+
+
+def same_result(a: dict, b: dict) -> bool:
+    """Everything but the session stats and the order of the debug lists."""
+    return all(a[k] == b[k] for k in b if k != "debug") and all(
+        sorted(a["debug"][k]) == sorted(b["debug"][k]) for k in b["debug"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10, help="edits per document size")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    corpus = build_corpus(args.seed)
+    jd = build_profile(make_jd(args.seed))
+    print(f"mode={SEMANTIC_MODE}")
+
+    for size, doc in corpus.items():
+        lines = doc["text"].split("\n")
+        session = Session(jd)
+        session.update(doc["text"])
+        inc, full = [], []
+        for _ in range(args.repeat):
+            i = rng.randrange(len(lines))
+            lines[i] += rng.choice(EDITS)
+            text = "\n".join(lines)
+
+            t0 = time.perf_counter()
+            a = session.update(text)
+            inc.append((time.perf_counter() - t0) * 1000)
+            t0 = time.perf_counter()
+            b = full_analysis(text, jd)
+            full.append((time.perf_counter() - t0) * 1000)
+            assert same_result(a, b), "session and full analysis disagree"
+
+        inc_ms, full_ms = statistics.median(inc), statistics.median(full)
+        print(f"{size:<8} full {full_ms:8.1f} ms   session {inc_ms:8.1f} ms   "
+              f"{full_ms / inc_ms:5.1f}x   ({a['session']['segments']} segments)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+spaCy skill-candidate extraction: one document per call versus the batch
+API (nlp.pipe over worker processes, one rapidfuzz score matrix).
+
+    cd backend && python -m bench.bench_skill_nlp [--docs 200] [--processes 1,4]
+
+Needs en_core_web_sm (python -m spacy download en_core_web_sm). Reports
+documents per second and checks that every mode finds the same skills.
+"""
+import argparse
+import time
+
+from analyzer import analyze, models
+
+from .corpus import make_resume
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return out, time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=200)
+    parser.add_argument("--processes", default="1,4", help="comma-separated n_process values for the batch API")
+    parser.add_argument("--batch-size", type=int, default=analyze.SKILL_NLP_BATCH)
+    args = parser.parse_args()
+
+    texts = ["\n".join(make_resume(1 + i % 3, seed=i)) for i in range(args.docs)]
+    analyze.extract_skill_candidates(texts[0])  # load the pipeline
+    print(f"docs={args.docs} pipeline={models.loaded()}")
+
+    single, wall = timed(lambda: [analyze.extract_skill_candidates(t) for t in texts])
+    print(f"{'per document':<22} {args.docs / wall:8.1f} docs/s")
+    for n in (int(p) for p in args.processes.split(",")):
+        batch, wall = timed(lambda: analyze.extract_skill_candidates_batch(
+            texts, n_process=n, batch_size=args.batch_size))
+        same = "same skills" if batch == single else "DIFFERENT skills"
+        print(f"{f'batch n_process={n}':<22} {args.docs / wall:8.1f} docs/s   {same}")
+
+
+if __name__ == "__main__":
+    main()
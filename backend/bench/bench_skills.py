@@ -0,0 +1,80 @@
+"""
+Exact skill matching: per-alias regex loop vs. the Aho-Corasick automaton.
+
+    cd backend && python -m bench.bench_skills
+"""
+import random
+import re
+import string
+import time
+
+from analyzer.automaton import AhoCorasick
+from analyzer.skills import _is_whole_word
+
+SIZES = (100, 10_000, 100_000)
+RESUME_WORDS = 900  # roughly a 2-page resume
+
+
+def make_aliases(n: int, rng: random.Random) -> list[str]:
+    aliases = set()
+    while len(aliases) < n:
+        parts = rng.randint(1, 2)
+        aliases.add(" ".join(
+            "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9)))
+            for _ in range(parts)
+        ))
+    return sorted(aliases)
+
+
+def make_text(aliases: list[str], rng: random.Random) -> str:
+    words = []
+    for _ in range(RESUME_WORDS):
+        if rng.random() < 0.05:
+            words.append(rng.choice(aliases))
+        else:
+            words.append("".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 10))))
+    return " ".join(words)
+
+
+def regex_loop(aliases, text):
+    t0 = time.perf_counter()
+    patterns = {
+        a: re.compile(rf"(?<![a-z0-9]){re.escape(a)}(?![a-z0-9])", re.IGNORECASE)
+        for a in aliases
+    }
+    t1 = time.perf_counter()
+    found = {a for a, pat in patterns.items() if pat.search(text)}
+    t2 = time.perf_counter()
+    return found, t1 - t0, t2 - t1
+
+
+def automaton(aliases, text):
+    t0 = time.perf_counter()
+    ac = AhoCorasick(aliases)
+    t1 = time.perf_counter()
+    found = {
+        ac.patterns[idx]
+        for start, end, idx in ac.iter_matches(text)
+        if _is_whole_word(text, start, end)
+    }
+    t2 = time.perf_counter()
+    return found, t1 - t0, t2 - t1
+
+
+def main():
+    rng = random.Random(7)
+    print(f"{'aliases':>8} | {'regex build':>11} {'regex scan':>10} | {'ac build':>9} {'ac scan':>8} | speedup")
+    for n in SIZES:
+        aliases = make_aliases(n, rng)
+        text = make_text(aliases, rng)
+        rx_found, rx_build, rx_scan = regex_loop(aliases, text)
+        ac_found, ac_build, ac_scan = automaton(aliases, text)
+        assert rx_found == ac_found, "automaton disagrees with regex loop"
+        print(
+            f"{n:>8} | {rx_build:>10.3f}s {rx_scan:>9.4f}s | "
+            f"{ac_build:>8.3f}s {ac_scan:>7.4f}s | {rx_scan / ac_scan:>6.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Server memory under concurrent uploads.
+
+    cd backend && python -m bench.bench_uploads [--uploads 100] [--size-mb 6]
+
+Starts uvicorn in a subprocess, sends N concurrent /analyze uploads of a
+DOCX padded to the given size (the padding is an unreferenced zip member,
+so extraction stays cheap and the numbers reflect upload handling) and
+reports the server's resident memory before and at its peak (VmHWM).
+--app-dir points at another checkout's backend/ to compare commits.
+"""
+import argparse
+import asyncio
+import io
+import os
+import socket
+import subprocess
+import sys
+import time
+import zipfile
+
+import httpx
+
+from .corpus import make_docx, make_resume
+
+
+def padded_docx(size_mb: float) -> bytes:
+    buf = io.BytesIO(make_docx(make_resume(1)))
+    with zipfile.ZipFile(buf, "a", compression=zipfile.ZIP_STORED) as z:
+        z.writestr("customXml/padding.bin", os.urandom(int(size_mb * 1024 * 1024)))
+    return buf.getvalue()
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _mem_kb(pid: int, field: str) -> int:
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith(field + ":"):
+                return int(line.split()[1])
+    return 0
+
+
+async def _upload_all(url: str, payload: bytes, n: int) -> dict:
+    limits = httpx.Limits(max_connections=n)
+    async with httpx.AsyncClient(base_url=url, timeout=300, limits=limits) as client:
+        async def one():
+            r = await client.post("/analyze", files={"file": ("resume.docx", payload)})
+            return r.status_code
+
+        t0 = time.perf_counter()
+        codes = await asyncio.gather(*(one() for _ in range(n)))
+        wall = time.perf_counter() - t0
+    return {"wall_s": round(wall, 2), "status": {c: codes.count(c) for c in sorted(set(codes))}}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--uploads", type=int, default=100)
+    parser.add_argument("--size-mb", type=float, default=6.0)
+    parser.add_argument("--app-dir", default=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    args = parser.parse_args()
+
+    port = _free_port()
+    env = dict(
+        os.environ,
+        RESULT_CACHE="off",
+        ANALYZER_QUEUE=str(args.uploads),  # queue everything; measure memory, not shedding
+        LOG_LEVEL="WARNING",
+    )
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--app-dir", args.app_dir,
+         "--port", str(port), "--log-level", "warning"],
+        env=env,
+    )
+    try:
+        url = f"http://127.0.0.1:{port}"
+        for _ in range(300):
+            try:
+                httpx.get(url + "/health", timeout=1)
+                break
+            except httpx.TransportError:
+                time.sleep(0.1)
+
+        payload = padded_docx(args.size_mb)
+        asyncio.run(_upload_all(url, payload, 1))  # first-request imports and setup
+        idle = _mem_kb(server.pid, "VmRSS")
+        run = asyncio.run(_upload_all(url, payload, args.uploads))
+        peak = _mem_kb(server.pid, "VmHWM")
+    finally:
+        server.terminate()
+        server.wait()
+
+    print(f"app={args.app_dir} uploads={args.uploads} size={len(payload) / 1e6:.1f} MB")
+    print(f"status        : {run['status']} in {run['wall_s']} s")
+    print(f"RSS idle      : {idle / 1024:8.1f} MB")
+    print(f"RSS peak      : {peak / 1024:8.1f} MB (+{(peak - idle) / 1024:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Compare two bench.run result files and flag regressions.
+
+    cd backend && python -m bench.compare base.json new.json [--threshold 0.10]
+
+Exits with status 1 if any shared benchmark got slower than the threshold
+(median latency for stages, p95 latency and throughput for load tests).
+"""
+import argparse
+import json
+import sys
+
+
+def _load(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def compare(base: dict, new: dict, threshold: float):
+    rows, regressions = [], []
+    for name in sorted(set(base) & set(new)):
+        b, n = base[name], new[name]
+        checks = [("median_ms", b["median_ms"], n["median_ms"], False)]
+        if "rps" in b and "rps" in n:
+            checks = [
+                ("p95_ms", b["p95_ms"], n["p95_ms"], False),
+                ("rps", b["rps"], n["rps"], True),
+            ]
+        for metric, old, cur, higher_is_better in checks:
+            if not old:
+                continue
+            change = (cur - old) / old
+            worse = -change if higher_is_better else change
+            flag = worse > threshold
+            rows.append((name, metric, old, cur, change, flag))
+            if flag:
+                regressions.append((name, metric))
+    return rows, regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("base")
+    parser.add_argument("new")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown (0.10 = 10%%)")
+    args = parser.parse_args()
+
+    base, new = _load(args.base), _load(args.new)
+    rows, regressions = compare(base, new, args.threshold)
+
+    print(f"{'benchmark':<36} {'metric':<9} {'base':>10} {'new':>10} {'change':>8}")
+    for name, metric, old, cur, change, flag in rows:
+        mark = "  REGRESSION" if flag else ""
+        print(f"{name:<36} {metric:<9} {old:>10.3f} {cur:>10.3f} {change:>+7.1%}{mark}")
+
+    only = sorted(set(base) ^ set(new))
+    if only:
+        print(f"\nnot compared (present in one file only): {', '.join(only)}")
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}")
+        sys.exit(1)
+    print("\nno regressions")
+
+
+if __name__ == "__main__":
+    main()
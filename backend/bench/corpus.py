@@ -0,0 +1,131 @@
+"""
+Synthetic, reproducible resumes and job descriptions for benchmarks.
+
+Everything is generated from a seed, so two runs on different commits see
+exactly the same inputs.
+"""
+import io
+import random
+from typing import Dict, List
+
+import docx
+
+SIZES = {"small": 1, "medium": 3, "large": 10}  # pages
+WORDS_PER_PAGE = 450
+
+SKILLS = [
+    "python", "javascript", "typescript", "react", "node.js", "docker",
+    "kubernetes", "aws", "gcp", "postgresql", "mongodb", "graphql",
+    "fastapi", "django", "pandas", "numpy", "pytorch", "tensorflow",
+    "machine learning", "rest api", "tailwind css", "next.js",
+]
+VERBS = [
+    "built", "designed", "developed", "led", "optimized", "reduced",
+    "migrated", "automated", "delivered", "scaled", "improved", "launched",
+]
+FILLER = (
+    "the team service platform customers data pipeline features api latency "
+    "dashboards tests release product users cloud infrastructure reports "
+    "quality workflow on-call integration monitoring analytics across with for"
+).split()
+SECTIONS = ["Summary", "Experience", "Projects", "Skills", "Education", "Certifications"]
+
+
+def _bullet(rng: random.Random) -> str:
+    words = [rng.choice(VERBS)]
+    for _ in range(rng.randint(8, 18)):
+        roll = rng.random()
+        if roll < 0.12:
+            words.append(rng.choice(SKILLS))
+        elif roll < 0.18:
+            words.append(f"{rng.randint(2, 95)}%")
+        else:
+            words.append(rng.choice(FILLER))
+    return " ".join(words)
+
+
+def make_resume(pages: int, seed: int = 0) -> List[str]:
+    """Resume as a list of lines (headers and '- ' bullets)."""
+    rng = random.Random(seed)
+    lines, words = [], 0
+    target = pages * WORDS_PER_PAGE
+    while words < target:
+        for header in SECTIONS:
+            lines.append(header)
+            for _ in range(rng.randint(3, 8)):
+                line = "- " + _bullet(rng)
+                lines.append(line)
+                words += len(line.split())
+            if words >= target:
+                break
+    return lines
+
+
+def make_jd(seed: int = 0, skills: int = 8) -> str:
+    rng = random.Random(seed)
+    wanted = rng.sample(SKILLS, skills)
+    return (
+        "We are hiring a software engineer to build and scale our platform. "
+        f"Required: {', '.join(wanted[:skills // 2])}. "
+        f"Nice to have: {', '.join(wanted[skills // 2:])}. "
+        "You will design services, improve reliability and work with product teams."
+    )
+
+
+def make_docx(lines: List[str]) -> bytes:
+    doc = docx.Document()
+    for line in lines:
+        doc.add_paragraph(line)
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+def _pdf_escape(s: str) -> str:
+    return s.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(lines: List[str], lines_per_page: int = 50) -> bytes:
+    """Minimal text-only PDF (Helvetica, one line per text row)."""
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+    n = len(pages)
+    objs = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [%s] /Count %d >>" % (" ".join(f"{4 + 2 * i} 0 R" for i in range(n)), n),
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i, page in enumerate(pages):
+        rows = " ".join(f"({_pdf_escape(line[:110])}) Tj T*" for line in page)
+        body = f"BT /F1 9 Tf 12 TL 40 800 Td {rows} ET"
+        objs.append(
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {5 + 2 * i} 0 R >>"
+        )
+        objs.append(f"<< /Length {len(body.encode('latin-1'))} >>\nstream\n{body}\nendstream")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for i, obj in enumerate(objs):
+        offsets.append(len(out))
+        out += f"{i + 1} 0 obj\n{obj}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objs) + 1}\n0000000000 65535 f \n".encode()
+    for off in offsets:
+        out += f"{off:010d} 00000 n \n".encode()
+    out += f"trailer\n<< /Size {len(objs) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+def build_corpus(seed: int = 0) -> Dict[str, dict]:
+    """{size: {"lines", "text", "pdf", "docx"}} plus a shared JD."""
+    corpus = {}
+    for i, (name, pages) in enumerate(SIZES.items()):
+        lines = make_resume(pages, seed=seed + i)
+        corpus[name] = {
+            "pages": pages,
+            "lines": lines,
+            "text": "\n".join(lines),
+            "pdf": make_pdf(lines),
+            "docx": make_docx(lines),
+        }
+    return corpus
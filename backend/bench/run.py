@@ -0,0 +1,175 @@
+"""
+Analyzer benchmark suite: per-stage micro-benchmarks plus an offline load
+test of the FastAPI app through an in-process ASGI client.
+
+    cd backend && python -m bench.run --out bench-results.json
+    python -m bench.compare old.json new.json
+
+--no-embed skips the stages that need the sentence-transformer model and
+load-tests /analyze without a job description.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable, Dict
+
+# Measure the pipeline itself, not the caches in front of it
+os.environ.setdefault("RESULT_CACHE", "off")
+os.environ.setdefault("EMBED_CACHE_SIZE", "0")
+
+from analyzer.advisor import quality_hints
+from analyzer.analyze import quantify_issues
+from analyzer.extractor import extract_text_bytes, guess_sections, normalize
+from analyzer.matcher import semantic_score
+from analyzer.skills import find_skills, fuzzy_fill, get_taxonomy
+
+from .corpus import build_corpus, make_jd
+
+
+def measure(fn: Callable, repeat: int, warmup: int = 1) -> Dict[str, float]:
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    samples.sort()
+    return {
+        "n": repeat,
+        "median_ms": round(statistics.median(samples), 3),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+        "min_ms": round(samples[0], 3),
+    }
+
+
+def run_stages(corpus: dict, jd: str, repeat: int, embed: bool) -> Dict[str, dict]:
+    results = {}
+    jd_norm = normalize(jd)
+    get_taxonomy()  # artifact load is a startup cost, not a per-call one
+
+    for size, doc in corpus.items():
+        norm = normalize(doc["text"])
+        sections = guess_sections(norm)
+        stages = {
+            "extract_pdf": lambda: extract_text_bytes("r.pdf", doc["pdf"]),
+            "extract_docx": lambda: extract_text_bytes("r.docx", doc["docx"]),
+            "normalize": lambda: normalize(doc["text"]),
+            "guess_sections": lambda: guess_sections(norm),
+            "find_skills": lambda: find_skills(norm),
+            "fuzzy_fill": lambda: fuzzy_fill(norm, threshold=95),
+            "quality_hints": lambda: quality_hints(norm, sections, ["kubernetes"]),
+            "quantify_issues": lambda: quantify_issues(doc["text"]),
+        }
+        if embed:
+            stages["semantic_score"] = lambda: semantic_score(norm, jd_norm)
+
+        for stage, fn in stages.items():
+            name = f"stage.{stage}.{size}"
+            results[name] = measure(fn, repeat)
+            print(f"{name:<36} {results[name]['median_ms']:>10.3f} ms", file=sys.stderr)
+    return results
+
+
+async def _load(app, payload: bytes, filename: str, jd: str, requests: int, concurrency: int):
+    import httpx
+
+    latencies, errors = [], 0
+    sem = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=300) as client:
+        async def one():
+            nonlocal errors
+            async with sem:
+                t0 = time.perf_counter()
+                r = await client.post(
+                    "/analyze",
+                    files={"file": (filename, payload)},
+                    data={"job_description": jd},
+                )
+                latencies.append((time.perf_counter() - t0) * 1000)
+                if r.status_code != 200:
+                    errors += 1
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests)))
+        wall = time.perf_counter() - t0
+
+    latencies.sort()
+    return {
+        "n": requests,
+        "concurrency": concurrency,
+        "errors": errors,
+        "rps": round(requests / wall, 2),
+        "median_ms": round(statistics.median(latencies), 3),
+        "p95_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 3),
+    }
+
+
+def run_load(corpus: dict, jd: str, requests: int, concurrency: int) -> Dict[str, dict]:
+    import main
+
+    results = {}
+    for size in ("small", "medium"):
+        for kind in ("pdf", "docx"):
+            name = f"load.analyze.{kind}.{size}"
+            results[name] = asyncio.run(
+                _load(main.app, corpus[size][kind], f"resume.{kind}", jd, requests, concurrency)
+            )
+            r = results[name]
+            print(f"{name:<36} {r['rps']:>8.2f} req/s  p95 {r['p95_ms']:.1f} ms  errors {r['errors']}",
+                  file=sys.stderr)
+    return results
+
+
+def _git_rev() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", default="bench-results.json")
+    parser.add_argument("--repeat", type=int, default=20, help="samples per stage")
+    parser.add_argument("--requests", type=int, default=40, help="requests per load-test case")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-embed", action="store_true", help="skip model-dependent work")
+    parser.add_argument("--stages-only", action="store_true")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.seed)
+    jd = make_jd(args.seed)
+
+    results = run_stages(corpus, jd, args.repeat, embed=not args.no_embed)
+    if not args.stages_only:
+        results.update(run_load(corpus, "" if args.no_embed else jd, args.requests, args.concurrency))
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "git": _git_rev(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "args": vars(args),
+        },
+        "results": results,
+    }
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"wrote {args.out}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
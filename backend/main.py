@@ -1,20 +1,153 @@
 # backend/main.py
+import logging
 import os
-import traceback
-from typing import Optional
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException
+import threading
+import uuid
+from contextlib import aclosing, asynccontextmanager
+from typing import List, Optional
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+from starlette.formparsers import MultiPartException, MultiPartParser
 
 # Analyzer modules
-from analyzer.extractor import extract_text_bytes, normalize, guess_sections
-from analyzer.skills import find_skills, fuzzy_fill
-from analyzer.matcher import semantic_score, skill_scores, blended_score
-from analyzer.advisor import quality_hints
+from analyzer.pipeline import analyze_document, analyze_batch, result_key
+from analyzer.matcher import get_batcher, get_cache
+from analyzer import models
+from analyzer.pool import BoundedPool, PoolFull
+from analyzer.extractor import ExtractionTimeout, Source, extract_text_bytes, source_size
+from analyzer.result_cache import ResultCache
+from analyzer.skills import get_taxonomy
+from analyzer import metrics
+from analyzer.jobs import JobStore, build_profile, describe
+from analyzer.candidates import CandidateStore, StoreMismatch, profile_resume
+from analyzer.sessions import SessionStore
+
+# LOG_LEVEL=DEBUG turns on per-request detail; below that it costs nothing
+logging.basicConfig(
+    level=os.environ.get("LOG_LEVEL", "INFO").upper(),
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+)
+log = logging.getLogger("talentalign")
 
 ALLOWED_EXTS = {".pdf", ".doc", ".docx", ".txt"}
 MAX_FILE_BYTES = 8 * 1024 * 1024  # 8 MB
+MAX_BATCH_FILES = 200
+# Whole request bodies, checked before (Content-Length) and while they are
+# received, so oversized uploads are refused without being buffered.
+# The allowance on top of one file covers the other form fields.
+MAX_REQUEST_BYTES = MAX_FILE_BYTES + 1024 * 1024
+MAX_BATCH_REQUEST_BYTES = int(os.environ.get("MAX_BATCH_REQUEST_BYTES", str(100 * 1024 * 1024)))
+BATCH_PATHS = {"/analyze/batch"}
+# Uploads are buffered in memory up to this size, then spooled to a temp file
+UPLOAD_SPOOL_BYTES = int(os.environ.get("UPLOAD_SPOOL_BYTES", str(256 * 1024)))
+
+# Opt-in: load models and run one dummy inference at startup.
+# /health answers 503 until that is done.
+WARMUP_MODELS = os.environ.get("WARMUP_MODELS", "").lower() in {"1", "true", "yes"}
+
+# CPU-bound work (extraction, skill matching, embeddings) runs here, off
+# the event loop. Once workers + queue are full we answer 503.
+RETRY_AFTER_SECONDS = int(os.environ.get("ANALYZER_RETRY_AFTER", "2"))
+# Worker processes don't share the parent's models, so they warm up themselves.
+_process_pool = os.environ.get("ANALYZER_POOL") == "process"
+pool = BoundedPool.from_env(
+    initializer=models.warm_up if WARMUP_MODELS and _process_pool else None
+)
+
+
+def _warm_up():
+    try:
+        get_taxonomy()
+        if _process_pool:
+            # analysis runs in the pool processes, which warm up themselves;
+            # here the embedder is only needed for /jobs and /sessions
+            models.mark_ready()
+        else:
+            models.warm_up()
+    except Exception:
+        log.exception("Model warm-up failed")
+
+
+# Whole-response cache for repeat (file, JD) submissions
+results = ResultCache.from_env()
+
+# Stored job postings with precomputed profiles (JOB_STORE_PATH, under
+# STORE_DIR by default); the file is only opened on first use
+jobs = JobStore.from_env()
+
+# Stored resumes for reverse search (CANDIDATE_STORE_DIR, under STORE_DIR
+# by default); also opened on first use
+candidates = CandidateStore.from_env()
+
+# Resume editing sessions (SESSION_MAX, SESSION_TTL). They live in this
+# process, so run one worker or route a session's requests to one worker.
+sessions = SessionStore.from_env()
+
+# Scraped by /metrics alongside the per-stage latency histograms.
+# Stage timings are recorded where the work runs, so with
+# ANALYZER_POOL=process they stay in the worker processes.
+metrics.gauge("analyzer_pool_running", "Analysis jobs currently running.", lambda: pool.stats()["running"])
+metrics.gauge("analyzer_pool_queued", "Analysis jobs waiting for a worker.", lambda: pool.stats()["queued"])
+metrics.counter("analyzer_pool_rejected_total", "Requests rejected with 503.", lambda: pool.stats()["rejected"])
+metrics.counter("analyzer_embedding_cache_hits_total", "Embedding cache hits.", lambda: get_cache().hits)
+metrics.counter("analyzer_embedding_cache_disk_hits_total", "Embedding cache hits served from disk.", lambda: get_cache().disk_hits)
+metrics.counter("analyzer_embedding_cache_misses_total", "Embedding cache misses.", lambda: get_cache().misses)
+metrics.counter("analyzer_embed_batches_total", "Coalesced encode batches run.", lambda: get_batcher().batches)
+metrics.counter("analyzer_embed_batched_requests_total", "Encode requests served by the batcher.", lambda: get_batcher().requests)
+metrics.counter("analyzer_result_cache_hits_total", "Result cache hits.", lambda: results.hits)
+metrics.counter("analyzer_result_cache_misses_total", "Result cache misses.", lambda: results.misses)
+
 
-app = FastAPI(title="TalentAlign Analyzer", version="0.1.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if WARMUP_MODELS:
+        # background thread so the server can already answer /health (503)
+        threading.Thread(target=_warm_up, name="model-warmup", daemon=True).start()
+    yield
+    pool.shutdown()
+
+
+class UploadParser(MultiPartParser):
+    spool_max_size = UPLOAD_SPOOL_BYTES
+
+
+class UploadRequest(Request):
+    """
+    Request whose multipart forms are parsed with UploadParser.
+    Starlette has no public setting for the spool size, so this overrides
+    Request._get_form; requirements.txt pins starlette to the versions
+    this was checked against.
+    """
+
+    async def _get_form(self, **limits):
+        content_type = self.headers.get("content-type", "")
+        if self._form is None and content_type.lower().startswith("multipart/form-data"):
+            try:
+                async with aclosing(self.stream()) as stream:
+                    self._form = await UploadParser(self.headers, stream, **limits).parse()
+            except MultiPartException as exc:
+                raise HTTPException(status_code=400, detail=exc.message)
+        return await super()._get_form(**limits)
+
+
+class UploadRoute(APIRoute):
+    """Routes of this app get an UploadRequest, so the spool size stays local to it."""
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            return await handler(UploadRequest(request.scope, request.receive))
+
+        return route_handler
+
+
+app = FastAPI(title="TalentAlign Analyzer", version="0.1.0", lifespan=lifespan)
+app.router.route_class = UploadRoute
 
 # ✅ CORS setup
 origins = [
@@ -24,6 +157,64 @@ origins = [
     "https://talentalign-gm8x2tqv7-sahil-pokhrels-projects.vercel.app",
 ]
 
+class BodyLimit:
+    """
+    Pure ASGI middleware answering 413 for request bodies over the limit:
+    from Content-Length when the client sends one, otherwise as soon as
+    the streamed body passes the limit.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    @staticmethod
+    def _too_large(limit: int) -> JSONResponse:
+        # single uploads are stated as the file limit, like _read_upload's 413
+        if limit == MAX_REQUEST_BYTES:
+            detail = f"Request too large (files are limited to {MAX_FILE_BYTES // (1024 * 1024)} MB)."
+        else:
+            detail = f"Request too large (max {limit // (1024 * 1024)} MB)."
+        return JSONResponse(status_code=413, content={"detail": detail})
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        limit = MAX_BATCH_REQUEST_BYTES if scope["path"] in BATCH_PATHS else MAX_REQUEST_BYTES
+        length = dict(scope["headers"]).get(b"content-length")
+        if length is not None and length.isdigit() and int(length) > limit:
+            return await self._too_large(limit)(scope, receive, send)
+
+        received, over, started = 0, False, False
+
+        async def limited_receive():
+            nonlocal received, over
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    over = True
+                    return {"type": "http.disconnect"}  # the app stops reading
+            return message
+
+        async def guarded_send(message):
+            nonlocal started
+            if over and not started:
+                return  # the 413 below replaces whatever the app answers
+            started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:
+            if not over:
+                raise
+        if over and not started:
+            await self._too_large(limit)(scope, receive, send)
+
+
+app.add_middleware(BodyLimit)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
@@ -37,104 +228,357 @@ def _ext_ok(filename: str) -> bool:
     return ext.lower() in ALLOWED_EXTS
 
 
-def _pct(n: float) -> float:
-    """Clamp to [0, 100] and round to 1 decimal."""
-    try:
-        return round(max(0.0, min(100.0, float(n))), 1)
-    except Exception:
-        return 0.0
+async def _read_upload(file: UploadFile) -> Source:
+    """
+    Validate type/size of one upload. Returns the upload's spooled file
+    (in memory up to UPLOAD_SPOOL_BYTES, 256 KB by default, on disk above)
+    for the extractors to read in place, or its bytes when the work runs
+    in another process.
+    """
+    if not _ext_ok(file.filename):
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported file type. Allowed: {', '.join(sorted(ALLOWED_EXTS))}",
+        )
+
+    size = file.size if file.size is not None else source_size(file.file)
+    if not size:
+        raise HTTPException(status_code=400, detail="Uploaded file is empty.")
+    if size > MAX_FILE_BYTES:
+        raise HTTPException(status_code=413, detail=f"File too large (max {MAX_FILE_BYTES // (1024 * 1024)} MB).")
+    if pool.kind == "process":
+        await file.seek(0)
+        return await file.read()
+    file.file.seek(0)
+    return file.file
+
+
+def _busy() -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail="Analyzer is busy, please retry shortly.",
+        headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+    )
 
 
 @app.get("/health")
 def health():
-    return {"ok": True, "service": "talentalign-analyzer", "version": app.version}
+    ready = models.is_ready() or not WARMUP_MODELS
+    body = {
+        "ok": ready,
+        "ready": ready,
+        "service": "talentalign-analyzer",
+        "version": app.version,
+        "models_loaded": models.loaded(),
+        "embedding_cache": get_cache().stats(),
+        "embedding_batcher": get_batcher().stats() if get_batcher() else None,
+        "pool": pool.stats(),
+        "result_cache": results.stats(),
+    }
+    return body if ready else JSONResponse(status_code=503, content=body)
+
+
+async def _job_profile(job_id: str) -> dict:
+    profile = await run_in_threadpool(jobs.get, job_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job_id: {job_id}")
+    return profile
 
 
 @app.post("/analyze")
 async def analyze(
+    response: Response,
     file: UploadFile = File(...),
     job_description: str = Form(""),
+    job_id: Optional[str] = Form(None),
 ):
     try:
-        # ---- Basic validations
-        if not _ext_ok(file.filename):
-            raise HTTPException(
-                status_code=400,
-                detail=f"Unsupported file type. Allowed: {', '.join(sorted(ALLOWED_EXTS))}",
-            )
-
-        data = await file.read()
-        if not data:
-            raise HTTPException(status_code=400, detail="Uploaded file is empty.")
-        if len(data) > MAX_FILE_BYTES:
-            raise HTTPException(status_code=413, detail="File too large (max 8 MB).")
-
-        # ---- Extract raw text
-        resume_raw = extract_text_bytes(file.filename, data)
-        jd_raw = job_description or ""
-
-        # ---- Debug logs
-        print(f"\n[DEBUG] File: {file.filename}, size={len(data)} bytes")
-        print(f"[DEBUG] Resume length: {len(resume_raw)} chars")
-        print(f"[DEBUG] Job description length: {len(jd_raw)} chars")
-
-        # ---- Normalize for analysis
-        resume_norm = normalize(resume_raw)
-        jd_norm = normalize(jd_raw)
-
-        # ---- Sections
-        sections = guess_sections(resume_norm) or {}
-
-        # ---- Skills (exact + fuzzy only on resume side)
-        jd_skills_exact = set(find_skills(jd_norm) or [])
-        res_skills_exact = set(find_skills(resume_norm) or [])
-        res_fuzzy = set(fuzzy_fill(resume_norm, threshold=95) or [])
-        jd_skills = jd_skills_exact
-        res_skills = res_skills_exact.union(res_fuzzy)
-
-        print(f"[DEBUG] JD skills (final): {list(jd_skills)}")
-        print(f"[DEBUG] Resume skills (final): {list(res_skills)}")
-
-        # ---- Scores
-        sem = semantic_score(resume_norm, jd_norm) if jd_norm else 0.0
-        overlap, matched, missing = (
-            skill_scores(jd_skills, res_skills) if jd_norm else (0.0, [], list(jd_skills))
+        data = await _read_upload(file)
+
+        # a stored posting replaces the raw JD; only the resume side is processed
+        profile = await _job_profile(job_id) if job_id else None
+        if profile is not None:
+            job_description = profile["raw"]
+
+        key = await run_in_threadpool(result_key, data, job_description)
+        cached = await run_in_threadpool(results.get, key)  # SQLite with RESULT_CACHE=sqlite
+        if cached is not None:
+            cached["filename"] = file.filename
+            response.headers["X-Cache"] = "HIT"
+            return cached
+
+        result = await pool.run(
+            analyze_document, file.filename, data, job_description or "", profile
         )
-        ats = blended_score(sem, overlap, w_sem=0.55)
+        await run_in_threadpool(results.put, key, result)
+        response.headers["X-Cache"] = "MISS"
+        return result
+
+    except PoolFull:
+        raise _busy()
+    except ExtractionTimeout as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception as e:
+        log.exception("Unexpected error in /analyze")
+        raise HTTPException(status_code=500, detail=f"Unexpected server error: {e}")
+
 
-        # ---- Suggestions
-        suggestions = quality_hints(resume_norm, sections, list(missing))
+@app.post("/analyze/batch")
+async def analyze_many(
+    files: List[UploadFile] = File(...),
+    job_description: str = Form(""),
+    job_id: Optional[str] = Form(None),
+):
+    """
+    Score many resumes against one job description (or stored job_id).
+    Results use the /analyze schema and are ranked by ATS score.
+    """
+    if len(files) > MAX_BATCH_FILES:
+        raise HTTPException(status_code=400, detail=f"Too many files (max {MAX_BATCH_FILES}).")
+
+    try:
+        profile = await _job_profile(job_id) if job_id else None
 
+        uploads, errors = [], []
+        for f in files:
+            try:
+                uploads.append((f.filename, await _read_upload(f)))
+            except HTTPException as e:
+                errors.append({"filename": f.filename, "error": e.detail})
+
+        ranked, failed = await pool.run(analyze_batch, uploads, job_description or "", profile)
         return {
-            "filename": file.filename,
-            "ats_score": _pct(ats),
-            "semantic_score": _pct(sem),
-            "skill_overlap": _pct(overlap),
-            "matched_skills": sorted(list(set(matched))),
-            "missing_skills": sorted(list(set(missing))),
-            "sections_present": sorted(list(sections.keys())),
-            "suggestions": suggestions,
-            "has_job_description": bool(jd_raw.strip()),
-            "debug": {
-                "jd_skills": list(jd_skills),
-                "resume_skills": list(res_skills),
-            },
+            "count": len(ranked),
+            "results": ranked,
+            "errors": errors + failed,
         }
 
+    except PoolFull:
+        raise _busy()
+    except HTTPException:
+        raise
+    except Exception as e:
+        log.exception("Unexpected error in /analyze/batch")
+        raise HTTPException(status_code=500, detail=f"Unexpected server error: {e}")
+
+
+class JobIn(BaseModel):
+    job_description: str
+    id: Optional[str] = None
+
+
+async def _save_job(job_description: str, job_id: Optional[str]) -> dict:
+    if not (job_description or "").strip():
+        raise HTTPException(status_code=400, detail="job_description is empty.")
+    try:
+        return describe(await pool.run_local(jobs.put, job_description, job_id))
+    except PoolFull:
+        raise _busy()
+    except Exception as e:
+        log.exception("Failed to store job")
+        raise HTTPException(status_code=500, detail=f"Unexpected server error: {e}")
+
+
+@app.get("/jobs")
+def list_jobs():
+    return {"ids": jobs.ids()}
+
+
+@app.post("/jobs", status_code=201)
+async def create_job(job: JobIn):
+    """Register a posting; its normalized text, skills and embedding are precomputed."""
+    if job.id and await run_in_threadpool(jobs.get, job.id) is not None:
+        raise HTTPException(status_code=409, detail=f"Job {job.id} already exists.")
+    return await _save_job(job.job_description, job.id)
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    return describe(await _job_profile(job_id))
+
+
+@app.put("/jobs/{job_id}")
+async def update_job(job_id: str, job: JobIn):
+    return await _save_job(job.job_description, job_id)
+
+
+@app.delete("/jobs/{job_id}", status_code=204)
+def delete_job(job_id: str):
+    if not jobs.delete(job_id):
+        raise HTTPException(status_code=404, detail=f"Unknown job_id: {job_id}")
+    return Response(status_code=204)
+
+
+@app.post("/candidates", status_code=201)
+async def add_candidate(
+    file: UploadFile = File(...),
+    candidate_id: Optional[str] = Form(None),
+):
+    """Store a resume's skills and embedding so /candidates/search can find it."""
+    try:
+        data = await _read_upload(file)
+        profile = await pool.run(profile_resume, file.filename, data)
+        if profile["embedding"] is None:
+            raise HTTPException(status_code=422, detail="No text could be extracted from the file.")
+        candidate_id = candidate_id or uuid.uuid4().hex
+        await run_in_threadpool(candidates.add, candidate_id, profile)
+        return {"id": candidate_id, "filename": file.filename, "skills": profile["skills"]}
+
+    except PoolFull:
+        raise _busy()
+    except StoreMismatch as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ExtractionTimeout as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception as e:
+        log.exception("Unexpected error in /candidates")
+        raise HTTPException(status_code=500, detail=f"Unexpected server error: {e}")
+
+
+class CandidateQuery(BaseModel):
+    job_description: str = ""
+    job_id: Optional[str] = None
+    top_k: int = 10
+    min_overlap: int = 1
+
+
+@app.post("/candidates/search")
+async def search_candidates(query: CandidateQuery):
+    """Rank stored candidates against a JD (text or stored job_id), best first."""
+    if not 1 <= query.top_k <= 1000:
+        raise HTTPException(status_code=400, detail="top_k must be between 1 and 1000.")
+    try:
+        if query.job_id:
+            profile = await _job_profile(query.job_id)
+        elif query.job_description.strip():
+            profile = await pool.run(build_profile, query.job_description)
+        else:
+            raise HTTPException(status_code=400, detail="Provide job_description or job_id.")
+
+        ranked = await pool.run_local(
+            candidates.search, profile, query.top_k, query.min_overlap
+        )
+        return {"count": len(ranked), "total": len(candidates), "results": ranked}
+
+    except PoolFull:
+        raise _busy()
+    except StoreMismatch as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception as e:
+        log.exception("Unexpected error in /candidates/search")
+        raise HTTPException(status_code=500, detail=f"Unexpected server error: {e}")
+
+
+@app.delete("/candidates/{candidate_id}", status_code=204)
+def delete_candidate(candidate_id: str):
+    if not candidates.delete(candidate_id):
+        raise HTTPException(status_code=404, detail=f"Unknown candidate_id: {candidate_id}")
+    return Response(status_code=204)
+
+
+@app.post("/sessions", status_code=201)
+async def create_session(
+    file: Optional[UploadFile] = File(None),
+    resume_text: str = Form(""),
+    job_description: str = Form(""),
+    job_id: Optional[str] = Form(None),
+):
+    """
+    Start an editing session from an uploaded resume (or plain text).
+    Returns the first analysis plus session_id and the extracted text;
+    PUT /sessions/{id} with edited text re-analyzes only what changed.
+    """
+    try:
+        profile = await _job_profile(job_id) if job_id else None
+        if file is not None:
+            data = await _read_upload(file)
+            resume_text = await pool.run(extract_text_bytes, file.filename, data)
+        elif not resume_text.strip():
+            raise HTTPException(status_code=400, detail="Provide a file or resume_text.")
+        if profile is None:
+            profile = await pool.run(build_profile, job_description or "")
+
+        session_id, session = sessions.create(profile, file.filename if file is not None else None)
+        result = await pool.run_local(session.update, resume_text)
+        return dict(result, session_id=session_id, resume_text=resume_text)
+
+    except PoolFull:
+        raise _busy()
+    except ExtractionTimeout as e:
+        raise HTTPException(status_code=422, detail=str(e))
     except HTTPException:
         raise
     except Exception as e:
-        traceback.print_exc()
+        log.exception("Unexpected error in /sessions")
+        raise HTTPException(status_code=500, detail=f"Unexpected server error: {e}")
+
+
+class SessionEdit(BaseModel):
+    resume_text: str
+
+
+@app.put("/sessions/{session_id}")
+async def update_session(session_id: str, edit: SessionEdit):
+    session = sessions.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail=f"Unknown or expired session: {session_id}")
+    try:
+        result = await pool.run_local(session.update, edit.resume_text)
+        return dict(result, session_id=session_id)
+    except PoolFull:
+        raise _busy()
+    except Exception as e:
+        log.exception("Unexpected error in /sessions/{id}")
         raise HTTPException(status_code=500, detail=f"Unexpected server error: {e}")
 
 
+@app.delete("/sessions/{session_id}", status_code=204)
+def delete_session(session_id: str):
+    if not sessions.delete(session_id):
+        raise HTTPException(status_code=404, detail=f"Unknown or expired session: {session_id}")
+    return Response(status_code=204)
+
+
+@app.get("/metrics")
+def metrics_endpoint():
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+
 @app.get("/")
 def root():
     return {"message": "TalentAlign Analyzer is running. See /health or POST /analyze."}
 
 
+def _preload(spacy_model: bool = False):
+    """What --preload loads in the parent before forking the workers."""
+    get_taxonomy()
+    models.warm_up(spacy_model=spacy_model)
+
+
 # ✅ Entrypoint for Render & local
 if __name__ == "__main__":
-    import uvicorn
-    port = int(os.environ.get("PORT", 8000))  # Render sets PORT automatically
-    uvicorn.run("main:app", host="0.0.0.0", port=port)
\ No newline at end of file
+    import argparse
+
+    parser = argparse.ArgumentParser(description="TalentAlign Analyzer API server")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", 8000)))  # Render sets PORT automatically
+    parser.add_argument("--workers", type=int, default=int(os.environ.get("WEB_CONCURRENCY", 1)))
+    parser.add_argument("--preload", action="store_true",
+                        help="load models once and fork workers that share them (see README)")
+    parser.add_argument("--preload-spacy", action="store_true", help="also preload the spaCy pipeline")
+    parser.add_argument("--threads", type=int, default=0, help="torch threads per preforked worker")
+    args = parser.parse_args()
+
+    if args.preload:
+        from analyzer.prefork import serve
+        serve(app, args.host, args.port, args.workers,
+              preload=lambda: _preload(args.preload_spacy), threads=args.threads)
+    else:
+        import uvicorn
+        uvicorn.run("main:app", host=args.host, port=args.port, workers=args.workers)
\ No newline at end of file
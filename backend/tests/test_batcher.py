@@ -0,0 +1,39 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from analyzer.batcher import EmbeddingBatcher
+
+
+def fake_encode(texts):
+    if "boom" in texts:
+        raise RuntimeError("model failed")
+    if "short" in texts:
+        return np.zeros((len(texts) - 1, 2), dtype=np.float32)
+    return np.array([[len(t), ord(t[0])] for t in texts], dtype=np.float32)
+
+
+def test_concurrent_calls_get_their_own_rows():
+    batcher = EmbeddingBatcher(fake_encode, window_ms=20, max_batch=8)
+    requests = [["alpha", "beta"], ["beta"], ["gamma", "alpha", "delta"]]
+    with ThreadPoolExecutor(len(requests)) as ex:
+        results = list(ex.map(batcher.encode, requests))
+    for texts, vecs in zip(requests, results):
+        np.testing.assert_array_equal(vecs, fake_encode(texts))
+
+
+def test_repeated_texts_are_encoded_once():
+    batcher = EmbeddingBatcher(fake_encode, window_ms=0)
+    vecs = batcher.encode(["alpha", "beta", "alpha"])
+    np.testing.assert_array_equal(vecs, fake_encode(["alpha", "beta", "alpha"]))
+    assert batcher.stats()["texts"] == 2
+
+
+@pytest.mark.parametrize("bad, error", [("boom", RuntimeError), ("short", ValueError)])
+def test_thread_survives_a_failed_batch(bad, error):
+    batcher = EmbeddingBatcher(fake_encode, window_ms=0)
+    with pytest.raises(error):
+        batcher.encode([bad, "text"])
+    np.testing.assert_array_equal(batcher.encode(["text"]), fake_encode(["text"]))
+    assert batcher._thread.is_alive()
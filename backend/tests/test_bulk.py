@@ -0,0 +1,46 @@
+import json
+
+import pytest
+
+from analyzer.bulk import load_checkpoint
+
+
+@pytest.fixture
+def run_dir(tmp_path):
+    """Output with two checkpointed files and part of a third."""
+    out, ckpt = tmp_path / "out.jsonl", tmp_path / "out.jsonl.ckpt"
+    lines, entries = [], []
+    for path in ("a.pdf", "b.pdf"):
+        lines.append(json.dumps({"path": path, "ats_score": 50.0}) + "\n")
+        entries.append(json.dumps({"path": path, "offset": len("".join(lines))}) + "\n")
+    out.write_text("".join(lines) + json.dumps({"path": "c.pdf"}) + "\n")
+    ckpt.write_text("".join(entries))
+    return out, ckpt, len("".join(lines))
+
+
+def test_resumes_after_the_last_checkpointed_file(run_dir):
+    out, ckpt, offset = run_dir
+    assert load_checkpoint(str(out), str(ckpt)) == {"a.pdf", "b.pdf"}
+    assert out.stat().st_size == offset
+
+
+@pytest.mark.parametrize("torn", ['{"path": "c.pdf", "offs', '{"path": "c.pdf", "offset": 9}'])
+def test_torn_last_checkpoint_line_is_dropped(run_dir, torn):
+    out, ckpt, offset = run_dir
+    whole = ckpt.read_text()
+    with open(ckpt, "a") as f:
+        f.write(torn)  # no newline: the write was cut short
+    assert load_checkpoint(str(out), str(ckpt)) == {"a.pdf", "b.pdf"}
+    assert ckpt.read_text() == whole
+    assert out.stat().st_size == offset
+
+
+def test_missing_output_is_refused(run_dir):
+    out, ckpt, _ = run_dir
+    out.write_text("")
+    with pytest.raises(SystemExit):
+        load_checkpoint(str(out), str(ckpt))
+
+
+def test_fresh_run(tmp_path):
+    assert load_checkpoint(str(tmp_path / "out.jsonl"), str(tmp_path / "out.ckpt")) == set()
@@ -0,0 +1,58 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from analyzer import candidates
+from analyzer.candidates import CandidateStore, StoreMismatch
+
+JD = {"skills": {"python", "docker"}, "embedding": np.array([1, 0, 0, 0], dtype=np.float32)}
+
+
+def record(cid, skills, vec):
+    return {"id": cid, "filename": f"{cid}.pdf", "skills": skills,
+            "embedding": np.asarray(vec, dtype=np.float32)}
+
+
+@pytest.fixture
+def root(tmp_path):
+    root = str(tmp_path / "candidates")
+    CandidateStore(root).add_many([
+        record("ada", ["python", "docker"], [1, 0, 0, 0]),
+        record("bob", ["python"], [0.6, 0.8, 0, 0]),
+        record("cy", ["java"], [1, 0, 0, 0]),
+    ])
+    return root
+
+
+def test_round_trip_through_a_second_store(root):
+    store = CandidateStore(root)  # e.g. another worker
+    ranked = store.search(JD)
+    assert [r["id"] for r in ranked] == ["ada", "bob"]  # cy shares no skill
+    assert ranked[0]["matched_skills"] == ["docker", "python"]
+    assert ranked[0]["semantic_score"] == 100.0
+    assert ranked[1]["missing_skills"] == ["docker"]
+    assert len(store) == 3
+
+
+def test_replace_and_delete_are_seen_by_other_stores(root):
+    writer, reader = CandidateStore(root), CandidateStore(root)
+    assert [r["id"] for r in reader.search(JD)] == ["ada", "bob"]
+    writer.add("bob", {"filename": "bob2.pdf", "skills": ["python", "docker"], "embedding": [1, 0, 0, 0]})
+    writer.delete("ada")
+    ranked = reader.search(JD)
+    assert [(r["id"], r["filename"]) for r in ranked] == [("bob", "bob2.pdf")]
+    assert len(reader) == 2
+
+
+@pytest.mark.parametrize("attr, value", [
+    ("MODEL_ID", "another-model"),
+    ("get_taxonomy", lambda: SimpleNamespace(version="another-taxonomy")),
+])
+def test_other_model_or_taxonomy_is_refused(root, monkeypatch, attr, value):
+    monkeypatch.setattr(candidates, attr, value)
+    store = CandidateStore(root)
+    with pytest.raises(StoreMismatch):
+        store.search(JD)
+    with pytest.raises(StoreMismatch):
+        store.add_many([record("dee", ["python"], [1, 0, 0, 0])])
@@ -0,0 +1,48 @@
+import glob
+import os
+
+import numpy as np
+
+from analyzer.embed_cache import EmbeddingCache
+
+
+class Encoder:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return np.array([[len(t), 1.0] for t in texts], dtype=np.float32)
+
+
+def test_hits_misses_and_duplicates():
+    enc = Encoder()
+    cache = EmbeddingCache(enc, "m", max_items=8)
+    np.testing.assert_array_equal(cache.encode(["ab", "abc", "ab"]), enc(["ab", "abc", "ab"]))
+    cache.encode(["abc", "abcd"])
+    assert enc.calls[0] == ["ab", "abc"] and enc.calls[2] == ["abcd"]
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 3, 3)
+
+
+def test_disk_tier_survives_a_new_cache(tmp_path):
+    first = EmbeddingCache(Encoder(), "m", disk_dir=str(tmp_path))
+    vecs = first.encode(["ab", "abc"])
+    enc = Encoder()
+    second = EmbeddingCache(enc, "m", disk_dir=str(tmp_path))
+    np.testing.assert_array_equal(second.encode(["ab", "abc"]), vecs)
+    assert enc.calls == [] and second.stats()["disk_hits"] == 2
+
+
+def test_disk_tier_is_pruned_least_recently_used_first(tmp_path):
+    cache = EmbeddingCache(Encoder(), "m", max_items=0, disk_dir=str(tmp_path), disk_max_items=10)
+    texts = [f"text {i}" for i in range(10)]
+    for i, t in enumerate(texts):
+        cache.encode([t])
+        os.utime(cache._path(cache.key(t)), (i, i))
+    cache.encode([texts[0]])  # a disk hit makes it the most recent
+    cache.encode(["text 10"])  # the 11th file: over the cap
+    left = {os.path.basename(p) for p in glob.glob(str(tmp_path / "*" / "*.npy"))}
+    assert len(left) == 9
+    assert cache.key(texts[0]) + ".npy" in left
+    assert cache.key(texts[1]) + ".npy" not in left and cache.key(texts[2]) + ".npy" not in left
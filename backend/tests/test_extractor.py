@@ -0,0 +1,43 @@
+import io
+
+import pytest
+
+from analyzer import extractor
+from analyzer.extractor import ExtractionTimeout, iter_pdf_pages
+from bench.corpus import make_pdf, make_resume
+
+LINES = make_resume(3)
+PDF = make_pdf(LINES, lines_per_page=10)
+
+
+@pytest.fixture
+def in_workers(monkeypatch):
+    monkeypatch.setattr(extractor, "PDF_WORKER_MIN_BYTES", 0)
+    monkeypatch.setattr(extractor, "PDF_WORKERS", 2)
+    monkeypatch.setattr(extractor, "_page_pool", None)
+    yield
+    pool = extractor._page_pool
+    for worker in pool._idle if pool else ():
+        worker.kill()
+
+
+def test_workers_return_the_in_process_pages(in_workers, monkeypatch):
+    here = list(extractor._iter_pages_here(io.BytesIO(PDF), 0, None))
+    assert len(here) == -(-len(LINES) // 10)
+    assert list(iter_pdf_pages(PDF, max_pages=0)) == here
+
+    monkeypatch.setattr(extractor, "PDF_PARALLEL_MIN_PAGES", 2)  # two workers, two pages per task
+    assert list(iter_pdf_pages(io.BytesIO(PDF), max_pages=0)) == here
+    assert list(iter_pdf_pages(PDF, max_pages=2)) == here[:2]
+
+
+def test_timeout_kills_the_worker(in_workers):
+    with pytest.raises(ExtractionTimeout):
+        list(iter_pdf_pages(PDF, time_budget=1e-6))
+    assert extractor._page_pool._idle == []
+    assert len(list(iter_pdf_pages(PDF))) > 2  # the slot was released
+
+
+def test_unreadable_pdf(in_workers):
+    with pytest.raises(ValueError, match="Could not read PDF"):
+        list(iter_pdf_pages(b"not a pdf"))
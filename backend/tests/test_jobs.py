@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from analyzer import jobs
+from analyzer.jobs import JobStore
+
+JD = "Backend engineer: python, sql, kubernetes and docker"
+
+
+@pytest.fixture
+def embeds(monkeypatch):
+    calls = []
+
+    def fake_embed(texts):
+        calls.append(list(texts))
+        return np.full((len(texts), 4), len(calls), dtype=np.float32)
+
+    monkeypatch.setattr(jobs, "embed", fake_embed)
+    return calls
+
+
+def test_round_trip_through_a_second_store(tmp_path, embeds):
+    path = str(tmp_path / "nested" / "jobs.sqlite3")
+    saved = JobStore(path).put(JD, "backend-1")
+
+    loaded = JobStore(path).get("backend-1")  # e.g. another worker
+    assert loaded["raw"] == JD
+    assert loaded["norm"] == saved["norm"]
+    assert loaded["skills"] == saved["skills"] == {"python", "kubernetes", "docker"}
+    np.testing.assert_array_equal(loaded["embedding"], saved["embedding"])
+    assert len(embeds) == 1
+
+
+def test_put_keeps_created_and_delete_removes(tmp_path, embeds):
+    store = JobStore(str(tmp_path / "jobs.sqlite3"))
+    first = store.put(JD, "a")
+    second = store.put(JD + ", aws", "a")
+    assert second["created"] == first["created"]
+    assert "aws" in store.get("a")["skills"]
+    assert store.ids() == ["a"]
+    assert store.delete("a") and store.get("a") is None
+
+
+def test_profile_is_rebuilt_after_a_model_change(tmp_path, embeds, monkeypatch):
+    path = str(tmp_path / "jobs.sqlite3")
+    JobStore(path).put(JD, "a")
+    monkeypatch.setattr(jobs, "MODEL_VERSION", "another-model")
+    profile = JobStore(path).get("a")
+    assert len(embeds) == 2
+    assert profile["embedding"][0] == 2.0
@@ -0,0 +1,28 @@
+import pytest
+
+from analyzer.matcher import skill_scores, skill_scores_batch
+from analyzer.skillset import get_vocab
+
+RESUMES = [
+    {"python", "sql", "docker"},
+    set(),
+    {"kubernetes", "docker", "aws", "python", "sql"},
+    {"cobol", "fortran"},  # outside the taxonomy
+    {"python", "retired-skill-name"},
+]
+
+
+@pytest.mark.parametrize("jd", [
+    {"python", "sql", "kubernetes"},
+    {"python", "not-in-taxonomy"},
+    {"docker"},
+    set(),
+])
+def test_skill_scores_batch_matches_pairwise(jd):
+    assert skill_scores_batch(jd, RESUMES) == [skill_scores(jd, r) for r in RESUMES]
+
+
+def test_vocab_round_trip():
+    vocab = get_vocab()
+    skills = {"python", "docker", "some-new-skill"}
+    assert vocab.decode(vocab.encode(skills)) == sorted(skills)
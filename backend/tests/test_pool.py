@@ -0,0 +1,52 @@
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from analyzer.pool import BoundedPool, PoolFull
+
+
+@pytest.fixture
+def busy_pool():
+    """A pool with one worker and one queue slot, both taken until the test ends."""
+    pool = BoundedPool("thread", workers=1, queue_size=1)
+    gate = threading.Event()
+    futures = [pool.submit(gate.wait) for _ in range(2)]
+    yield pool
+    gate.set()
+    for f in futures:
+        f.result(timeout=5)
+    pool.shutdown()
+
+
+def test_rejects_past_workers_plus_queue(busy_pool):
+    with pytest.raises(PoolFull):
+        busy_pool.submit(print)
+    with pytest.raises(PoolFull):
+        busy_pool.submit_local(print)
+    stats = busy_pool.stats()
+    assert (stats["running"], stats["queued"], stats["rejected"]) == (1, 1, 2)
+
+
+def test_slots_are_released():
+    pool = BoundedPool("thread", workers=1, queue_size=0)
+    try:
+        for i in range(3):
+            assert pool.submit(pow, i, 2).result(timeout=5) == i * i
+        assert pool.stats()["rejected"] == 0
+    finally:
+        pool.shutdown()
+
+
+def test_analyze_answers_503_with_retry_after(monkeypatch, busy_pool):
+    monkeypatch.setattr(main, "pool", busy_pool)
+    monkeypatch.setattr(main, "results", main.ResultCache(None))
+    client = TestClient(main.app)
+    r = client.post(
+        "/analyze",
+        files={"file": ("resume.txt", b"Python developer")},
+        data={"job_description": "python"},
+    )
+    assert r.status_code == 503
+    assert r.headers["Retry-After"] == str(main.RETRY_AFTER_SECONDS)
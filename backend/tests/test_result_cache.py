@@ -0,0 +1,58 @@
+from types import SimpleNamespace
+
+import pytest
+
+from analyzer import result_cache
+from analyzer.result_cache import MemoryBackend, ResultCache, SQLiteBackend
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = SimpleNamespace(t=1000.0)
+    monkeypatch.setattr(result_cache, "time", SimpleNamespace(time=lambda: now.t))
+    return now
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_cache(request, tmp_path, clock):
+    def make(max_items=3, ttl=60):
+        if request.param == "memory":
+            return ResultCache(MemoryBackend(max_items=max_items, ttl=ttl))
+        return ResultCache(SQLiteBackend(str(tmp_path / "results.sqlite3"), max_items=max_items, ttl=ttl))
+    return make
+
+
+def test_round_trip_and_counters(make_cache):
+    cache = make_cache()
+    assert cache.get("a") is None
+    cache.put("a", {"score": 71.5, "skills": ["python"]})
+    assert cache.get("a") == {"score": 71.5, "skills": ["python"]}
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_entries_expire_after_ttl(make_cache, clock):
+    cache = make_cache(ttl=60)
+    cache.put("a", {"n": 1})
+    clock.t += 59
+    assert cache.get("a") == {"n": 1}
+    clock.t += 2
+    assert cache.get("a") is None
+
+
+def test_least_recently_used_entry_is_evicted(make_cache, clock):
+    cache = make_cache(max_items=3)
+    for key in "abc":
+        cache.put(key, {"key": key})
+        clock.t += 1
+    assert cache.get("a") == {"key": "a"}  # b is now the oldest
+    clock.t += 1
+    cache.put("d", {"key": "d"})
+    assert cache.get("b") is None
+    assert [cache.get(k) for k in "acd"] == [{"key": k} for k in "acd"]
+    assert cache.stats()["size"] == 3
+
+
+def test_off_never_stores():
+    cache = ResultCache(None)
+    cache.put("a", {"n": 1})
+    assert cache.get("a") is None
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from analyzer import sessions
+from analyzer.document import ParsedDocument
+from analyzer.extractor import guess_sections
+from analyzer.pipeline import build_result, prepare_jd, resume_skills
+from analyzer.sessions import Session
+
+BLOCK = "Experience built 3 apis for 2 teams using python and sql"
+
+
+def comparable(result: dict) -> dict:
+    """The result minus session stats, with the set-ordered debug lists sorted."""
+    out = {k: v for k, v in result.items() if k != "session"}
+    out["debug"] = {k: sorted(v) for k, v in result["debug"].items()}
+    return out
+
+
+def fresh(raw: str, jd: dict) -> dict:
+    doc = ParsedDocument.parse(raw)
+    resume = {"filename": None, "raw": raw, "norm": doc.norm, "doc": doc,
+              "sections": guess_sections(doc), "skills": resume_skills(doc)}
+    return build_result(resume, jd, 0.0)
+
+
+@pytest.fixture
+def jd(monkeypatch):
+    # no JD embedding, so the semantic score is 0 on both sides; skip the model
+    monkeypatch.setattr(sessions, "chunk_keys", list)
+    monkeypatch.setattr(sessions, "embed", lambda chunks: np.zeros((len(chunks), 4), dtype=np.float32))
+    profile = prepare_jd("Backend engineer: python, sql, kubernetes, docker")
+    profile["embedding"] = None
+    return profile
+
+
+@pytest.mark.parametrize("raw", [
+    f"{BLOCK}\n{BLOCK}",
+    f"Summary backend engineer\n{BLOCK}\nProjects shipped a tool\n{BLOCK}\n{BLOCK}",
+])
+def test_update_matches_fresh_analysis_with_repeated_segments(jd, raw):
+    session = Session(jd)
+    for text in (raw, raw + "\nSkills docker", raw):
+        assert comparable(session.update(text)) == comparable(fresh(text, jd))
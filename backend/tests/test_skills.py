@@ -0,0 +1,63 @@
+import re
+
+import pytest
+from rapidfuzz import fuzz
+
+from analyzer.skills import find_skills, fuzzy_fill, get_taxonomy, normalize_text
+from analyzer.taxonomy import FUZZY_MIN_ALIAS_LEN
+
+TEXTS = [
+    "Senior engineer: Python, Node.js, React-JS and PostgreSQL on AWS.",
+    "Built nodejs services; deployed with docker + kubernetes (k8s), CI in github actions.",
+    "Skills — C++, C#, Go, TypeScript, next js, express.js, scikit-learn",
+    "pythonic code, reactive ui, javascripting, mongo-db, node",
+    "",
+]
+
+TYPO_TEXTS = TEXTS + [
+    "Pyhton, javascrpt, kubernets, postgress, dockr and tensorflw",
+    "reactjss nodejs. expres.js typescipt",
+]
+
+
+def regex_find_skills(text: str) -> set[str]:
+    """The original matcher: one regex per alias, run over the whole text."""
+    text = normalize_text(text)
+    found = set()
+    for alias, canon in get_taxonomy().aliases.items():
+        if re.search(rf"(?<![a-z0-9]){re.escape(alias)}(?![a-z0-9])", text, re.IGNORECASE):
+            found.add(canon)
+    return found
+
+
+def all_pairs_fuzzy_fill(text: str, threshold: int, max_hits: int = 3) -> set[str]:
+    """The original fuzzy fallback: fuzz.ratio over every alias/token pair."""
+    tokens = set(re.findall(r"[a-z0-9\.\+#\-]{3,}", normalize_text(text)))
+    found = set()
+    for alias, canon in get_taxonomy().aliases.items():
+        if len(alias) < FUZZY_MIN_ALIAS_LEN:
+            continue
+        matches = 0
+        for w in tokens:
+            if fuzz.ratio(alias, w) >= threshold:
+                found.add(canon)
+                matches += 1
+                if matches >= max_hits:
+                    break
+    return found
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_find_skills_matches_regex_loop(text):
+    assert find_skills(text) == regex_find_skills(text)
+
+
+def test_find_skills_respects_word_boundaries():
+    assert "python" not in find_skills("pythonic code")
+    assert "python" in find_skills("python-based tooling")
+
+
+@pytest.mark.parametrize("threshold", [80, 92, 95])
+@pytest.mark.parametrize("text", TYPO_TEXTS)
+def test_fuzzy_fill_matches_all_pairs_loop(text, threshold):
+    assert fuzzy_fill(text, threshold=threshold) == all_pairs_fuzzy_fill(text, threshold)
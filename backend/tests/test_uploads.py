@@ -0,0 +1,34 @@
+from fastapi import FastAPI, UploadFile
+from fastapi.testclient import TestClient
+
+import main
+
+
+def spool_app() -> FastAPI:
+    app = FastAPI()
+    app.router.route_class = main.UploadRoute
+
+    @app.post("/upload")
+    async def upload(file: UploadFile):
+        return {"on_disk": file.file._rolled}
+
+    return app
+
+
+def test_uploads_spool_to_disk_past_the_app_limit():
+    client = TestClient(spool_app())
+    small, large = b"x" * main.UPLOAD_SPOOL_BYTES, b"x" * (main.UPLOAD_SPOOL_BYTES + 1)
+    assert client.post("/upload", files={"file": ("r.txt", small)}).json() == {"on_disk": False}
+    assert client.post("/upload", files={"file": ("r.txt", large)}).json() == {"on_disk": True}
+
+
+def test_oversized_bodies_are_refused_with_the_file_limit():
+    client = TestClient(main.app)
+    body = b"x" * (main.MAX_REQUEST_BYTES + 1)
+    r = client.post("/analyze", files={"file": ("r.txt", body)})
+    assert r.status_code == 413
+    assert r.json()["detail"] == "Request too large (files are limited to 8 MB)."
+
+    r = client.post("/analyze", files={"file": ("r.txt", b"x" * (main.MAX_FILE_BYTES + 1))})
+    assert r.status_code == 413
+    assert r.json()["detail"] == "File too large (max 8 MB)."